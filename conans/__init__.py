@@ -1,15 +1,20 @@
+import importlib as _importlib
+import sys as _sys
+import types as _types
+
 # Allow conans to import ConanFile from here
-# to allow refactors
-from conans.client.build.autotools_environment import AutoToolsBuildEnvironment
-from conans.client.build.cmake import CMake
-from conans.client.build.meson import Meson
-from conans.client.build.msbuild import MSBuild
-from conans.client.build.visual_environment import VisualStudioBuildEnvironment
-from conans.client.run_environment import RunEnvironment
-from conans.model.conan_file import ConanFile
-from conans.model.options import Options
-from conans.model.settings import Settings
-from conans.util.files import load
+# to allow refactors. They are imported the first time they are used, so the commands that
+# don't load recipes don't pay for importing the build helpers and the tools
+_PUBLIC_API = {"AutoToolsBuildEnvironment": "conans.client.build.autotools_environment",
+               "CMake": "conans.client.build.cmake",
+               "Meson": "conans.client.build.meson",
+               "MSBuild": "conans.client.build.msbuild",
+               "VisualStudioBuildEnvironment": "conans.client.build.visual_environment",
+               "RunEnvironment": "conans.client.run_environment",
+               "ConanFile": "conans.model.conan_file",
+               "Options": "conans.model.options",
+               "Settings": "conans.model.settings",
+               "load": "conans.util.files"}
 
 # complex_search: With ORs and not filtering by not restricted settings
 COMPLEX_SEARCH_CAPABILITY = "complex_search"
@@ -17,8 +22,41 @@ CHECKSUM_DEPLOY = "checksum_deploy"  # Only when v2
 REVISIONS = "revisions"  # Only when enabled in config, not by default look at server_launcher.py
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+PACKAGE_DELTA = "package_delta"  # Only when v2
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS, CHECKSUM_DEPLOY,
+                       PACKAGE_DELTA]  # Server is always with revisions
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.19.0-dev'
 
+
+__all__ = sorted(_PUBLIC_API) + ["CHECKSUM_DEPLOY", "COMPLEX_SEARCH_CAPABILITY",
+                                  "DEFAULT_REVISION_V1", "OAUTH_TOKEN", "ONLY_V2",
+                                  "PACKAGE_DELTA", "REVISIONS", "SERVER_CAPABILITIES", "tools"]
+
+
+class _ConansModule(_types.ModuleType):
+
+    def __getattr__(self, name):
+        module_name = _PUBLIC_API.get(name)
+        if module_name:
+            return getattr(_importlib.import_module(module_name), name)
+        # The submodules, as "conans.tools", are also imported the first time they are used
+        submodule_name = "%s.%s" % (self.__name__, name)
+        try:
+            return _importlib.import_module(submodule_name)
+        except ImportError as e:
+            if getattr(e, "name", None) != submodule_name:
+                raise
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__, name))
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(__all__))
+
+
+if _sys.version_info[0] < 3:  # The class of a module can't be changed in Python 2
+    for _name, _module_name in _PUBLIC_API.items():
+        globals()[_name] = getattr(_importlib.import_module(_module_name), _name)
+    _importlib.import_module("conans.tools")
+else:
+    _sys.modules[__name__].__class__ = _ConansModule
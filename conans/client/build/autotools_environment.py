@@ -9,12 +9,12 @@ from conans.client.build.compiler_flags import (architecture_flag, build_type_de
                                                 format_library_paths, libcxx_define, libcxx_flag,
                                                 pic_flag, rpath_flags, sysroot_flag)
 from conans.client.build.cppstd_flags import cppstd_flag, cppstd_from_settings
-from conans.client.tools.env import environment_append
 from conans.client.tools.oss import OSInfo, args_to_string, cpu_count, cross_building, \
     detected_architecture, detected_os, get_gnu_triplet
 from conans.client.tools.win import unix_path
 from conans.errors import ConanException
 from conans.model.build_info import DEFAULT_BIN, DEFAULT_INCLUDE, DEFAULT_LIB, DEFAULT_SHARE
+from conans.model.conan_file import conanfile_environment_append, conanfile_environ
 from conans.util.files import get_abs_path
 
 
@@ -181,8 +181,8 @@ class AutoToolsBuildEnvironment(object):
                 if self._valid_configure_flag("datarootdir", args, available_flags):
                     args.append("--datarootdir=${prefix}/%s" % DEFAULT_SHARE)
 
-        with environment_append(pkg_env):
-            with environment_append(vars or self.vars):
+        with conanfile_environment_append(self._conanfile, pkg_env):
+            with conanfile_environment_append(self._conanfile, vars or self.vars):
                 command = '%s/configure %s %s' % (configure_dir, args_to_string(args),
                                                   " ".join(triplet_args))
                 self._conanfile.output.info("Calling:\n > %s" % command)
@@ -217,7 +217,7 @@ class AutoToolsBuildEnvironment(object):
         if not self._conanfile.should_build:
             return
         make_program = os.getenv("CONAN_MAKE_PROGRAM") or make_program or "make"
-        with environment_append(vars or self.vars):
+        with conanfile_environment_append(self._conanfile, vars or self.vars):
             str_args = args_to_string(args)
             cpu_count_option = (("-j%s" % cpu_count(output=self._conanfile.output))
                                 if "-j" not in str_args else None)
@@ -325,20 +325,21 @@ class AutoToolsBuildEnvironment(object):
 
         ld_flags, cpp_flags, libs, cxx_flags, c_flags = self._get_vars()
 
-        if os.environ.get("CPPFLAGS", None):
-            cpp_flags.append(os.environ.get("CPPFLAGS", None))
+        environ = conanfile_environ(self._conanfile)
+        if environ.get("CPPFLAGS", None):
+            cpp_flags.append(environ.get("CPPFLAGS", None))
 
-        if os.environ.get("CXXFLAGS", None):
-            cxx_flags.append(os.environ.get("CXXFLAGS", None))
+        if environ.get("CXXFLAGS", None):
+            cxx_flags.append(environ.get("CXXFLAGS", None))
 
-        if os.environ.get("CFLAGS", None):
-            c_flags.append(os.environ.get("CFLAGS", None))
+        if environ.get("CFLAGS", None):
+            c_flags.append(environ.get("CFLAGS", None))
 
-        if os.environ.get("LDFLAGS", None):
-            ld_flags.append(os.environ.get("LDFLAGS", None))
+        if environ.get("LDFLAGS", None):
+            ld_flags.append(environ.get("LDFLAGS", None))
 
-        if os.environ.get("LIBS", None):
-            libs.append(os.environ.get("LIBS", None))
+        if environ.get("LIBS", None):
+            libs.append(environ.get("LIBS", None))
 
         ret = {"CPPFLAGS": cpp_flags,
                "CXXFLAGS": cxx_flags,
@@ -353,11 +354,12 @@ class AutoToolsBuildEnvironment(object):
     def vars(self):
         ld_flags, cpp_flags, libs, cxx_flags, c_flags = self._get_vars()
 
-        cpp_flags = " ".join(cpp_flags) + _environ_value_prefix("CPPFLAGS")
-        cxx_flags = " ".join(cxx_flags) + _environ_value_prefix("CXXFLAGS")
-        cflags = " ".join(c_flags) + _environ_value_prefix("CFLAGS")
-        ldflags = " ".join(ld_flags) + _environ_value_prefix("LDFLAGS")
-        libs = " ".join(libs) + _environ_value_prefix("LIBS")
+        environ = conanfile_environ(self._conanfile)
+        cpp_flags = " ".join(cpp_flags) + _environ_value_prefix(environ, "CPPFLAGS")
+        cxx_flags = " ".join(cxx_flags) + _environ_value_prefix(environ, "CXXFLAGS")
+        cflags = " ".join(c_flags) + _environ_value_prefix(environ, "CFLAGS")
+        ldflags = " ".join(ld_flags) + _environ_value_prefix(environ, "LDFLAGS")
+        libs = " ".join(libs) + _environ_value_prefix(environ, "LIBS")
 
         ret = {"CPPFLAGS": cpp_flags.strip(),
                "CXXFLAGS": cxx_flags.strip(),
@@ -369,8 +371,8 @@ class AutoToolsBuildEnvironment(object):
         return ret
 
 
-def _environ_value_prefix(var_name, prefix=" "):
-    if os.environ.get(var_name, ""):
-        return "%s%s" % (prefix, os.environ.get(var_name, ""))
+def _environ_value_prefix(environ, var_name, prefix=" "):
+    if environ.get(var_name, ""):
+        return "%s%s" % (prefix, environ.get(var_name, ""))
     else:
         return ""
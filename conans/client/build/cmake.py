@@ -15,7 +15,7 @@ from conans.client.build.cmake_flags import CMakeDefinitionsBuilder, \
 from conans.client.output import ConanOutput
 from conans.client.tools.oss import cpu_count, args_to_string
 from conans.errors import ConanException
-from conans.model.conan_file import ConanFile
+from conans.model.conan_file import ConanFile, conanfile_environ, conanfile_environment_append
 from conans.model.version import Version
 from conans.util.config_parser import get_bool_from_text
 from conans.util.files import mkdir, get_abs_path, walk, decode_text
@@ -210,10 +210,10 @@ class CMake(object):
             # If we are using pkg_config generator automate the pcs location, otherwise it could
             # read wrong files
             set_env = "pkg_config" in self._conanfile.generators \
-                      and "PKG_CONFIG_PATH" not in os.environ
+                      and "PKG_CONFIG_PATH" not in conanfile_environ(self._conanfile)
             pkg_env = {"PKG_CONFIG_PATH": self._conanfile.install_folder} if set_env else {}
 
-        with tools.environment_append(pkg_env):
+        with conanfile_environment_append(self._conanfile, pkg_env):
             command = "cd %s && %s %s" % (args_to_string([self.build_dir]), self._cmake_program,
                                           arg_list)
             if platform.system() == "Windows" and self.generator == "MinGW Makefiles":
@@ -280,7 +280,7 @@ class CMake(object):
         env = {'CTEST_OUTPUT_ON_FAILURE': '1' if output_on_failure else '0'}
         if self.parallel:
             env['CTEST_PARALLEL_LEVEL'] = str(cpu_count(self._conanfile.output))
-        with tools.environment_append(env):
+        with conanfile_environment_append(self._conanfile, env):
             self._build(args=args, build_dir=build_dir, target=target)
 
     @property
@@ -8,6 +8,7 @@ from conans.client.build.cppstd_flags import cppstd_from_settings
 from conans.client.tools.oss import args_to_string
 from conans.errors import ConanException
 from conans.model.build_info import DEFAULT_BIN, DEFAULT_INCLUDE, DEFAULT_LIB
+from conans.model.conan_file import conanfile_environment_append
 from conans.model.version import Version
 from conans.util.files import decode_text, get_abs_path, mkdir
 
@@ -153,7 +154,7 @@ class Meson(object):
             build_type
         ])
         command = 'meson "%s" "%s" %s' % (source_dir, self.build_dir, arg_list)
-        with tools.environment_append({"PKG_CONFIG_PATH": pc_paths}):
+        with conanfile_environment_append(self._conanfile, {"PKG_CONFIG_PATH": pc_paths}):
             self._run(command)
 
     @property
@@ -164,7 +165,7 @@ class Meson(object):
         with tools.vcvars(self._settings,
                           output=self._conanfile.output) if self._vcvars_needed else tools.no_op():
             env_build = AutoToolsBuildEnvironment(self._conanfile)
-            with tools.environment_append(env_build.vars):
+            with conanfile_environment_append(self._conanfile, env_build.vars):
                 self._conanfile.run(command)
 
     def build(self, args=None, build_dir=None, targets=None):
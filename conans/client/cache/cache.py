@@ -1,4 +1,5 @@
 import os
+import pickle
 import platform
 import shutil
 from collections import OrderedDict
@@ -7,7 +8,6 @@ from os.path import join
 from conans.client.cache.editable import EditablePackages
 from conans.client.cache.remote_registry import RemoteRegistry
 from conans.client.conf import ConanClientConfigParser, default_client_conf, default_settings_yml
-from conans.client.conf.detect import detect_defaults_settings
 from conans.client.output import Color
 from conans.client.profile_loader import read_profile
 from conans.errors import ConanException
@@ -20,10 +20,14 @@ from conans.paths.package_layouts.package_editable_layout import PackageEditable
 from conans.unicode import get_cwd
 from conans.util.files import list_folder_subdirs, load, normalize, save
 from conans.util.locks import Lock
+from conans.util.lru import LRUCache
+from conans.util.sha import sha1
+from conans.util.yaml_loader import safe_load
 
 
 CONAN_CONF = 'conan.conf'
 CONAN_SETTINGS = "settings.yml"
+SETTINGS_CACHE = ".settings.yml.cache"
 LOCALDB = ".conan.db"
 REMOTES = "remotes.json"
 PROFILES_FOLDER = "profiles"
@@ -188,6 +192,7 @@ class ClientCache(object):
                                  "default profile (%s)" % self.default_profile_path,
                                  Color.BRIGHT_YELLOW)
 
+            from conans.client.conf.detect import detect_defaults_settings
             default_settings = detect_defaults_settings(self._output,
                                                         profile_path=self.default_profile_path)
             self._output.writeln("Default settings", Color.BRIGHT_YELLOW)
@@ -218,12 +223,12 @@ class ClientCache(object):
 
         if not os.path.exists(self.settings_path):
             save(self.settings_path, normalize(default_settings_yml))
-            settings = Settings.loads(default_settings_yml)
+            content = default_settings_yml
         else:
             content = load(self.settings_path)
-            settings = Settings.loads(content)
 
-        return settings
+        definition = _settings_definition(content, join(self.cache_folder, SETTINGS_CACHE))
+        return Settings(definition)
 
     @property
     def hooks(self):
@@ -253,6 +258,34 @@ class ClientCache(object):
             shutil.rmtree(os.path.join(conan_folder, "locks"), ignore_errors=True)
 
 
+_settings_definitions = LRUCache(8)  # {sha1 of settings.yml: parsed yaml}
+
+
+def _settings_definition(content, cache_path):
+    """ The parsed settings.yml, that is cached in memory and in the "cache_path" file, to not
+    parse the yaml in every command
+    """
+    content_hash = sha1(content.encode("utf-8"))
+    definition = _settings_definitions.get(content_hash)
+    if definition is not None:
+        return definition
+    try:
+        with open(cache_path, "rb") as f:
+            cached_hash, definition = pickle.load(f)
+        if cached_hash != content_hash:
+            definition = None
+    except Exception:  # Missing, or written by another process right now
+        definition = None
+    if definition is None:
+        definition = safe_load(content) or {}
+        try:
+            save(cache_path, pickle.dumps((content_hash, definition), protocol=2))
+        except Exception:  # A read-only cache, it is just a cache
+            pass
+    _settings_definitions.put(content_hash, definition)
+    return definition
+
+
 def _mix_settings_with_env(settings):
     """Reads CONAN_ENV_XXXX variables from environment
     and if it's defined uses these value instead of the default
@@ -1,10 +1,9 @@
 import os
-import shutil
 
 from conans.client.source import complete_recipe_sources
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.util.files import rmdir
+from conans.util.files import copytree, rmdir
 
 
 def _prepare_sources(cache, ref, remote_manager, loader, remotes):
@@ -61,14 +60,14 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
                                                      % str(dest_ref)):
             return
         rmdir(export_dest)
-    shutil.copytree(export_origin, export_dest, symlinks=True)
+    copytree(export_origin, export_dest)
     user_io.out.info("Copied %s to %s" % (str(src_ref), str(dest_ref)))
 
     export_sources_origin = src_layout.export_sources()
     export_sources_dest = dst_layout.export_sources()
     if os.path.exists(export_sources_dest):
         rmdir(export_sources_dest)
-    shutil.copytree(export_sources_origin, export_sources_dest, symlinks=True)
+    copytree(export_sources_origin, export_sources_dest)
     user_io.out.info("Copied sources %s to %s" % (str(src_ref), str(dest_ref)))
 
     # Copy packages
@@ -85,7 +84,7 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
             rmdir(package_path_dest)
         package_revisions[package_id] = (src_metadata.packages[package_id].revision,
                                          src_metadata.recipe.revision)
-        shutil.copytree(package_path_origin, package_path_dest, symlinks=True)
+        copytree(package_path_origin, package_path_dest)
         user_io.out.info("Copied %s to %s" % (str(package_id), str(dest_ref)))
 
     # Generate the metadata
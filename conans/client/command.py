@@ -1,5 +1,6 @@
 import inspect
 import json
+import logging
 import os
 import sys
 
@@ -9,8 +10,6 @@ from argparse import ArgumentError
 from difflib import get_close_matches
 
 from conans import __version__ as client_version
-from conans.client.cmd.uploader import UPLOAD_POLICY_FORCE, \
-    UPLOAD_POLICY_NO_OVERWRITE, UPLOAD_POLICY_NO_OVERWRITE_RECIPE, UPLOAD_POLICY_SKIP
 from conans.client.conan_api import (Conan, default_manifest_folder, _make_abs_path)
 from conans.client.conan_command_output import CommandOutputer
 from conans.client.output import Color
@@ -24,6 +23,7 @@ from conans.util.config_parser import get_bool_from_text
 from conans.util.files import exception_message_safe
 from conans.util.files import save
 from conans.util.log import logger
+from conans.util.profiling import profile_trace
 
 # Exit codes for conan command:
 SUCCESS = 0                         # 0: Success (done)
@@ -309,6 +309,9 @@ class Command(object):
                             '(if name or version declared in conanfile.py, they should match)')
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='json file path where the install information will be written to')
+        parser.add_argument("--perf-trace", default=None, action=OnceArgument,
+                            help='Path to a json file where the time spent in every phase of the '
+                            'command will be written, in Chrome trace-event format')
         parser.add_argument('-k', '-ks', '--keep-source', default=False, action='store_true',
                             help=_KEEP_SOURCE_HELP)
         parser.add_argument('-kb', '--keep-build', default=False, action='store_true',
@@ -345,14 +348,15 @@ class Command(object):
 
         info = None
         try:
-            info = self._conan.create(args.path, name, version, user, channel,
-                                      args.profile, args.settings, args.options,
-                                      args.env, args.test_folder, args.not_export,
-                                      args.build, args.keep_source, args.keep_build, args.verify,
-                                      args.manifests, args.manifests_interactive,
-                                      args.remote, args.update,
-                                      test_build_folder=args.test_build_folder,
-                                      lockfile=args.lockfile)
+            with profile_trace(args.perf_trace):
+                info = self._conan.create(args.path, name, version, user, channel,
+                                          args.profile, args.settings, args.options,
+                                          args.env, args.test_folder, args.not_export,
+                                          args.build, args.keep_source, args.keep_build,
+                                          args.verify, args.manifests, args.manifests_interactive,
+                                          args.remote, args.update,
+                                          test_build_folder=args.test_build_folder,
+                                          lockfile=args.lockfile)
         except ConanException as exc:
             info = exc.info
             raise
@@ -444,6 +448,9 @@ class Command(object):
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='Path to a json file where the install information will be '
                             'written')
+        parser.add_argument("--perf-trace", default=None, action=OnceArgument,
+                            help='Path to a json file where the time spent in every phase of the '
+                            'command will be written, in Chrome trace-event format')
 
         _add_common_install_arguments(parser, build_help=_help_build_policies)
 
@@ -455,39 +462,43 @@ class Command(object):
 
         info = None
         try:
-            if not path_is_reference:
-                name, version, user, channel, _ = get_reference_fields(args.reference,
-                                                                       user_channel_input=True)
-                info = self._conan.install(path=args.path_or_reference,
-                                           name=name, version=version, user=user, channel=channel,
-                                           settings=args.settings, options=args.options,
-                                           env=args.env,
-                                           remote_name=args.remote,
-                                           verify=args.verify, manifests=args.manifests,
-                                           manifests_interactive=args.manifests_interactive,
-                                           build=args.build, profile_names=args.profile,
-                                           update=args.update, generators=args.generator,
-                                           no_imports=args.no_imports,
-                                           install_folder=args.install_folder,
-                                           lockfile=args.lockfile)
-            else:
-                if args.reference:
-                    raise ConanException("A full reference was provided as first argument, second "
-                                         "argument not allowed")
-
-                ref = ConanFileReference.loads(args.path_or_reference, validate=False)
-                manifest_interactive = args.manifests_interactive
-                info = self._conan.install_reference(ref, settings=args.settings,
-                                                     options=args.options,
-                                                     env=args.env,
-                                                     remote_name=args.remote,
-                                                     verify=args.verify, manifests=args.manifests,
-                                                     manifests_interactive=manifest_interactive,
-                                                     build=args.build, profile_names=args.profile,
-                                                     update=args.update,
-                                                     generators=args.generator,
-                                                     install_folder=args.install_folder,
-                                                     lockfile=args.lockfile)
+            with profile_trace(args.perf_trace):
+                if not path_is_reference:
+                    name, version, user, channel, _ = get_reference_fields(
+                        args.reference, user_channel_input=True)
+                    info = self._conan.install(path=args.path_or_reference,
+                                               name=name, version=version, user=user,
+                                               channel=channel,
+                                               settings=args.settings, options=args.options,
+                                               env=args.env,
+                                               remote_name=args.remote,
+                                               verify=args.verify, manifests=args.manifests,
+                                               manifests_interactive=args.manifests_interactive,
+                                               build=args.build, profile_names=args.profile,
+                                               update=args.update, generators=args.generator,
+                                               no_imports=args.no_imports,
+                                               install_folder=args.install_folder,
+                                               lockfile=args.lockfile)
+                else:
+                    if args.reference:
+                        raise ConanException("A full reference was provided as first argument, "
+                                             "second argument not allowed")
+
+                    ref = ConanFileReference.loads(args.path_or_reference, validate=False)
+                    manifest_interactive = args.manifests_interactive
+                    info = self._conan.install_reference(ref, settings=args.settings,
+                                                         options=args.options,
+                                                         env=args.env,
+                                                         remote_name=args.remote,
+                                                         verify=args.verify,
+                                                         manifests=args.manifests,
+                                                         manifests_interactive=manifest_interactive,
+                                                         build=args.build,
+                                                         profile_names=args.profile,
+                                                         update=args.update,
+                                                         generators=args.generator,
+                                                         install_folder=args.install_folder,
+                                                         lockfile=args.lockfile)
 
         except ConanException as exc:
             info = exc.info
@@ -1357,6 +1368,8 @@ class Command(object):
 
         self._warn_python_version()
 
+        from conans.client.cmd.uploader import UPLOAD_POLICY_FORCE, \
+            UPLOAD_POLICY_NO_OVERWRITE, UPLOAD_POLICY_NO_OVERWRITE_RECIPE, UPLOAD_POLICY_SKIP
         if args.force:
             policy = UPLOAD_POLICY_FORCE
         elif args.no_overwrite == "all":
@@ -2010,6 +2023,10 @@ def main(args):
         5: SIGTERM
         6: Invalid configuration (done)
     """
+    # Capture SSL warnings as pointed out here:
+    # https://urllib3.readthedocs.org/en/latest/security.html#insecureplatformwarning
+    # TODO: Fix this security warning
+    logging.captureWarnings(True)
     try:
         conan_api, _, _ = Conan.factory()
     except ConanMigrationError:  # Error migrating
@@ -2,75 +2,52 @@ import os
 import sys
 from collections import OrderedDict
 
-from conans.client.manager import deps_install
-from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
-
 import conans
 from conans import __version__ as client_version
-from conans.client import packager, tools
+from conans.client import tools
 from conans.client.cache.cache import ClientCache
-from conans.client.cmd.build import build
-from conans.client.cmd.create import create
-from conans.client.cmd.download import download
-from conans.client.cmd.export import cmd_export, export_alias
-from conans.client.cmd.export_pkg import export_pkg
-from conans.client.cmd.profile import (cmd_profile_create, cmd_profile_delete_key, cmd_profile_get,
-                                       cmd_profile_list, cmd_profile_update)
-from conans.client.cmd.search import Search
-from conans.client.cmd.test import install_build_and_test
-from conans.client.cmd.uploader import CmdUpload
-from conans.client.cmd.user import user_set, users_clean, users_list, token_present
 from conans.client.conf import ConanClientConfigParser
 from conans.client.graph.graph import RECIPE_EDITABLE
-from conans.client.graph.graph_manager import GraphManager
-from conans.client.graph.printer import print_graph
-from conans.client.graph.proxy import ConanProxy
-from conans.client.graph.python_requires import ConanPythonRequire
-from conans.client.graph.range_resolver import RangeResolver
-from conans.client.hook_manager import HookManager
-from conans.client.importer import run_imports, undo_imports
-from conans.client.installer import BinaryInstaller
-from conans.client.loader import ConanFileLoader
-from conans.client.migrations import ClientMigrator
 from conans.client.output import ConanOutput, colorama_initialize
 from conans.client.profile_loader import profile_from_args, read_profile
 from conans.client.recorder.action_recorder import ActionRecorder
 from conans.client.recorder.search_recorder import SearchRecorder
 from conans.client.recorder.upload_recoder import UploadRecorder
-from conans.client.remote_manager import RemoteManager
-from conans.client.remover import ConanRemover
-from conans.client.rest.auth_manager import ConanApiAuthManager
-from conans.client.rest.conan_requester import ConanRequester
-from conans.client.rest.rest_client import RestApiClient
-from conans.client.runner import ConanRunner
-from conans.client.source import config_source_local
-from conans.client.store.localdb import LocalDB
 from conans.client.userio import UserIO
 from conans.errors import (ConanException, RecipeNotFoundException,
                            PackageNotFoundException, NoRestV2Available, NotFoundException)
-from conans.model.conan_file import get_env_context_manager
+from conans.migrations import migration_needed
 from conans.model.editable_layout import get_editable_abs_path
 from conans.model.graph_info import GraphInfo, GRAPH_INFO_FILE
 from conans.model.graph_lock import GraphLockFile, LOCKFILE
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.model.version import Version
-from conans.model.workspace import Workspace
 from conans.paths import BUILD_INFO, CONANINFO, get_conan_user_home
-from conans.search.search import search_recipes
-from conans.tools import set_global_instances
+from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
 from conans.unicode import get_cwd
 from conans.util.files import exception_message_safe, mkdir, save_files
 from conans.util.log import configure_logger
-from conans.util.tracer import log_command, log_exception
+from conans.util.tracer import flush_traces, log_command, log_exception
 
 
 default_manifest_folder = '.conan_manifests'
 
 
+# The application of the last API call, that defines the output and requester of the
+# conans.tools functions
+_current_app = None
+
+
+def get_current_app():
+    return _current_app
+
+
 def api_method(f):
     def wrapper(*args, **kwargs):
+        global _current_app
         api = args[0]
         api.create_app()
+        _current_app = api.app
         try:
             curdir = get_cwd()
             log_command(f.__name__, kwargs)
@@ -85,6 +62,7 @@ def api_method(f):
             raise
         finally:
             os.chdir(curdir)
+            flush_traces()
     return wrapper
 
 
@@ -153,28 +131,53 @@ class ConanApp(object):
                                                   self.config.logging_file)
         conans.util.log.logger.debug("INIT: Using config '%s'" % self.cache.conan_conf_path)
 
+        self._http_requester = http_requester
+        self._runner = runner
+
+    # The hooks, the remotes and the loading of recipes and graphs are initialized the first time
+    # one of them is used, so the commands that only use the cache don't need to import them
+    _SUBSYSTEMS = ("hook_manager", "requester", "remote_manager", "runner", "proxy",
+                   "python_requires", "loader", "graph_manager")
+
+    def __getattr__(self, name):
+        if name not in ConanApp._SUBSYSTEMS:
+            raise AttributeError("'ConanApp' object has no attribute '%s'" % name)
+        self._init_subsystems()
+        return self.__dict__[name]
+
+    def _init_subsystems(self):
+        from conans.client.graph.graph_manager import GraphManager
+        from conans.client.graph.proxy import ConanProxy
+        from conans.client.graph.python_requires import ConanPythonRequire
+        from conans.client.graph.range_resolver import RangeResolver
+        from conans.client.hook_manager import HookManager
+        from conans.client.loader import ConanFileLoader
+        from conans.client.remote_manager import RemoteManager
+        from conans.client.rest.auth_manager import ConanApiAuthManager
+        from conans.client.rest.conan_requester import ConanRequester
+        from conans.client.rest.rest_client import RestApiClientFactory
+        from conans.client.runner import ConanRunner
+        from conans.client.store.localdb import LocalDB
+
         self.hook_manager = HookManager(self.cache.hooks_path, self.config.hooks, self.out)
         # Wraps an http_requester to inject proxies, certs, etc
-        self.requester = ConanRequester(self.config, http_requester)
+        self.requester = ConanRequester(self.config, self._http_requester)
         # To handle remote connections
         put_headers = self.cache.read_put_headers()
-        rest_api_client = RestApiClient(self.out, self.requester,
-                                        revisions_enabled=self.config.revisions_enabled,
-                                        put_headers=put_headers)
+        rest_client_factory = RestApiClientFactory(self.out, self.requester,
+                                                   revisions_enabled=self.config.revisions_enabled,
+                                                   put_headers=put_headers)
         # To store user and token
         localdb = LocalDB.create(self.cache.localdb)
         # Wraps RestApiClient to add authentication support (same interface)
-        auth_manager = ConanApiAuthManager(rest_api_client, self.user_io, localdb)
+        auth_manager = ConanApiAuthManager(rest_client_factory, self.user_io, localdb)
         # Handle remote connections
         self.remote_manager = RemoteManager(self.cache, auth_manager, self.out, self.hook_manager)
 
-        # Adjust global tool variables
-        set_global_instances(self.out, self.requester)
-
-        self.runner = runner or ConanRunner(self.config.print_commands_to_output,
-                                            self.config.generate_run_log_file,
-                                            self.config.log_run_to_output,
-                                            self.out)
+        self.runner = self._runner or ConanRunner(self.config.print_commands_to_output,
+                                                  self.config.generate_run_log_file,
+                                                  self.config.log_run_to_output,
+                                                  self.out)
 
         self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
         resolver = RangeResolver(self.cache, self.remote_manager)
@@ -209,9 +212,12 @@ class ConanAPIV1(object):
         self.http_requester = http_requester
         self.runner = runner
         self.app = None  # Api calls will create a new one every call
-        # Migration system
-        migrator = ClientMigrator(cache, Version(client_version), self.out)
-        migrator.migrate()
+        # Migration system, only imported when the cache was used by other Conan version
+        current_version = Version(client_version)
+        if migration_needed(cache.cache_folder, current_version):
+            from conans.client.migrations import ClientMigrator
+            migrator = ClientMigrator(cache, current_version, self.out)
+            migrator.migrate()
         # Remove in Conan 2.0
         sys.path.append(os.path.join(cache.cache_folder, "python"))
 
@@ -282,6 +288,7 @@ class ConanAPIV1(object):
     def test(self, path, reference, profile_names=None, settings=None, options=None, env=None,
              remote_name=None, update=False, build_modes=None, cwd=None, test_build_folder=None,
              lockfile=None):
+        from conans.client.cmd.test import install_build_and_test
 
         settings = settings or []
         options = options or []
@@ -315,6 +322,8 @@ class ConanAPIV1(object):
                                     string - test_folder path
                                     False  - disabling tests
         """
+        from conans.client.cmd.create import create
+        from conans.client.cmd.export import cmd_export
         settings = settings or []
         options = options or []
         env = env or []
@@ -366,6 +375,8 @@ class ConanAPIV1(object):
                    package_folder=None, install_folder=None, profile_names=None, settings=None,
                    options=None, env=None, force=False, user=None, version=None, cwd=None,
                    lockfile=None):
+        from conans.client.cmd.export import cmd_export
+        from conans.client.cmd.export_pkg import export_pkg
 
         remotes = self.app.load_remotes()
         settings = settings or []
@@ -418,6 +429,7 @@ class ConanAPIV1(object):
 
     @api_method
     def download(self, reference, remote_name=None, packages=None, recipe=False):
+        from conans.client.cmd.download import download
         if packages and recipe:
             raise ConanException("recipe parameter cannot be used together with packages")
         # Install packages without settings (fixed ids or all)
@@ -439,6 +451,9 @@ class ConanAPIV1(object):
     def workspace_install(self, path, settings=None, options=None, env=None,
                           remote_name=None, build=None, profile_name=None,
                           update=False, cwd=None, install_folder=None):
+        from conans.client.graph.printer import print_graph
+        from conans.client.installer import BinaryInstaller
+        from conans.model.workspace import Workspace
         cwd = cwd or get_cwd()
         abs_path = os.path.normpath(os.path.join(cwd, path))
 
@@ -480,6 +495,7 @@ class ConanAPIV1(object):
                           manifests_interactive=None, build=None, profile_names=None,
                           update=False, generators=None, install_folder=None, cwd=None,
                           lockfile=None):
+        from conans.client.manager import deps_install
 
         try:
             recorder = ActionRecorder()
@@ -518,6 +534,7 @@ class ConanAPIV1(object):
                 manifests_interactive=None, build=None, profile_names=None,
                 update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
                 lockfile=None):
+        from conans.client.manager import deps_install
 
         try:
             recorder = ActionRecorder()
@@ -650,6 +667,7 @@ class ConanAPIV1(object):
     def build(self, conanfile_path, source_folder=None, package_folder=None, build_folder=None,
               install_folder=None, should_configure=True, should_build=True, should_install=True,
               should_test=True, cwd=None):
+        from conans.client.cmd.build import build
         self.app.load_remotes()
         cwd = cwd or get_cwd()
         conanfile_path = _get_conanfile_path(conanfile_path, cwd, py=True)
@@ -667,6 +685,8 @@ class ConanAPIV1(object):
     @api_method
     def package(self, path, build_folder, package_folder, source_folder=None, install_folder=None,
                 cwd=None):
+        from conans.client import packager
+        from conans.model.conan_file import get_env_context_manager
         self.app.load_remotes()
 
         cwd = cwd or get_cwd()
@@ -689,6 +709,7 @@ class ConanAPIV1(object):
 
     @api_method
     def source(self, path, source_folder=None, info_folder=None, cwd=None):
+        from conans.client.source import config_source_local
         self.app.load_remotes()
 
         cwd = cwd or get_cwd()
@@ -713,6 +734,7 @@ class ConanAPIV1(object):
         :param cwd: Current working directory
         :return: None
         """
+        from conans.client.importer import run_imports
         cwd = cwd or get_cwd()
         info_folder = _make_abs_path(info_folder, cwd)
         dest = _make_abs_path(dest, cwd)
@@ -726,6 +748,7 @@ class ConanAPIV1(object):
 
     @api_method
     def imports_undo(self, manifest_path):
+        from conans.client.importer import undo_imports
         cwd = get_cwd()
         manifest_path = _make_abs_path(manifest_path, cwd)
         undo_imports(manifest_path, self.app.out)
@@ -733,6 +756,7 @@ class ConanAPIV1(object):
     @api_method
     def export(self, path, name, version, user, channel, keep_source=False, cwd=None,
                lockfile=None):
+        from conans.client.cmd.export import cmd_export
         conanfile_path = _get_conanfile_path(path, cwd, py=True)
         graph_lock = None
         if lockfile:
@@ -751,6 +775,7 @@ class ConanAPIV1(object):
     @api_method
     def remove(self, pattern, query=None, packages=None, builds=None, src=False, force=False,
                remote_name=None, outdated=False):
+        from conans.client.remover import ConanRemover
         remotes = self.app.cache.registry.load_remotes()
         remover = ConanRemover(self.app.cache, self.app.remote_manager, self.user_io, remotes)
         remover.remove(pattern, remote_name, src, builds, packages, force=force,
@@ -770,6 +795,7 @@ class ConanAPIV1(object):
 
     @api_method
     def authenticate(self, name, password, remote_name, skip_auth=False):
+        from conans.client.cmd.user import token_present
         # FIXME: 2.0 rename "name" to "user".
         # FIXME: 2.0 probably we should return also if we have been authenticated or not (skipped)
         # FIXME: 2.0 remove the skip_auth argument, that behavior will be done by:
@@ -790,16 +816,19 @@ class ConanAPIV1(object):
 
     @api_method
     def user_set(self, user, remote_name=None):
+        from conans.client.cmd.user import user_set
         remote = (self.get_default_remote() if not remote_name
                   else self.get_remote_by_name(remote_name))
         return user_set(self.app.cache.localdb, user, remote)
 
     @api_method
     def users_clean(self):
+        from conans.client.cmd.user import users_clean
         users_clean(self.app.cache.localdb)
 
     @api_method
     def users_list(self, remote_name=None):
+        from conans.client.cmd.user import users_list
         info = {"error": False, "remotes": []}
         remotes = [self.get_remote_by_name(remote_name)] if remote_name else self.remote_list()
         try:
@@ -813,9 +842,11 @@ class ConanAPIV1(object):
     @api_method
     def search_recipes(self, pattern, remote_name=None, case_sensitive=False,
                        fill_revisions=False):
+        from conans.client.cmd.search import Search
         search_recorder = SearchRecorder()
         remotes = self.app.cache.registry.load_remotes()
-        search = Search(self.app.cache, self.app.remote_manager, remotes)
+        remote_manager = self.app.remote_manager if remote_name else None
+        search = Search(self.app.cache, remote_manager, remotes)
 
         try:
             references = search.search_recipes(pattern, remote_name, case_sensitive)
@@ -836,9 +867,11 @@ class ConanAPIV1(object):
 
     @api_method
     def search_packages(self, reference, query=None, remote_name=None, outdated=False):
+        from conans.client.cmd.search import Search
         search_recorder = SearchRecorder()
         remotes = self.app.cache.registry.load_remotes()
-        search = Search(self.app.cache, self.app.remote_manager, remotes)
+        remote_manager = self.app.remote_manager if remote_name else None
+        search = Search(self.app.cache, remote_manager, remotes)
 
         try:
             ref = ConanFileReference.loads(reference)
@@ -865,6 +898,7 @@ class ConanAPIV1(object):
                retry=None, retry_wait=None, integrity_check=False, policy=None, query=None):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
+        from conans.client.cmd.uploader import CmdUpload
         upload_recorder = UploadRecorder()
         uploader = CmdUpload(self.app.cache, self.user_io, self.app.remote_manager,
                              self.app.loader, self.app.hook_manager)
@@ -980,6 +1014,7 @@ class ConanAPIV1(object):
 
     @api_method
     def remove_system_reqs_by_pattern(self, pattern):
+        from conans.search.search import search_recipes
         for ref in search_recipes(self.app.cache, pattern=pattern):
             self.remove_system_reqs(repr(ref))
 
@@ -989,23 +1024,28 @@ class ConanAPIV1(object):
 
     @api_method
     def profile_list(self):
+        from conans.client.cmd.profile import cmd_profile_list
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
 
     @api_method
     def create_profile(self, profile_name, detect=False, force=False):
+        from conans.client.cmd.profile import cmd_profile_create
         return cmd_profile_create(profile_name, self.app.cache.profiles_path,
                                   self.app.out, detect, force)
 
     @api_method
     def update_profile(self, profile_name, key, value):
+        from conans.client.cmd.profile import cmd_profile_update
         return cmd_profile_update(profile_name, key, value, self.app.cache.profiles_path)
 
     @api_method
     def get_profile_key(self, profile_name, key):
+        from conans.client.cmd.profile import cmd_profile_get
         return cmd_profile_get(profile_name, key, self.app.cache.profiles_path)
 
     @api_method
     def delete_profile_key(self, profile_name, key):
+        from conans.client.cmd.profile import cmd_profile_delete_key
         return cmd_profile_delete_key(profile_name, key, self.app.cache.profiles_path)
 
     @api_method
@@ -1036,6 +1076,7 @@ class ConanAPIV1(object):
 
     @api_method
     def export_alias(self, reference, target_reference):
+        from conans.client.cmd.export import export_alias
         ref = ConanFileReference.loads(reference)
         target_ref = ConanFileReference.loads(target_reference)
 
@@ -1190,6 +1231,7 @@ class ConanAPIV1(object):
 
     @api_method
     def build_order(self, lockfile, build=None, cwd=None):
+        from conans.client.graph.printer import print_graph
         cwd = cwd or os.getcwd()
         lockfile = _make_abs_path(lockfile, cwd)
 
@@ -1211,6 +1253,7 @@ class ConanAPIV1(object):
     @api_method
     def create_lock(self, reference, remote_name=None, settings=None, options=None, env=None,
                     profile_names=None, update=False, lockfile=None, build=None,):
+        from conans.client.graph.printer import print_graph
         reference, graph_info = self._info_args(reference, None, profile_names,
                                                 settings, options, env)
         recorder = ActionRecorder()
@@ -4,10 +4,8 @@ from collections import OrderedDict
 
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
 from conans.client.graph.graph import RECIPE_EDITABLE
-from conans.client.installer import build_id
 from conans.client.printer import Printer
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.search.binary_html_table import html_binary_graph
 from conans.unicode import get_cwd
 from conans.util.dates import iso8601_to_str
 from conans.util.env_reader import get_env
@@ -111,6 +109,7 @@ class CommandOutputer(object):
 
     def _grab_info_data(self, deps_graph, grab_paths):
         """ Convert 'deps_graph' into consumible information for json and cli """
+        from conans.client.installer import build_id
         compact_nodes = OrderedDict()
         for node in sorted(deps_graph.nodes):
             compact_nodes.setdefault((node.ref, node.package_id), []).append(node)
@@ -236,6 +235,7 @@ class CommandOutputer(object):
     def print_search_packages(self, search_info, reference, packages_query, table,
                               outdated=False):
         if table:
+            from conans.search.binary_html_table import html_binary_graph
             html_binary_graph(search_info, reference, table)
         else:
             printer = Printer(self._output)
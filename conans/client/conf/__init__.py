@@ -124,6 +124,10 @@ default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE
 # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
 # non_interactive = False             # environment CONAN_NON_INTERACTIVE
 # skip_broken_symlinks_check = False  # enviornment CONAN_SKIP_BROKEN_SYMLINKS_CHECK
+# skip_unchanged_install = False      # environment CONAN_SKIP_UNCHANGED_INSTALL
+# cache_package_info = False          # environment CONAN_CACHE_PACKAGE_INFO
+# cache_generators = False            # environment CONAN_CACHE_GENERATORS
+# copy_strategy = copy                # environment CONAN_COPY_STRATEGY (copy, reflink or hardlink, only for files never modified in place)
 
 # conan_make_program = make           # environment CONAN_MAKE_PROGRAM (overrides the make program used in AutoToolsBuildEnvironment.make)
 # conan_cmake_program = cmake         # environment CONAN_CMAKE_PROGRAM (overrides the make program used in CMake.cmake_program)
@@ -201,6 +205,7 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_SKIP_BROKEN_SYMLINKS_CHECK": self._env_c("general.skip_broken_symlinks_check", "CONAN_SKIP_BROKEN_SYMLINKS_CHECK", "False"),
                "CONAN_PYLINTRC": self._env_c("general.pylintrc", "CONAN_PYLINTRC", None),
                "CONAN_CACHE_NO_LOCKS": self._env_c("general.cache_no_locks", "CONAN_CACHE_NO_LOCKS", "False"),
+               "CONAN_COPY_STRATEGY": self._env_c("general.copy_strategy", "CONAN_COPY_STRATEGY", None),
                "CONAN_PYLINT_WERR": self._env_c("general.pylint_werr", "CONAN_PYLINT_WERR", None),
                "CONAN_SYSREQUIRES_SUDO": self._env_c("general.sysrequires_sudo", "CONAN_SYSREQUIRES_SUDO", "False"),
                "CONAN_SYSREQUIRES_MODE": self._env_c("general.sysrequires_mode", "CONAN_SYSREQUIRES_MODE", "enabled"),
@@ -390,6 +395,45 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def skip_unchanged_install(self):
+        try:
+            skip_unchanged_install = get_env("CONAN_SKIP_UNCHANGED_INSTALL")
+            if skip_unchanged_install is None:
+                try:
+                    skip_unchanged_install = self.get_item("general.skip_unchanged_install")
+                except ConanException:
+                    return False
+            return skip_unchanged_install.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def cache_package_info(self):
+        try:
+            cache_package_info = get_env("CONAN_CACHE_PACKAGE_INFO")
+            if cache_package_info is None:
+                try:
+                    cache_package_info = self.get_item("general.cache_package_info")
+                except ConanException:
+                    return False
+            return cache_package_info.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def cache_generators(self):
+        try:
+            cache_generators = get_env("CONAN_CACHE_GENERATORS")
+            if cache_generators is None:
+                try:
+                    cache_generators = self.get_item("general.cache_generators")
+                except ConanException:
+                    return False
+            return cache_generators.lower() in ("1", "true")
+        except ConanException:
+            return False
+
     @property
     def default_package_id_mode(self):
         try:
@@ -1,9 +1,20 @@
 import fnmatch
 import os
-import shutil
+import time
 from collections import defaultdict
 
-from conans.util.files import mkdir, walk
+import six
+
+from conans.util.files import copy_file, mkdir
+
+try:
+    from os import scandir
+except ImportError:  # Python 2
+    scandir = None
+
+# The timestamps of the folders have a resolution of up to 2 seconds, depending on the
+# filesystem, a folder modified more recently could be modified again without changing it
+_RACY_TIME = 2
 
 
 def report_copied_files(copied, output, message_suffix="Copied"):
@@ -26,13 +37,80 @@ def report_copied_files(copied, output, message_suffix="Copied"):
     return True
 
 
+def _list_folder(folder):
+    """ the subfolders and the files of a folder, in the same order than os.walk(), following
+    the symlinks to folders
+    """
+    subfolders, files = [], []
+    if scandir is not None:
+        for entry in scandir(folder):
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            (subfolders if is_dir else files).append(entry.name)
+    else:
+        for name in os.listdir(folder):
+            is_dir = os.path.isdir(os.path.join(folder, name))
+            (subfolders if is_dir else files).append(name)
+    return subfolders, files
+
+
+class FolderIndex(object):
+    """ listings of the folders walked by the FileCopiers, so the copies of other patterns do
+    not list them again. The folders modified since they were listed, e.g. because files were added
+    or removed between calls, are listed again
+    """
+    def __init__(self):
+        self._listings = {}  # {folder: (mtime, subfolders, files)}
+
+    def _list(self, folder):
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            return None
+        listing = self._listings.get(folder)
+        if listing is not None and listing[0] == mtime:
+            return listing[1], listing[2]
+        try:
+            subfolders, files = _list_folder(folder)
+        except OSError:
+            return None
+        if time.time() - mtime > _RACY_TIME:
+            self._listings[folder] = (mtime, subfolders, files)
+        return subfolders, files
+
+    def walk(self, top):
+        """ the same as os.walk(top, followlinks=True), top-down, the callers can modify the
+        yielded subfolders to prune them
+        """
+        if six.PY2:
+            # If py2 os.walk receives a unicode object, it will fail if a non-ascii file name
+            # is found during the iteration
+            try:
+                top = str(top)
+            except UnicodeDecodeError:
+                pass
+        return self._walk(top)
+
+    def _walk(self, top):
+        listing = self._list(top)
+        if listing is None:
+            return
+        subfolders, files = list(listing[0]), list(listing[1])
+        yield top, subfolders, files
+        for subfolder in subfolders:
+            for result in self._walk(os.path.join(top, subfolder)):
+                yield result
+
+
 class FileCopier(object):
     """ main responsible of copying files from place to place:
     package: build folder -> package folder
     imports: package folder -> user folder
     export: user folder -> store "export" folder
     """
-    def __init__(self, source_folders, root_destination_folder):
+    def __init__(self, source_folders, root_destination_folder, folder_index=None):
         """
         Takes the base folders to copy resources src -> dst. These folders names
         will not be used in the relative names while copying
@@ -40,11 +118,15 @@ class FileCopier(object):
                                   store build folder
         param root_destination_folder: The base folder to copy things to, typically the
                                        store package folder
+        param folder_index: FolderIndex to share the listings of the source folders with other
+                            FileCopiers
         """
         assert isinstance(source_folders, list), "source folders must be a list"
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        # The source folders are walked once for all the patterns
+        self._index = folder_index or FolderIndex()
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -89,14 +171,15 @@ class FileCopier(object):
         dst = os.path.join(self._dst_folder, dst)
 
         files_to_copy, link_folders = self._filter_files(src, pattern, symlinks, excludes,
-                                                         ignore_case, excluded_folders)
+                                                         ignore_case, excluded_folders,
+                                                         self._index)
         copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks)
         self.link_folders(src, dst, link_folders)
         self._copied.extend(files_to_copy)
         return copied_files
 
     @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders, index):
 
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
@@ -112,7 +195,7 @@ class FileCopier(object):
         else:
             excludes = []
 
-        for root, subfolders, files in walk(src, followlinks=True):
+        for root, subfolders, files in index.walk(src):
             if root in excluded_folders:
                 subfolders[:] = []
                 continue
@@ -138,9 +221,12 @@ class FileCopier(object):
                     subfolders[:] = []
                     files = []
                     break
-            for f in files:
-                relative_name = os.path.normpath(os.path.join(relative_path, f))
-                filenames.append(relative_name)
+            # relpath() is already normalized, the same as os.path.normpath(os.path.join())
+            if relative_path == ".":
+                filenames.extend(files)
+            else:
+                prefix = relative_path + os.sep
+                filenames.extend(prefix + f for f in files)
 
         if ignore_case:
             filenames = {f.lower(): f for f in filenames}
@@ -218,6 +304,6 @@ class FileCopier(object):
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                copy_file(abs_src_name, abs_dst_name)
             copied_files.append(abs_dst_name)
         return copied_files
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import traceback
 from os.path import join
 
@@ -5,9 +8,11 @@ from conans.client.generators.cmake_find_package import CMakeFindPackageGenerato
 from conans.client.generators.cmake_find_package_multi import CMakeFindPackageMultiGenerator
 from conans.client.generators.compiler_args import CompilerArgsGenerator
 from conans.client.generators.pkg_config import PkgConfigGenerator
+from conans import __version__ as client_version
 from conans.errors import ConanException
 from conans.util.env_reader import get_env
-from conans.util.files import normalize, save
+from conans.util.files import load, normalize, save
+from conans.util.profiling import profile_span
 from .b2 import B2Generator
 from .boostbuild import BoostBuildGenerator
 from .cmake import CMakeGenerator
@@ -83,15 +88,105 @@ registered_generators.add("make", MakeGenerator)
 registered_generators.add("deploy", DeployGenerator)
 
 
-def write_generators(conanfile, path, output):
+# The generators whose content only depends on the conanfile information hashed in
+# _generators_inputs(), not on the environment or the files of the output folder
+_CACHEABLE_GENERATORS = (TXTGenerator, GCCGenerator, CompilerArgsGenerator, CMakeGenerator,
+                         CMakeMultiGenerator, CMakePathsGenerator, CMakeFindPackageGenerator,
+                         CMakeFindPackageMultiGenerator, QmakeGenerator, QbsGenerator,
+                         SConsGenerator, VisualStudioGenerator, VisualStudioLegacyGenerator,
+                         XCodeGenerator, YouCompleteMeGenerator, BoostBuildGenerator,
+                         PkgConfigGenerator, JsonGenerator, B2Generator, PremakeGenerator,
+                         MakeGenerator)
+
+GENERATORS_CACHE = "conangenerators.json"
+
+
+def _generators_inputs(conanfile, path):
+    """ hash of the information that the cacheable generators use to render their content
+    """
+    def info_values(info):
+        values = sorted((k, v) for k, v in vars(info).items()
+                        if k not in ("configs", "_dependencies", "_dependencies_"))
+        configs = vars(info).get("configs") or {}
+        return values, sorted((config, info_values(i)) for config, i in configs.items())
+
+    deps_cpp_info = conanfile.deps_cpp_info
+    deps_env_info = conanfile.deps_env_info
+    env_info = conanfile.env_info  # None for consumers
+    inputs = [client_version, path, conanfile.name, conanfile.version,
+              conanfile.settings.values_list, conanfile.options.values.dumps(),
+              [repr(r.ref) for r in conanfile.requires.values()],
+              info_values(deps_cpp_info),
+              [(name, info_values(info)) for name, info in deps_cpp_info.dependencies],
+              info_values(deps_env_info),
+              [(name, info_values(info)) for name, info in deps_env_info.dependencies],
+              sorted((name, sorted(info.vars.items()))
+                     for name, info in conanfile.deps_user_info.items()),
+              sorted(env_info.vars.items()) if env_info is not None else None]
+    return hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()
+
+
+class _GeneratorsCache(object):
+    """ The files that every cacheable generator created in an output folder, for the hash of
+    its inputs. If they are the same and the files have not been modified, rendering the
+    generators again would produce the very same files
+    """
+
+    def __init__(self, conanfile, path):
+        self._path = os.path.join(path, GENERATORS_CACHE)
+        self._folder = path
+        self._inputs = _generators_inputs(conanfile, path)
+        try:
+            data = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            data = {}
+        self._generators = data.get("generators", {}) if data.get("inputs") == self._inputs else {}
+
+    def _mtime(self, filename):
+        try:
+            return os.path.getmtime(os.path.join(self._folder, filename))
+        except OSError:
+            return None
+
+    def get(self, generator_name):
+        """ the files created by the generator if they are up to date, else None
+        """
+        files = self._generators.get(generator_name)  # [[filename, mtime]], in creation order
+        if files is None or any(self._mtime(f) != mtime for f, mtime in files):
+            return None
+        return [f for f, _ in files]
+
+    def set(self, generator_name, files):
+        self._generators[generator_name] = [[f, self._mtime(f)] for f in files]
+
+    def save(self):
+        save(self._path, json.dumps({"inputs": self._inputs, "generators": self._generators},
+                                    indent=True))
+
+
+def write_generators(conanfile, path, output, use_cache=False):
     """ produces auxiliary files, required to build a project or a package.
+    Returns the names of the created files
+    use_cache: skip the generators whose inputs and files have not changed since they were
+    written by a previous call in the same folder
     """
+    cache = _GeneratorsCache(conanfile, path) if use_cache else None
+    created = []
     for generator_name in conanfile.generators:
         try:
             generator_class = registered_generators[generator_name]
         except KeyError:
             raise ConanException("Invalid generator '%s'. Available types: %s" %
                                  (generator_name, ", ".join(registered_generators.available)))
+        cacheable = cache is not None and generator_class in _CACHEABLE_GENERATORS
+        if cacheable:
+            cached_files = cache.get(generator_name)
+            if cached_files is not None:
+                for f in cached_files:
+                    output.info("Generator %s created %s" % (generator_name, f))
+                created.extend(cached_files)
+                continue
+
         try:
             generator = generator_class(conanfile)
         except TypeError:
@@ -99,24 +194,34 @@ def write_generators(conanfile, path, output):
             output.warn("Generator %s failed with new __init__(), trying old one")
             generator = generator_class(conanfile.deps_cpp_info, conanfile.cpp_info)
 
-        try:
-            generator.output_path = path
-            content = generator.content
-            if isinstance(content, dict):
-                if generator.filename:
-                    output.warn("Generator %s is multifile. Property 'filename' not used"
-                                % (generator_name,))
-                for k, v in content.items():
-                    v = normalize(v)
-                    output.info("Generator %s created %s" % (generator_name, k))
-                    save(join(path, k), v, only_if_modified=True)
-            else:
-                content = normalize(content)
-                output.info("Generator %s created %s" % (generator_name, generator.filename))
-                save(join(path, generator.filename), content, only_if_modified=True)
-        except Exception as e:
-            if get_env("CONAN_VERBOSE_TRACEBACK", False):
-                output.error(traceback.format_exc())
-            output.error("Generator %s(file:%s) failed\n%s"
-                         % (generator_name, generator.filename, str(e)))
-            raise ConanException(e)
+        with profile_span(generator_name, "generator"):
+            try:
+                generator.output_path = path
+                content = generator.content
+                if isinstance(content, dict):
+                    if generator.filename:
+                        output.warn("Generator %s is multifile. Property 'filename' not used"
+                                    % (generator_name,))
+                    generator_files = []
+                    for k, v in content.items():
+                        v = normalize(v)
+                        output.info("Generator %s created %s" % (generator_name, k))
+                        save(join(path, k), v, only_if_modified=True)
+                        generator_files.append(k)
+                else:
+                    content = normalize(content)
+                    output.info("Generator %s created %s" % (generator_name, generator.filename))
+                    save(join(path, generator.filename), content, only_if_modified=True)
+                    generator_files = [generator.filename]
+                created.extend(generator_files)
+                if cacheable:
+                    cache.set(generator_name, generator_files)
+            except Exception as e:
+                if get_env("CONAN_VERBOSE_TRACEBACK", False):
+                    output.error(traceback.format_exc())
+                output.error("Generator %s(file:%s) failed\n%s"
+                             % (generator_name, generator.filename, str(e)))
+                raise ConanException(e)
+    if cache is not None:
+        cache.save()
+    return created
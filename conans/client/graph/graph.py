@@ -1,4 +1,5 @@
 import uuid
+from collections import OrderedDict
 
 from conans.model.ref import PackageReference
 
@@ -44,7 +45,10 @@ class Node(object):
         # all the public deps only in the closure of this node
         # The dependencies that will be part of deps_cpp_info, can't conflict
         self.public_closure = None  # {ref.name: Node}
+        # The same nodes of the public_closure, as the bits of their index in the graph
+        self.public_closure_bits = 0
         self.inverse_closure = set()  # set of nodes that have this one in their public
+        self.index = None  # Position of the node in the graph, to represent sets of nodes as bits
         self.ancestors = None  # set{ref.name}
         self._id = None  # Unique ID (uuid at the moment) of a node in the graph
         self.graph_lock_node = None  # the locking information can be None
@@ -108,11 +112,43 @@ class Node(object):
             if not edge.private:
                 edge.dst.make_public()
 
+    def init_closure(self):
+        # The closure of a node starts with just itself
+        self.public_closure = OrderedDict([(self.name, self)])
+        self.public_closure_bits = 1 << self.index
+
     def connect_closure(self, other_node):
         # When 2 nodes of the graph become connected, their closures information has
         # has to remain consistent. This method manages this.
+        if self.public_closure_bits >> other_node.index & 1:
+            return  # Already connected, the closures are consistent
+        self._connect(other_node)
+
+    def connect_closures(self, closure, closure_bits):
+        # Same as connect_closure() for all the nodes of a closure, as closing diamonds connects
+        # whole closures to all the dependants of a node. Most of them are already connected,
+        # only the nodes of the closure_bits that are not in public_closure_bits are visited.
+        # closure: {node.index: (position in the closure, node)}, connected by position
+        missing = closure_bits & ~self.public_closure_bits
+        if not missing:
+            return
+        to_connect = []
+        while missing:
+            lowest = missing & -missing
+            missing ^= lowest
+            to_connect.append(closure[lowest.bit_length() - 1])
+        to_connect.sort(key=lambda item: item[0])
+        for _, other_node in to_connect:
+            self._connect(other_node)
+
+    def _connect(self, other_node):
+        # A node in the public_closure is also the one in the public_deps with its name
         name = other_node.name
+        previous = self.public_closure.get(name)
+        if previous is not None:  # Replaced by another node with the same name
+            self.public_closure_bits &= ~(1 << previous.index)
         self.public_closure[name] = other_node
+        self.public_closure_bits |= 1 << other_node.index
         self.public_deps[name] = other_node
         other_node.inverse_closure.add(self)
 
@@ -207,6 +243,7 @@ class DepsGraph(object):
     def add_node(self, node):
         if not self.nodes:
             self.root = node
+        node.index = len(self.nodes)
         self.nodes.add(node)
 
     def add_edge(self, src, dst, require):
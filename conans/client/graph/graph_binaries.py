@@ -6,10 +6,12 @@ from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLO
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL)
 from conans.errors import NoRemoteAvailable, NotFoundException, \
     conanfile_exception_formatter
+from conans.model.conan_file import ConanFile
 from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.util.files import is_dirty, rmdir
+from conans.util.profiling import profile_span, profiled
 
 
 class GraphBinariesAnalyzer(object):
@@ -18,6 +20,9 @@ class GraphBinariesAnalyzer(object):
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        # {(ref, settings, options, requires, package_id_mode): (package_id, ConanInfo)}, of recipes
+        # without package_id() method, as typically repeated in build_requires subgraphs
+        self._package_infos = {}
 
     def _check_update(self, upstream_manifest, package_folder, output, node):
         read_manifest = FileTreeManifest.load(package_folder)
@@ -190,8 +195,7 @@ class GraphBinariesAnalyzer(object):
 
         node.binary_remote = remote
 
-    @staticmethod
-    def _compute_package_id(node, default_package_id_mode):
+    def _compute_package_id(self, node, default_package_id_mode):
         conanfile = node.conanfile
         neighbors = node.neighbors()
         direct_reqs = []  # of PackageReference
@@ -212,8 +216,21 @@ class GraphBinariesAnalyzer(object):
         conanfile.options.clear_unused(indirect_reqs.union(direct_reqs))
         conanfile.options.freeze()
 
-        conanfile.info = ConanInfo.create(conanfile.settings.values,
-                                          conanfile.options.values,
+        settings_values = conanfile.settings.values
+        options_values = conanfile.options.values
+        # Without package_id() the result only depends on these inputs, it can be reused
+        memoize = type(conanfile).package_id == ConanFile.package_id
+        if memoize:
+            key = (node.ref, settings_values.dumps(), options_values.dumps(),
+                   frozenset(direct_reqs), frozenset(indirect_reqs), default_package_id_mode)
+            memoized = self._package_infos.get(key)
+            if memoized is not None:
+                node.package_id, info = memoized
+                conanfile.info = info.copy(full=True)
+                return
+
+        conanfile.info = ConanInfo.create(settings_values,
+                                          options_values,
                                           direct_reqs,
                                           indirect_reqs,
                                           default_package_id_mode=default_package_id_mode)
@@ -224,6 +241,9 @@ class GraphBinariesAnalyzer(object):
 
         info = conanfile.info
         node.package_id = info.package_id()
+        if memoize:
+            # Not the info of the conanfile, later modified by the installer
+            self._package_infos[key] = node.package_id, info.copy(full=True)
 
     def _handle_private(self, node):
         if node.binary in (BINARY_CACHE, BINARY_DOWNLOAD, BINARY_UPDATE, BINARY_SKIP):
@@ -239,12 +259,15 @@ class GraphBinariesAnalyzer(object):
                         n.binary = BINARY_SKIP
                         self._handle_private(n)
 
+    @profiled("binaries")
     def evaluate_graph(self, deps_graph, build_mode, update, remotes):
         default_package_id_mode = self._cache.config.default_package_id_mode
         evaluated = deps_graph.evaluated
         for node in deps_graph.ordered_iterate():
-            self._compute_package_id(node, default_package_id_mode)
+            with profile_span("compute_package_id", "binaries", node=node):
+                self._compute_package_id(node, default_package_id_mode)
             if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
                 continue
-            self._evaluate_node(node, build_mode, update, evaluated, remotes)
+            with profile_span("evaluate_node", "binaries", node=node):
+                self._evaluate_node(node, build_mode, update, evaluated, remotes)
             self._handle_private(node)
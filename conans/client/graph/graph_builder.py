@@ -8,6 +8,7 @@ from conans.model.conan_file import get_env_context_manager
 from conans.model.ref import ConanFileReference
 from conans.model.requires import Requirements, Requirement
 from conans.util.log import logger
+from conans.util.profiling import profiled
 
 
 class DepsGraphBuilder(object):
@@ -20,16 +21,17 @@ class DepsGraphBuilder(object):
         self._resolver = resolver
         self._recorder = recorder
 
+    @profiled("graph", "expand_graph")
     def load_graph(self, root_node, check_updates, update, remotes, processed_profile,
                    graph_lock=None):
         check_updates = check_updates or update
         dep_graph = DepsGraph()
         # compute the conanfile entry point for this dependency graph
         name = root_node.name
-        root_node.public_closure = OrderedDict([(name, root_node)])
         root_node.public_deps = {name: root_node}
         root_node.ancestors = set()
         dep_graph.add_node(root_node)
+        root_node.init_closure()
 
         # enter recursive computation
         t1 = time.time()
@@ -154,8 +156,7 @@ class DepsGraphBuilder(object):
             new_node = self._create_new_node(node, dep_graph, require, name, check_updates, update,
                                              remotes, processed_profile, graph_lock)
 
-            # The closure of a new node starts with just itself
-            new_node.public_closure = OrderedDict([(new_node.ref.name, new_node)])
+            new_node.init_closure()
             # The new created node is connected to the parent one
             node.connect_closure(new_node)
 
@@ -202,12 +203,18 @@ class DepsGraphBuilder(object):
             dep_graph.add_edge(node, previous, require)
             # All the upstream dependencies (public_closure) of the previously existing node
             # now will be also connected to the node and to all its dependants
-            for name, n in previous.public_closure.items():
-                if n.build_require or n.private:
-                    continue
-                node.connect_closure(n)
-                for dep_node in node.inverse_closure:
-                    dep_node.connect_closure(n)
+            upstream = {n.index: (i, n) for i, n in enumerate(previous.public_closure.values())
+                        if not n.build_require and not n.private}
+            upstream_bits = previous.public_closure_bits
+            if len(upstream) != len(previous.public_closure):
+                upstream_bits = 0
+                for index in upstream:
+                    upstream_bits |= 1 << index
+            # Every node closure is only modified by itself, so connecting the whole "upstream"
+            # to one node after the other keeps the same order of their closures
+            node.connect_closures(upstream, upstream_bits)
+            for dep_node in node.inverse_closure:
+                dep_node.connect_closures(upstream, upstream_bits)
 
             # Recursion is only necessary if the inputs conflict with the current "previous"
             # configuration of upstream versions and options
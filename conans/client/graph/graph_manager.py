@@ -15,6 +15,7 @@ from conans.model.graph_lock import GraphLock, GraphLockFile
 from conans.model.ref import ConanFileReference
 from conans.paths import BUILD_INFO
 from conans.util.files import load
+from conans.util.profiling import profiled
 
 
 class _RecipeBuildRequires(OrderedDict):
@@ -99,6 +100,7 @@ class GraphManager(object):
 
         return conanfile
 
+    @profiled("graph")
     def load_graph(self, reference, create_reference, graph_info, build_mode, check_updates, update,
                    remotes, recorder, apply_build_requires=True):
 
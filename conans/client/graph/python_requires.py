@@ -6,6 +6,7 @@ from conans.client.recorder.action_recorder import ActionRecorder
 from conans.model.ref import ConanFileReference
 from conans.model.requires import Requirement
 from conans.errors import ConanException, NotFoundException
+from conans.util.profiling import profiled
 
 PythonRequire = namedtuple("PythonRequire", ["ref", "module", "conanfile",
                                              "exports_folder", "exports_sources_folder"])
@@ -35,6 +36,7 @@ class ConanPythonRequire(object):
         yield self._requires
         self._requires = old_requires
 
+    @profiled("graph", "python_requires")
     def _look_for_require(self, reference):
         ref = ConanFileReference.loads(reference)
         ref = self.locked_versions[ref.name] if self.locked_versions is not None else ref
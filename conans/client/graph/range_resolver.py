@@ -3,6 +3,7 @@ import re
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
 from conans.search.search import search_recipes
+from conans.util.profiling import profiled
 
 re_param = re.compile(r"^(?P<function>include_prerelease|loose)\s*=\s*(?P<value>True|False)$")
 re_version = re.compile(r"^((?!(include_prerelease|loose))[a-zA-Z0-9_+.\-~<>=|*^\s])*$")
@@ -95,6 +96,7 @@ class RangeResolver(object):
         self._result = []
         return result
 
+    @profiled("graph", "resolve_range")
     def resolve(self, require, base_conanref, update, remotes):
         version_range = require.version_range
         if version_range is None:
@@ -5,13 +5,13 @@ import stat
 import time
 
 from conans.client import tools
-from conans.client.file_copier import FileCopier, report_copied_files
+from conans.client.file_copier import FileCopier, FolderIndex, report_copied_files
 from conans.client.output import ScopedOutput
 from conans.errors import ConanException
 from conans.model.conan_file import get_env_context_manager
 from conans.model.manifest import FileTreeManifest
 from conans.util.env_reader import get_env
-from conans.util.files import load, md5sum
+from conans.util.files import load, md5sum, unlink_hardlink
 
 IMPORTS_MANIFESTS = "conan_imports_manifest.txt"
 
@@ -68,6 +68,8 @@ def _make_files_writable(file_names):
         return
 
     for file_name in file_names:
+        if os.stat(file_name).st_nlink > 1:  # Hard links of the "hardlink" copy strategy
+            unlink_hardlink(file_name)
         os.chmod(file_name, os.stat(file_name).st_mode | stat.S_IWRITE)
 
 
@@ -100,11 +102,12 @@ def run_deploy(conanfile, install_folder):
     deploy_output = ScopedOutput("%s deploy()" % conanfile.display_name, conanfile.output)
     file_importer = _FileImporter(conanfile, install_folder)
     package_copied = set()
+    folder_index = FolderIndex()
 
     # This is necessary to capture FileCopier full destination paths
     # Maybe could be improved in FileCopier
     def file_copier(*args, **kwargs):
-        file_copy = FileCopier([conanfile.package_folder], install_folder)
+        file_copy = FileCopier([conanfile.package_folder], install_folder, folder_index)
         copied = file_copy(*args, **kwargs)
         _make_files_writable(copied)
         package_copied.update(copied)
@@ -135,6 +138,7 @@ class _FileImporter(object):
         self._conanfile = conanfile
         self._dst_folder = dst_folder
         self.copied_files = set()
+        self._folder_index = FolderIndex()  # The packages are walked once for all the patterns
 
     def __call__(self, pattern, dst="", src="", root_package=None, folder=False,
                  ignore_case=False, excludes=None, keep_path=True):
@@ -155,7 +159,7 @@ class _FileImporter(object):
         matching_paths = self._get_folders(root_package)
         for name, matching_path in matching_paths.items():
             final_dst_path = os.path.join(real_dst_folder, name) if folder else real_dst_folder
-            file_copier = FileCopier([matching_path], final_dst_path)
+            file_copier = FileCopier([matching_path], final_dst_path, self._folder_index)
             files = file_copier(pattern, src=src, links=True, ignore_case=ignore_case,
                                 excludes=excludes, keep_path=keep_path)
             self.copied_files.update(files)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+
+from conans import __version__ as client_version
+from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_EDITABLE, RECIPE_VIRTUAL
+from conans.model.ref import PackageReference
+from conans.paths import DATA_YML
+from conans.util.files import load, save, sha1sum
+
+INSTALL_FINGERPRINT = "conaninstall.json"
+
+
+def install_inputs(conanfile_path, graph_info, remotes, cache, build_modes, generators,
+                   no_imports):
+    """ The inputs of a "conan install" of a consumer conanfile that are known before computing
+    the graph. Returns a json like dict
+    """
+    data_path = os.path.join(os.path.dirname(conanfile_path), DATA_YML)
+    graph_lock = graph_info.graph_lock
+    options = graph_info.options
+    root = graph_info.root
+    conan_env = {k: v for k, v in os.environ.items() if k.startswith("CONAN_")}
+    return {"version": client_version,
+            "conanfile": [conanfile_path, sha1sum(conanfile_path)],
+            "conandata": sha1sum(data_path) if os.path.exists(data_path) else None,
+            "modules": _python_modules(os.path.dirname(conanfile_path)),
+            "root": [root.name, root.version, root.user, root.channel] if root else None,
+            "profile": graph_info.profile.dumps(),
+            "options": options.dumps() if options is not None else None,
+            "graph_lock": graph_lock.as_dict() if graph_lock else None,
+            "remotes": [list(r) for r in remotes.values()] if remotes else None,
+            "selected_remote": remotes.selected.name if remotes and remotes.selected else None,
+            "build": sorted(build_modes) if build_modes is not None else None,
+            "generators": sorted(generators) if generators else generators,
+            "no_imports": no_imports,
+            "config": [_mtime(cache.conan_conf_path), _mtime(cache.settings_path),
+                       _mtime(cache.hooks_path)],
+            "env": conan_env}
+
+
+def _python_modules(folder):
+    """ The conanfile can import the python modules and packages of its folder, as helpers
+    that are also exported with it. Returns their relative paths and checksums
+    """
+    modules = []
+    for root, dirs, files in os.walk(folder):
+        # Only the python packages are walked, not the sources or build folders of the consumer
+        dirs[:] = sorted(d for d in dirs
+                         if os.path.isfile(os.path.join(root, d, "__init__.py")))
+        for f in sorted(files):
+            if f.endswith(".py"):
+                path = os.path.join(root, f)
+                modules.append([os.path.relpath(path, folder).replace("\\", "/"),
+                                sha1sum(path)])
+    return modules
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:  # Missing files are also part of the state
+        return None
+
+
+def _recipe_paths(cache, ref):
+    layout = cache.package_layout(ref)
+    folder = layout.base_folder()
+    # The folders of the name, version, user and channel also change when other versions,
+    # users or channels are added or removed, for example when they can resolve a version range
+    for _ in range(4):
+        yield folder
+        folder = os.path.dirname(folder)
+    yield layout.package_metadata()
+    yield layout.export()
+    yield layout.packages()
+
+
+def _cache_paths(cache, deps_graph):
+    """ The files and folders of the cache used by the graph, or None if some of them cannot be
+    tracked, as the editable packages
+    """
+    paths = []
+    for node in deps_graph.nodes:
+        python_requires = getattr(node.conanfile, "python_requires", None) or {}
+        for python_require in python_requires.values():
+            paths.extend(_recipe_paths(cache, python_require.ref))
+        if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+            continue
+        if node.recipe == RECIPE_EDITABLE:
+            return None
+        paths.extend(_recipe_paths(cache, node.ref))
+        if node.package_id:
+            layout = cache.package_layout(node.ref, short_paths=node.conanfile.short_paths)
+            paths.append(layout.package(PackageReference(node.ref, node.package_id)))
+    return paths
+
+
+class InstallFingerprint(object):
+    """ Summary of a "conan install" of a consumer in an install folder: its inputs and the
+    files of the cache and of the install folder that it used and generated. When they have not
+    changed, installing again would produce the very same files, and it can be skipped
+    """
+
+    def __init__(self, install_folder, inputs):
+        self._install_folder = install_folder
+        self._path = os.path.join(install_folder, INSTALL_FINGERPRINT)
+        inputs = json.dumps(inputs, sort_keys=True)
+        self._inputs = hashlib.sha1(inputs.encode("utf-8")).hexdigest()
+
+    def up_to_date(self, recorder=None):
+        """ True if the previous install in the folder had the same inputs and neither the
+        cache nor the generated files have changed since then. The actions of that install are
+        added to the recorder, as the recipes and packages fetched from the cache
+        """
+        try:
+            previous = json.loads(load(self._path))
+        except (IOError, ValueError):
+            return False
+        if previous.get("inputs") != self._inputs:
+            return False
+        actions = previous.get("actions")
+        if recorder is not None and actions is None:
+            return False
+        if not all(_mtime(path) == mtime for path, mtime in previous["files"].items()):
+            return False
+        if recorder is not None:
+            recorder.add_cached_install_actions(actions)
+        return True
+
+    def save(self, cache, deps_graph, generated_files, recorder=None):
+        """ generated_files: the ones written in the install folder, relative or absolute
+        recorder: the ActionRecorder of the install, to replay its actions when skipping the
+        next one
+        """
+        paths = _cache_paths(cache, deps_graph)
+        if paths is None:
+            self.invalidate()
+            return
+        paths.extend(os.path.join(self._install_folder, f) for f in generated_files)
+        files = {path: _mtime(path) for path in paths}
+        actions = recorder.cached_install_actions() if recorder is not None else None
+        save(self._path, json.dumps({"inputs": self._inputs, "files": files, "actions": actions},
+                                    indent=True))
+
+    def invalidate(self):
+        if os.path.exists(self._path):
+            os.remove(self._path)
@@ -1,13 +1,12 @@
 import os
-import shutil
 import time
 
-from conans.client import tools
 from conans.client.file_copier import report_copied_files
 from conans.client.generators import TXTGenerator, write_generators
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING, \
     BINARY_SKIP, BINARY_UPDATE, BINARY_EDITABLE
 from conans.client.importer import remove_imports, run_imports
+from conans.client.package_info_cache import PackageInfoCache
 from conans.client.packager import create_package, update_package_metadata
 from conans.client.recorder.action_recorder import INSTALL_ERROR_BUILDING, INSTALL_ERROR_MISSING, \
     INSTALL_ERROR_MISSING_BUILD_FOLDER
@@ -15,8 +14,8 @@ from conans.client.source import complete_recipe_sources, config_source
 from conans.client.tools.env import pythonpath
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter)
-from conans.model.build_info import CppInfo
-from conans.model.conan_file import get_env_context_manager
+from conans.model.build_info import CppInfo, DepsCppInfo
+from conans.model.conan_file import conanfile_execution
 from conans.model.editable_layout import EditableLayout
 from conans.model.env_info import EnvInfo
 from conans.model.manifest import FileTreeManifest
@@ -24,9 +23,10 @@ from conans.model.ref import PackageReference
 from conans.model.user_info import UserInfo
 from conans.paths import BUILD_INFO, CONANINFO, RUN_LOG_NAME
 from conans.util.env_reader import get_env
-from conans.util.files import (clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty,
-                               set_dirty_context_manager)
+from conans.util.files import (clean_dirty, copytree, is_dirty, make_read_only, mkdir, rmdir, save,
+                               set_dirty, set_dirty_context_manager)
 from conans.util.log import logger
+from conans.util.profiling import profile_span, profiled
 from conans.util.tracer import log_package_built, log_package_got_from_local_cache
 from conans.model.graph_info import GraphInfo
 
@@ -93,7 +93,7 @@ class _PackageBuilder(object):
         if not getattr(conanfile, 'no_copy_source', False):
             self._output.info('Copying sources to build folder')
             try:
-                shutil.copytree(source_folder, build_folder, symlinks=True)
+                copytree(source_folder, build_folder)
             except Exception as e:
                 msg = str(e)
                 if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
@@ -150,7 +150,7 @@ class _PackageBuilder(object):
 
         package_id = pref.id
         # Do the actual copy, call the conanfile.package() method
-        with get_env_context_manager(conanfile):
+        with conanfile_execution(conanfile, build_folder):
             # Could be source or build depends no_copy_source
             source_folder = conanfile.source_folder
             install_folder = build_folder  # While installing, the infos goes to build folder
@@ -189,7 +189,6 @@ class _PackageBuilder(object):
         with package_layout.conanfile_read_lock(self._output):
             _remove_folder_raising(package_folder)
             mkdir(build_folder)
-            os.chdir(build_folder)
             self._output.info('Building your package in %s' % build_folder)
             try:
                 if getattr(conanfile, 'no_copy_source', False):
@@ -198,7 +197,7 @@ class _PackageBuilder(object):
                     conanfile.source_folder = build_folder
 
                 if not skip_build:
-                    with get_env_context_manager(conanfile):
+                    with conanfile_execution(conanfile, build_folder):
                         conanfile.build_folder = build_folder
                         conanfile.package_folder = package_folder
                         # In local cache, install folder always is build_folder
@@ -295,7 +294,9 @@ class BinaryInstaller(object):
         self._remote_manager = app.remote_manager
         self._recorder = recorder
         self._hook_manager = app.hook_manager
+        self._cache_package_info = app.cache.config.cache_package_info
 
+    @profiled("install")
     def install(self, deps_graph, remotes, keep_build=False, graph_info=None):
         # order by levels and separate the root node (ref=None) from the rest
         nodes_by_level = deps_graph.by_levels()
@@ -306,6 +307,7 @@ class BinaryInstaller(object):
 
     def _build(self, nodes_by_level, keep_build, root_node, graph_info, remotes):
         processed_package_refs = set()
+        deps_cpp_infos = {}  # {closure: DepsCppInfo} shared by the nodes with the same closure
         for level in nodes_by_level:
             for node in level:
                 ref, conan_file = node.ref, node.conanfile
@@ -316,18 +318,21 @@ class BinaryInstaller(object):
                     raise_package_not_found_error(conan_file, ref, package_id, dependencies,
                                                   out=output, recorder=self._recorder)
 
-                self._propagate_info(node)
+                self._propagate_info(node, deps_cpp_infos)
                 if node.binary == BINARY_EDITABLE:
                     self._handle_node_editable(node, graph_info)
                 else:
                     if node.binary == BINARY_SKIP:  # Privates not necessary
                         continue
                     assert ref.revision is not None, "Installer should receive RREV always"
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+                    with profile_span("install_node", "install", node=node,
+                                      binary=node.binary):
+                        _handle_system_requirements(conan_file, node.pref, self._cache, output)
+                        self._handle_node_cache(node, keep_build, processed_package_refs,
+                                                remotes)
 
         # Finally, propagate information to root node (ref=None)
-        self._propagate_info(root_node)
+        self._propagate_info(root_node, deps_cpp_infos)
 
     def _node_concurrently_installed(self, node, package_folder):
         if node.binary == BINARY_DOWNLOAD and os.path.exists(package_folder):
@@ -417,7 +422,7 @@ class BinaryInstaller(object):
                     self._recorder.package_fetched_from_cache(pref)
 
             # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref)
+            self._call_package_info(conanfile, package_folder, ref=pref.ref, pref=pref)
             self._recorder.package_cpp_info(pref, conanfile.cpp_info)
 
     def _build_package(self, node, output, keep_build, remotes):
@@ -436,15 +441,22 @@ class BinaryInstaller(object):
         return pref
 
     @staticmethod
-    def _propagate_info(node):
+    def _propagate_info(node, deps_cpp_infos):
         # Get deps_cpp_info from upstream nodes
         node_order = [n for n in node.public_closure if n.binary != BINARY_SKIP]
         # List sort is stable, will keep the original order of the closure, but prioritize levels
         conan_file = node.conanfile
+        # The upstream cpp_info are already final, the aggregation of the same closure is equal
+        closure = tuple(id(n) for n in node_order)
+        deps_cpp_info = deps_cpp_infos.get(closure)
+        if deps_cpp_info is None:
+            deps_cpp_info = DepsCppInfo()
+            deps_cpp_info.update_all([(n.ref.name, n.conanfile.cpp_info) for n in node_order])
+            deps_cpp_infos[closure] = deps_cpp_info
+        conan_file.deps_cpp_info = deps_cpp_info.copy()
         for n in node_order:
             if n.build_require:
                 conan_file.output.info("Applying build-requirement: %s" % str(n.ref))
-            conan_file.deps_cpp_info.update(n.conanfile.cpp_info, n.ref.name)
             conan_file.deps_env_info.update(n.conanfile.env_info, n.ref.name)
             conan_file.deps_user_info[n.ref.name] = n.conanfile.user_info
 
@@ -457,7 +469,10 @@ class BinaryInstaller(object):
                    package_name == conan_file.name:
                     conan_file.info.env_values.add(name, value, package_name)
 
-    def _call_package_info(self, conanfile, package_folder, ref):
+    def _call_package_info(self, conanfile, package_folder, ref, pref=None):
+        """ pref: the binary package of the cache in package_folder, its package_info() results
+        can be cached if enabled
+        """
         conanfile.cpp_info = CppInfo(package_folder)
         conanfile.cpp_info.name = conanfile.name
         conanfile.cpp_info.version = conanfile.version
@@ -471,7 +486,7 @@ class BinaryInstaller(object):
         # Once the node is build, execute package info, so it has access to the
         # package folder and artifacts
         with pythonpath(conanfile):  # Minimal pythonpath, not the whole context, make it 50% slower
-            with tools.chdir(package_folder):
+            with conanfile_execution(conanfile, package_folder, apply_env=False):
                 with conanfile_exception_formatter(str(conanfile), "package_info"):
                     conanfile.package_folder = package_folder
                     conanfile.source_folder = None
@@ -479,6 +494,13 @@ class BinaryInstaller(object):
                     conanfile.install_folder = None
                     self._hook_manager.execute("pre_package_info", conanfile=conanfile,
                                                reference=ref)
-                    conanfile.package_info()
+                    info_cache = None
+                    if pref is not None and self._cache_package_info and \
+                            conanfile.cache_package_info:
+                        info_cache = PackageInfoCache(conanfile, pref, package_folder)
+                    if info_cache is None or not info_cache.load(conanfile):
+                        conanfile.package_info()
+                        if info_cache is not None:
+                            info_cache.save(conanfile)
                     self._hook_manager.execute("post_package_info", conanfile=conanfile,
                                                reference=ref)
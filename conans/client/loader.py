@@ -5,8 +5,6 @@ import os
 import sys
 import uuid
 
-import yaml
-
 from conans.client.generators import registered_generators
 from conans.client.loader_txt import ConanFileTextLoader
 from conans.client.tools.files import chdir
@@ -19,6 +17,7 @@ from conans.model.settings import Settings
 from conans.model.values import Values
 from conans.paths import DATA_YML
 from conans.util.files import load
+from conans.util.yaml_loader import safe_load
 
 
 class ConanFileLoader(object):
@@ -57,7 +56,7 @@ class ConanFileLoader(object):
             return None
 
         try:
-            data = yaml.safe_load(load(data_path))
+            data = safe_load(load(data_path))
         except Exception as e:
             raise ConanException("Invalid yml format at {}: {}".format(DATA_YML, e))
 
@@ -3,18 +3,30 @@ import os
 from conans.client.generators import write_generators
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
 from conans.client.graph.printer import print_graph
-from conans.client.importer import run_deploy, run_imports
+from conans.client.importer import IMPORTS_MANIFESTS, run_deploy, run_imports
+from conans.client.install_fingerprint import InstallFingerprint, install_inputs
 from conans.client.installer import BinaryInstaller, call_system_requirements
 from conans.client.manifest_manager import ManifestManager
 from conans.client.output import Color
 from conans.client.source import complete_recipe_sources
 from conans.client.tools import cross_building, get_cross_building_settings
 from conans.errors import ConanException
+from conans.model.graph_info import GRAPH_INFO_FILE
+from conans.model.graph_lock import LOCKFILE
 from conans.model.ref import ConanFileReference
 from conans.paths import CONANINFO
 from conans.util.files import normalize, save
 
 
+def _no_forced_build(build_modes):
+    """ The build modes that only build the binaries that are not available (an empty list is
+    "--build", building everything)
+    """
+    if build_modes is None:
+        return True
+    return bool(build_modes) and all(m in ("missing", "never", "outdated") for m in build_modes)
+
+
 def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, build_modes=None,
                  update=False, manifest_folder=None, manifest_verify=False,
                  manifest_interactive=False, generators=None, no_imports=False,
@@ -40,6 +52,18 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
         generators = set(generators) if generators else set()
         generators.add("txt")  # Add txt generator by default
 
+    fingerprint = None
+    if (cache.config.skip_unchanged_install and install_folder and not create_reference and
+            not isinstance(ref_or_path, (ConanFileReference, list)) and not update and
+            not manifest_folder and _no_forced_build(build_modes)):
+        inputs = install_inputs(ref_or_path, graph_info, remotes, cache, build_modes, generators,
+                                no_imports)
+        fingerprint = InstallFingerprint(install_folder, inputs)
+        if fingerprint.up_to_date(recorder):
+            out.info("Nothing changed since the previous install in '%s', skipping it"
+                     % install_folder)
+            return
+
     out.info("Configuration:")
     out.writeln(graph_info.profile.dumps())
     result = graph_manager.load_graph(ref_or_path, create_reference, graph_info, build_modes,
@@ -78,24 +102,36 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
 
     if install_folder:
         conanfile.install_folder = install_folder
+        generated_files = []
         # Write generators
         output = conanfile.output if conanfile.display_name != "virtual" else out
+        consumer_install = not isinstance(ref_or_path, ConanFileReference) or use_lock
         if generators is not False:
             tmp = list(conanfile.generators)  # Add the command line specified generators
             tmp.extend([g for g in generators if g not in tmp])
             conanfile.generators = tmp
-            write_generators(conanfile, install_folder, output)
-        if not isinstance(ref_or_path, ConanFileReference) or use_lock:
+            # The generators of a consumer are not rendered again if their inputs are the same
+            use_cache = consumer_install and cache.config.cache_generators
+            generated_files.extend(write_generators(conanfile, install_folder, output,
+                                                    use_cache=use_cache))
+        if consumer_install:
             # Write conaninfo
             content = normalize(conanfile.info.dumps())
             save(os.path.join(install_folder, CONANINFO), content)
             output.info("Generated %s" % CONANINFO)
             graph_info.save(install_folder)
             output.info("Generated graphinfo")
+            generated_files.extend([CONANINFO, GRAPH_INFO_FILE, LOCKFILE])
         if not no_imports:
-            run_imports(conanfile, install_folder)
+            imported_files = run_imports(conanfile, install_folder)
+            if imported_files:
+                generated_files.extend(imported_files)
+                generated_files.append(IMPORTS_MANIFESTS)
         call_system_requirements(conanfile, conanfile.output)
 
+        if fingerprint:
+            fingerprint.save(cache, deps_graph, generated_files, recorder)
+
         if not create_reference and isinstance(ref_or_path, ConanFileReference):
             # The conanfile loaded is a virtual one. The one w deploy is the first level one
             neighbours = deps_graph.root.neighbors()
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+
+from conans import __version__ as client_version
+from conans.util.files import load, save
+
+# The "__conan" files are discarded from the manifests and the uploads of the packages
+PACKAGE_INFO_CACHE = "__conan_package_info.json"
+
+
+def _package_info_key(conanfile, pref, package_folder):
+    """ The inputs of the package_info() method of a binary package of the cache: the
+    package and recipe revisions and the settings and options the method can read
+    """
+    python_requires = getattr(conanfile, "python_requires", None) or {}
+    key = {"version": client_version,
+           "pref": pref.full_str(),
+           "package_folder": package_folder,
+           "python_requires": sorted(r.ref.full_str() for r in python_requires.values()),
+           "settings": conanfile.settings.values_list,
+           "options": conanfile.options.values.dumps()}
+    key = json.dumps(key, sort_keys=True)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class PackageInfoCache(object):
+    """ The cpp_info, env_info and user_info defined by the package_info() of a binary package,
+    saved in its package folder, to skip the method the next time they are needed. Only for
+    the recipes whose package_info() depends just on those inputs, that do not opt out with
+    the "cache_package_info = False" attribute
+    """
+
+    def __init__(self, conanfile, pref, package_folder):
+        self._path = os.path.join(package_folder, PACKAGE_INFO_CACHE)
+        self._key = _package_info_key(conanfile, pref, package_folder)
+
+    def load(self, conanfile):
+        """ Restores the cached results in the conanfile, that already has the initial ones.
+        Returns False if they were not cached for the same inputs
+        """
+        try:
+            data = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            return False
+        if data.get("key") != self._key:
+            return False
+
+        cpp_info = conanfile.cpp_info
+        vars(cpp_info).update(data["cpp_info"])
+        for config, values in data["configs"].items():
+            vars(getattr(cpp_info, config)).update(values)
+        conanfile.env_info.vars.update(data["env_info"])
+        conanfile.user_info.vars.update(data["user_info"])
+        return True
+
+    def save(self, conanfile):
+        """ Not cached if the results cannot be restored exactly (not json serializable),
+        or if the package folder cannot be written, as in a read-only cache
+        """
+        cpp_info = conanfile.cpp_info
+        data = {"key": self._key,
+                "cpp_info": {k: v for k, v in vars(cpp_info).items() if k != "configs"},
+                "configs": {config: vars(info) for config, info in cpp_info.configs.items()},
+                "env_info": conanfile.env_info.vars,
+                "user_info": conanfile.user_info.vars}
+        try:
+            text = json.dumps(data)
+        except (TypeError, ValueError):
+            return
+        if json.loads(text) != data:  # e.g. tuples instead of lists
+            return
+        try:
+            save(self._path, text)
+        except (IOError, OSError):
+            pass
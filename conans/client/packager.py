@@ -3,9 +3,9 @@ import shutil
 
 from conans.client.file_copier import FileCopier, report_copied_files
 from conans.client.output import ScopedOutput
-from conans.client.tools.files import chdir
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter)
+from conans.model.conan_file import conanfile_execution
 from conans.model.manifest import FileTreeManifest
 from conans.paths import CONANINFO
 from conans.util.files import mkdir, rmdir, save
@@ -68,11 +68,10 @@ def create_package(conanfile, package_id, source_folder, build_folder, package_f
         folders = [source_folder, build_folder] if source_folder != build_folder else [build_folder]
         conanfile.copy = FileCopier(folders, package_folder)
         with conanfile_exception_formatter(str(conanfile), "package"):
-            with chdir(build_folder):
+            with conanfile_execution(conanfile, build_folder, apply_env=False):
                 conanfile.package()
     except Exception as e:
         if not local:
-            os.chdir(build_folder)
             try:
                 rmdir(package_folder)
             except Exception as e_rm:
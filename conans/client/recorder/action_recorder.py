@@ -114,6 +114,26 @@ class ActionRecorder(object):
         # assert isinstance(cpp_info, CppInfo)
         self._inst_packages_info[pref.copy_clear_revs()]['cpp_info'] = _cpp_info_to_dict(cpp_info)
 
+    # CACHED INSTALL METHODS
+    def cached_install_actions(self):
+        """ The actions that an install of the same graph would record once all the recipes and
+        packages are in the cache, as a json like dict for add_cached_install_actions()
+        """
+        recipes = [repr(actions[0].full_ref) for actions in self._inst_recipes_actions.values()]
+        packages = [[repr(actions[0].full_ref),
+                     self._inst_packages_info.get(pref, {}).get("cpp_info")]
+                    for pref, actions in self._inst_packages_actions.items()]
+        return {"recipes": recipes, "packages": packages}
+
+    def add_cached_install_actions(self, cached_actions):
+        for ref in cached_actions["recipes"]:
+            self.recipe_fetched_from_cache(ConanFileReference.loads(ref, validate=False))
+        for pref, cpp_info in cached_actions["packages"]:
+            pref = PackageReference.loads(pref, validate=False)
+            self.package_fetched_from_cache(pref)
+            if cpp_info is not None:
+                self._inst_packages_info[pref.copy_clear_revs()]["cpp_info"] = cpp_info
+
     @property
     def install_errored(self):
         all_values = list(self._inst_recipes_actions.values()) + list(self._inst_packages_actions.values())
@@ -1,5 +1,6 @@
 import os
 import shutil
+import tempfile
 import time
 import traceback
 
@@ -10,13 +11,15 @@ from conans.client.cache.remote_registry import Remote
 from conans.client.source import merge_directories
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     NoRestV2Available, PackageNotFoundException
-from conans.paths import EXPORT_SOURCES_DIR_OLD, \
+from conans.model.manifest import FileTreeManifest, gather_files
+from conans.paths import CONAN_MANIFEST, CONANINFO, EXPORT_SOURCES_DIR_OLD, \
     EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
 from conans.search.search import filter_packages
 from conans.util import progress_bar
 from conans.util.env_reader import get_env
-from conans.util.files import make_read_only, mkdir, rmdir, tar_extract, touch_folder
+from conans.util.files import make_read_only, md5sum, mkdir, rmdir, tar_extract, touch_folder
 from conans.util.log import logger
+from conans.util.profiling import profiled
 # FIXME: Eventually, when all output is done, tracer functions should be moved to the recorder class
 from conans.util.tracer import (log_package_download,
                                 log_recipe_download, log_recipe_sources_download,
@@ -129,22 +132,26 @@ class RemoteManager(object):
         self._hook_manager.execute("pre_download_package", conanfile_path=conanfile_path,
                                    reference=pref.ref, package_id=pref.id, remote=remote)
         output.info("Retrieving package %s from remote '%s' " % (pref.id, remote.name))
-        rm_conandir(dest_folder)  # Remove first the destination folder
         t1 = time.time()
         try:
             pref = self._resolve_latest_pref(pref, remote)
             snapshot = self._call_remote(remote, "get_package_snapshot", pref)
             if not is_package_snapshot_complete(snapshot):
                 raise PackageNotFoundException(pref)
-            zipped_files = self._call_remote(remote, "get_package", pref, dest_folder)
+
+            zipped_files = self._get_package_delta(pref, dest_folder, remote, output)
+            if zipped_files is None:
+                rm_conandir(dest_folder)  # Remove first the destination folder
+                zipped_files = self._call_remote(remote, "get_package", pref, dest_folder)
+                duration = time.time() - t1
+                log_package_download(pref, duration, remote, zipped_files)
+                unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME,
+                                    output=self._output)
 
             with self._cache.package_layout(pref.ref).update_metadata() as metadata:
                 metadata.packages[pref.id].revision = pref.revision
                 metadata.packages[pref.id].recipe_revision = pref.ref.revision
 
-            duration = time.time() - t1
-            log_package_download(pref, duration, remote, zipped_files)
-            unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
             if get_env("CONAN_READ_ONLY_CACHE", False):
@@ -168,6 +175,63 @@ class RemoteManager(object):
 
         return pref
 
+    def _get_package_delta(self, pref, package_folder, remote, output):
+        """ Updates an existing package folder downloading from the remote only the files that
+        changed. The result is checked against the remote manifest.
+        Returns the downloaded files or None if the whole package has to be downloaded
+        """
+        if not os.path.exists(os.path.join(package_folder, CONAN_MANIFEST)):
+            return None
+
+        t1 = time.time()
+        tmp_folder = tempfile.mkdtemp(suffix="conan_delta")
+        try:
+            local_manifest = FileTreeManifest.load(package_folder)
+            remote_manifest = self._call_remote(remote, "get_package_manifest", pref)
+            changed = sorted(f for f, h in remote_manifest.file_sums.items()
+                             if f != CONANINFO and local_manifest.file_sums.get(f) != h)
+            # Not worth it, and if nothing changed it might be a package with different symlinks
+            if not changed or len(changed) * 2 > len(remote_manifest.file_sums):
+                return None
+            zipped_files = self._call_remote(remote, "get_package_delta", pref, changed,
+                                             tmp_folder)
+            if zipped_files is None:  # The remote doesn't support it
+                return None
+            duration = time.time() - t1
+            log_package_download(pref, duration, remote, zipped_files)
+
+            # Remove the files that will be updated and the removed ones, and all the symlinks,
+            # the delta contains all of them
+            files, symlinks = gather_files(package_folder)
+            removed = [f for f in local_manifest.file_sums if f not in remote_manifest.file_sums]
+            to_remove = changed + removed + list(symlinks) + [CONANINFO, CONAN_MANIFEST]
+            to_remove.extend(f for f, path in files.items() if os.path.islink(path))
+            for f in to_remove:
+                path = os.path.join(package_folder, f)
+                if os.path.lexists(path):
+                    os.remove(path)
+            for f in removed:
+                _remove_empty_parents(os.path.join(package_folder, f), package_folder)
+
+            tgz_path = zipped_files.pop(PACKAGE_TGZ_NAME)
+            uncompress_file(tgz_path, package_folder, output=self._output)
+            for f, path in zipped_files.items():
+                shutil.move(path, os.path.join(package_folder, f))
+
+            # The unchanged files were already checked by the local manifest
+            files, _ = gather_files(package_folder)
+            files.pop(CONAN_MANIFEST, None)
+            if (set(files) != set(remote_manifest.file_sums) or
+                    any(md5sum(files[f]) != remote_manifest.file_sums[f] for f in changed)):
+                raise ConanException("The updated package doesn't match the remote manifest")
+            output.info("Package updated with %d changed files" % len(changed))
+            return zipped_files
+        except (ConanException, EnvironmentError) as e:
+            output.warn("Cannot update the package with a delta, downloading it again: %s" % e)
+            return None
+        finally:
+            rmdir(tmp_folder)
+
     def search_recipes(self, remote, pattern=None, ignorecase=True):
         """
         Search exported conans information from remotes
@@ -184,7 +248,7 @@ class RemoteManager(object):
         """
         Removed conans or packages from remote
         """
-        return self._call_remote(remote, "remove", ref)
+        return self._call_remote(remote, "remove_conanfile", ref)
 
     def remove_packages(self, ref, remove_ids, remote):
         """
@@ -234,9 +298,8 @@ class RemoteManager(object):
 
     def _call_remote(self, remote, method, *argc, **argv):
         assert(isinstance(remote, Remote))
-        self._auth_manager.remote = remote
         try:
-            return getattr(self._auth_manager, method)(*argc, **argv)
+            return self._auth_manager.call_rest_api_method(remote, method, *argc, **argv)
         except ConnectionError as exc:
             raise ConanConnectionError("%s\n\nUnable to connect to %s=%s"
                                        % (str(exc), remote.name, remote.url))
@@ -257,6 +320,13 @@ def is_package_snapshot_complete(snapshot):
     return integrity
 
 
+def _remove_empty_parents(path, base_folder):
+    folder = os.path.dirname(path)
+    while folder != base_folder and os.path.isdir(folder) and not os.listdir(folder):
+        os.rmdir(folder)
+        folder = os.path.dirname(folder)
+
+
 def check_compressed_files(tgz_name, files):
     bare_name = os.path.splitext(tgz_name)[0]
     for f in files:
@@ -278,6 +348,7 @@ def unzip_and_get_files(files, destination_dir, tgz_name, output):
         os.remove(tgz_file)
 
 
+@profiled("remote", "extract")
 def uncompress_file(src_path, dest_folder, output):
     t1 = time.time()
     try:
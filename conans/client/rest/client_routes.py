@@ -177,6 +177,12 @@ class ClientV2Router(ClientCommonRouter):
         """get recipe manifest url"""
         return self.base_url + self._for_package_files(pref)
 
+    def package_delta(self, pref):
+        """get the url for a tgz with some of the files of a package"""
+        assert pref.ref.revision is not None, "package_delta needs RREV"
+        assert pref.revision is not None, "package_delta needs PREV"
+        return self.base_url + _format_pref(routes.package_revision_delta, pref)
+
     def package_revisions(self, pref):
         """get revisions for a package url"""
         return self.base_url + _format_pref(routes.package_revisions, pref)
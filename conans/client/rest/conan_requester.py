@@ -1,5 +1,4 @@
 import fnmatch
-import logging
 import os
 import platform
 import time
@@ -7,16 +6,13 @@ import warnings
 
 import requests
 from requests.adapters import HTTPAdapter
+from six.moves.urllib.request import getproxies
 
 from conans import __version__ as client_version
 from conans.util.files import save
+from conans.util.profiling import profile_span
 from conans.util.tracer import log_client_rest_api_call
 
-# Capture SSL warnings as pointed out here:
-# https://urllib3.readthedocs.org/en/latest/security.html#insecureplatformwarning
-# TODO: Fix this security warning
-logging.captureWarnings(True)
-
 
 class ConanRequester(object):
 
@@ -48,6 +44,18 @@ class ConanRequester(object):
                           " Use proxies.no_proxy_match instead")
             os.environ["NO_PROXY"] = no_proxy
 
+        # When Conan proxies are defined, the system ones (environment variables) are ignored.
+        # Instead of cleaning the environment for each request, every system proxy is explicitly
+        # disabled in the proxies passed to requests
+        if self.proxies or self._no_proxy_match:
+            system_proxies = dict.fromkeys(["http", "https", "ftp", "all"])
+            system_proxies.update(dict.fromkeys(getproxies()))
+            self._no_proxies = system_proxies
+            self._proxies = system_proxies.copy()
+            self._proxies.update(self.proxies)
+        else:
+            self._no_proxies = self._proxies = None
+
         if not os.path.exists(self._cacert_path):
             from conans.client.rest.cacert import cacert
             save(self._cacert_path, cacert)
@@ -85,13 +93,16 @@ class ConanRequester(object):
         else:
             kwargs["verify"] = False
         kwargs["cert"] = self._client_certificates
-        if self.proxies:
-            if not self._should_skip_proxy(url):
-                kwargs["proxies"] = self.proxies
+        if self._proxies is not None:
+            # A new dict every time, requests might modify it
+            if self._should_skip_proxy(url):
+                kwargs["proxies"] = self._no_proxies.copy()
+            else:
+                kwargs["proxies"] = self._proxies.copy()
         if self._timeout_seconds:
             kwargs["timeout"] = self._timeout_seconds
-        if not kwargs.get("headers"):
-            kwargs["headers"] = {}
+        # Do not modify the caller headers, they can be shared with other requests
+        kwargs["headers"] = dict(kwargs.get("headers") or {})
 
         user_agent = "Conan/%s (Python %s) %s" % (client_version, platform.python_version(),
                                                   requests.utils.default_user_agent())
@@ -111,21 +122,10 @@ class ConanRequester(object):
         return self._call_method("post", url, **kwargs)
 
     def _call_method(self, method, url, **kwargs):
-        popped = False
-        if self.proxies or self._no_proxy_match:
-            old_env = dict(os.environ)
-            # Clean the proxies from the environ and use the conan specified proxies
-            for var_name in ("http_proxy", "https_proxy", "ftp_proxy", "all_proxy", "no_proxy"):
-                popped = True if os.environ.pop(var_name, None) else popped
-                popped = True if os.environ.pop(var_name.upper(), None) else popped
-        try:
-            t1 = time.time()
-            all_kwargs = self._add_kwargs(url, kwargs)
+        t1 = time.time()
+        all_kwargs = self._add_kwargs(url, kwargs)
+        with profile_span(method.upper(), "rest", url=url):
             tmp = getattr(self._http_requester, method)(url, **all_kwargs)
-            duration = time.time() - t1
-            log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
-            return tmp
-        finally:
-            if popped:
-                os.environ.clear()
-                os.environ.update(old_env)
+        duration = time.time() - t1
+        log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
+        return tmp
@@ -1,6 +1,5 @@
-from collections import defaultdict
-
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, COMPLEX_SEARCH_CAPABILITY
+from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, COMPLEX_SEARCH_CAPABILITY, \
+    PACKAGE_DELTA
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
 from conans.errors import OnlyV2Available
@@ -8,46 +7,66 @@ from conans.search.search import filter_packages
 from conans.util.log import logger
 
 
-class RestApiClient(object):
+class RestApiClientFactory(object):
     """
-        Rest Api Client for handle remote.
+        Creates a RestApiClient for each remote call. The server capabilities are shared
+        between all the created clients, so they are requested only once per remote url.
     """
 
     def __init__(self, output, requester, revisions_enabled, put_headers=None):
+        self._output = output
+        self._requester = requester
+        self._revisions_enabled = revisions_enabled
+        self._put_headers = put_headers
+        self._cached_capabilities = {}
+
+    def new(self, remote, token, refresh_token, custom_headers):
+        return RestApiClient(remote, token, refresh_token, custom_headers, self._output,
+                             self._requester, self._revisions_enabled, self._cached_capabilities,
+                             self._put_headers)
+
+
+class RestApiClient(object):
+    """
+        Rest Api Client for handle remote. Its configuration (remote, credentials and headers)
+        doesn't change after construction, so different instances can be used concurrently.
+    """
+
+    def __init__(self, remote, token, refresh_token, custom_headers, output, requester,
+                 revisions_enabled, cached_capabilities, put_headers=None):
 
         # Set to instance
-        self.token = None
-        self.refresh_token = None
-        self.remote_url = None
-        self.custom_headers = {}  # Can set custom headers to each request
+        self._token = token
+        self._refresh_token = refresh_token
+        self._remote_url = remote.url
+        self._verify_ssl = remote.verify_ssl
+        self._custom_headers = custom_headers
         self._output = output
-        self.requester = requester
-
-        # Remote manager will set it to True or False dynamically depending on the remote
-        self.verify_ssl = True
+        self._requester = requester
         self._put_headers = put_headers
         self._revisions_enabled = revisions_enabled
 
-        self._cached_capabilities = defaultdict(list)
+        self._cached_capabilities = cached_capabilities
 
     def _get_api(self):
-        if self.remote_url not in self._cached_capabilities:
-            tmp = RestV1Methods(self.remote_url, self.token, self.custom_headers, self._output,
-                                self.requester, self.verify_ssl, self._put_headers)
+        if self._remote_url not in self._cached_capabilities:
+            tmp = RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
+                                self._requester, self._verify_ssl, self._put_headers)
             cap = tmp.server_capabilities()
-            self._cached_capabilities[self.remote_url] = cap
+            self._cached_capabilities[self._remote_url] = cap
             logger.debug("REST: Cached capabilities for the remote: %s" % cap)
             if not self._revisions_enabled and ONLY_V2 in cap:
-                raise OnlyV2Available(self.remote_url)
+                raise OnlyV2Available(self._remote_url)
 
-        if self._revisions_enabled and REVISIONS in self._cached_capabilities[self.remote_url]:
-            checksum_deploy = CHECKSUM_DEPLOY in self._cached_capabilities[self.remote_url]
-            return RestV2Methods(self.remote_url, self.token, self.custom_headers, self._output,
-                                 self.requester, self.verify_ssl, self._put_headers,
+        capabilities = self._cached_capabilities[self._remote_url]
+        if self._revisions_enabled and REVISIONS in capabilities:
+            checksum_deploy = CHECKSUM_DEPLOY in capabilities
+            return RestV2Methods(self._remote_url, self._token, self._custom_headers, self._output,
+                                 self._requester, self._verify_ssl, self._put_headers,
                                  checksum_deploy)
         else:
-            return RestV1Methods(self.remote_url, self.token, self.custom_headers, self._output,
-                                 self.requester, self.verify_ssl, self._put_headers)
+            return RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
+                                 self._requester, self._verify_ssl, self._put_headers)
 
     def get_recipe_manifest(self, ref):
         return self._get_api().get_recipe_manifest(ref)
@@ -70,6 +89,15 @@ class RestApiClient(object):
     def get_package(self, pref, dest_folder):
         return self._get_api().get_package(pref, dest_folder)
 
+    def get_package_delta(self, pref, files, dest_folder):
+        """ Returns None if the remote cannot provide a delta of the package files
+        """
+        api = self._get_api()
+        if (not isinstance(api, RestV2Methods) or
+                PACKAGE_DELTA not in self._cached_capabilities[self._remote_url]):
+            return None
+        return api.get_package_delta(pref, files, dest_folder)
+
     def get_package_snapshot(self, ref):
         return self._get_api().get_package_snapshot(ref)
 
@@ -87,13 +115,13 @@ class RestApiClient(object):
         return self._get_api().upload_package(pref, files_to_upload, deleted, retry, retry_wait)
 
     def authenticate(self, user, password):
-        api_v1 = RestV1Methods(self.remote_url, self.token, self.custom_headers, self._output,
-                               self.requester, self.verify_ssl, self._put_headers)
+        api_v1 = RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
+                               self._requester, self._verify_ssl, self._put_headers)
 
-        if self.refresh_token and self.token:
-            token, refresh_token = api_v1.refresh_token(self.token, self.refresh_token)
+        if self._refresh_token and self._token:
+            token, refresh_token = api_v1.refresh_token(self._token, self._refresh_token)
         else:
-            if OAUTH_TOKEN in self._cached_capabilities[self.remote_url]:
+            if OAUTH_TOKEN in self._cached_capabilities.get(self._remote_url, []):
                 # Artifactory >= 6.13.X
                 token, refresh_token = api_v1.authenticate_oauth(user, password)
             else:
@@ -110,7 +138,8 @@ class RestApiClient(object):
 
     def search_packages(self, reference, query):
         package_infos = self._get_api().search_packages(reference, query)
-        if query and COMPLEX_SEARCH_CAPABILITY not in self._cached_capabilities[self.remote_url]:
+        capabilities = self._cached_capabilities.get(self._remote_url, [])
+        if query and COMPLEX_SEARCH_CAPABILITY not in capabilities:
             return filter_packages(query, package_infos)
         return package_infos
 
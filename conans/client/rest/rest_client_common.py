@@ -171,7 +171,7 @@ class RestCommonMethods(object):
         return [cap.strip() for cap in server_capabilities.split(",") if cap]
 
     def get_json(self, url, data=None):
-        headers = self.custom_headers
+        headers = dict(self.custom_headers)
         if data:  # POST request
             headers.update({'Content-type': 'application/json',
                             'Accept': 'text/plain',
@@ -56,7 +56,8 @@ class RestV1Methods(RestCommonMethods):
         urltokens = urlsplit(resource_url)
         query_string = urltokens[3]
         parsed_string_dict = parse_qs(query_string)
-        if "signature" not in parsed_string_dict and "Signature" not in parsed_string_dict:
+        signatures = ("signature", "Signature", "X-Amz-Signature")
+        if not any(signature in parsed_string_dict for signature in signatures):
             # If monolithic server, we can use same auth, and server understand dedup
             auth = self.auth
             dedup = True
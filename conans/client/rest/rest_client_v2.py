@@ -12,7 +12,7 @@ from conans.errors import ConanException, NotFoundException, PackageNotFoundExce
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
-from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
+from conans.paths import CONAN_MANIFEST, CONANINFO, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
     PACKAGE_TGZ_NAME
 from conans.util.files import decode_text
 from conans.util.log import logger
@@ -119,6 +119,24 @@ class RestV2Methods(RestCommonMethods):
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
+    def get_package_delta(self, pref, files, dest_folder):
+        """ Downloads a tgz with only the given files of the package (and all its symlinks)
+        together with the conaninfo.txt and conanmanifest.txt files
+        """
+        tgz_path = os.path.join(dest_folder, PACKAGE_TGZ_NAME)
+        downloader = FileDownloader(self.requester, self._output, self.verify_ssl)
+        if self._output and not self._output.is_terminal:
+            self._output.writeln("Downloading %s (delta)" % PACKAGE_TGZ_NAME)
+        downloader.download(self.router.package_delta(pref), tgz_path, auth=self.auth,
+                            json={"files": files})
+
+        files = [CONANINFO, CONAN_MANIFEST]
+        urls = {fn: self.router.package_file(pref, fn) for fn in files}
+        self._download_and_save_files(urls, dest_folder, files)
+        ret = {fn: os.path.join(dest_folder, fn) for fn in files}
+        ret[PACKAGE_TGZ_NAME] = tgz_path
+        return ret
+
     def get_recipe_path(self, ref, path):
         url = self.router.recipe_snapshot(ref)
         files = self._get_file_list_json(url)
@@ -2,13 +2,12 @@ import os
 import traceback
 import time
 
-from tqdm import tqdm
-
 from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
 from conans.util.files import mkdir, save_append, sha1sum, to_file_bytes
 from conans.util.log import logger
+from conans.util.profiling import profiled
 from conans.util.tracer import log_download
 
 TIMEOUT_BEAT_SECONDS = 30
@@ -122,6 +121,7 @@ class upload_with_progress(object):
     def __iter__(self):
         progress_bar = None
         if self.output and self.output.is_terminal:
+            from tqdm import tqdm
             progress_bar = tqdm(total=self.totalsize, unit='B', unit_scale=True,
                                 unit_divisor=1024, desc="Uploading {}".format(self.file_name),
                                 leave=True, dynamic_ncols=False, ascii=True, file=self.output)
@@ -163,8 +163,12 @@ class FileDownloader(object):
         self.requester = requester
         self.verify = verify
 
+    @profiled("remote")
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
-                 headers=None):
+                 headers=None, json=None):
+        """ Downloads the url contents to file_path or returns them if no file_path is given.
+        If json is provided, the contents are requested with a POST with that json body
+        """
         retry = retry if retry is not None else self.requester.retry
         retry = retry if retry is not None else 2
         retry_wait = retry_wait if retry_wait is not None else self.requester.retry_wait
@@ -183,14 +187,18 @@ class FileDownloader(object):
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
         return call_with_retry(self.output, retry, retry_wait, self._download_file, url, auth,
-                               headers, file_path)
+                               headers, file_path, json)
 
-    def _download_file(self, url, auth, headers, file_path):
+    def _download_file(self, url, auth, headers, file_path, json=None):
         t1 = time.time()
 
         try:
-            response = self.requester.get(url, stream=True, verify=self.verify, auth=auth,
-                                          headers=headers)
+            if json is not None:
+                response = self.requester.post(url, stream=True, verify=self.verify, auth=auth,
+                                               headers=headers, json=json)
+            else:
+                response = self.requester.get(url, stream=True, verify=self.verify, auth=auth,
+                                              headers=headers)
         except Exception as exc:
             raise ConanException("Error downloading file %s: '%s'" % (url, exc))
 
@@ -224,6 +232,7 @@ class FileDownloader(object):
 
         progress_bar = None
         if self.output and self.output.is_terminal:
+            from tqdm import tqdm
             progress_bar = tqdm(unit='B', unit_scale=True,
                                 unit_divisor=1024, dynamic_ncols=False,
                                 leave=True, ascii=True, file=self.output)
@@ -1,5 +1,6 @@
 import io
 import os
+import platform
 import sys
 from contextlib import contextmanager
 from subprocess import PIPE, Popen, STDOUT
@@ -7,7 +8,6 @@ from subprocess import PIPE, Popen, STDOUT
 import six
 
 from conans.errors import ConanException
-from conans.unicode import get_cwd
 from conans.util.files import decode_text
 
 
@@ -29,12 +29,14 @@ class ConanRunner(object):
         self._log_run_to_output = log_run_to_output
         self._output = output
 
-    def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False):
+    def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False,
+                 env=None):
         """
         @param command: Command to execute
         @param output: Instead of print to sys.stdout print to that stream. Could be None
         @param log_filepath: If specified, also log to a file
         @param cwd: Move to directory to execute
+        @param env: Environment variables of the command, instead of the os.environ ones
         """
         if output and isinstance(output, io.StringIO) and six.PY2:
             # in py2 writing to a StringIO requires unicode, otherwise it fails
@@ -58,24 +60,24 @@ class ConanRunner(object):
             # No output has to be redirected to logs or buffer or omitted
             if (output is True and not self._output and not log_filepath and self._log_run_to_output
                     and not subprocess):
-                return self._simple_os_call(command, cwd)
+                return self._simple_os_call(command, cwd, env)
             elif log_filepath:
                 if stream_output:
                     stream_output.write("Logging command output to file '%s'\n" % log_filepath)
                 with open(log_filepath, "a+") as log_handler:
                     if self._print_commands_to_output:
                         log_handler.write(call_message)
-                    return self._pipe_os_call(command, stream_output, log_handler, cwd)
+                    return self._pipe_os_call(command, stream_output, log_handler, cwd, env)
             else:
-                return self._pipe_os_call(command, stream_output, None, cwd)
+                return self._pipe_os_call(command, stream_output, None, cwd, env)
 
-    def _pipe_os_call(self, command, stream_output, log_handler, cwd):
+    def _pipe_os_call(self, command, stream_output, log_handler, cwd, env):
 
         try:
             # piping both stdout, stderr and then later only reading one will hang the process
             # if the other fills the pip. So piping stdout, and redirecting stderr to stdout,
             # so both are merged and use just a single get_stream_lines() call
-            proc = Popen(command, shell=True, stdout=PIPE, stderr=STDOUT, cwd=cwd)
+            proc = Popen(command, shell=True, stdout=PIPE, stderr=STDOUT, cwd=cwd, env=env)
         except Exception as e:
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
 
@@ -105,20 +107,21 @@ class ConanRunner(object):
         ret = proc.returncode
         return ret
 
-    def _simple_os_call(self, command, cwd):
-        if not cwd:
+    @staticmethod
+    def _simple_os_call(command, cwd, env):
+        if not cwd and env is None:
             return os.system(command)
-        else:
-            try:
-                old_dir = get_cwd()
-                os.chdir(cwd)
-                result = os.system(command)
-            except Exception as e:
-                raise ConanException("Error while executing"
-                                     " '%s'\n\t%s" % (command, str(e)))
-            finally:
-                os.chdir(old_dir)
-            return result
+        # Not changing the current directory of the process, shared by all the threads
+        try:
+            proc = Popen(command, shell=True, cwd=cwd, env=env)
+        except Exception as e:
+            raise ConanException("Error while executing"
+                                 " '%s'\n\t%s" % (command, str(e)))
+        ret = proc.wait()
+        if platform.system() != "Windows":
+            # Same value as os.system(), the exit code or the signal as in the wait() status
+            ret = ret << 8 if ret >= 0 else -ret
+        return ret
 
 
 if getattr(sys, 'frozen', False) and 'LD_LIBRARY_PATH' in os.environ:
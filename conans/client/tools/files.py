@@ -6,7 +6,6 @@ from contextlib import contextmanager
 from fnmatch import fnmatch
 
 import six
-from patch import fromfile, fromstring
 
 from conans.client.output import ConanOutput
 from conans.errors import ConanException
@@ -174,6 +173,7 @@ def check_sha256(file_path, signature):
 def patch(base_path=None, patch_file=None, patch_string=None, strip=0, output=None):
     """Applies a diff from file (patch_file)  or string (patch_string)
     in base_path directory or current dir if None"""
+    from patch import fromfile, fromstring
 
     class PatchLogHandler(logging.Handler):
         def __init__(self):
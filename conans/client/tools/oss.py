@@ -1,4 +1,3 @@
-import multiprocessing
 import os
 import platform
 import subprocess
@@ -40,6 +39,7 @@ class CpuProperties(object):
                 return int(math.ceil(cfs_quota_us / cfs_period_us))
         except:
             pass
+        import multiprocessing
         return multiprocessing.cpu_count()
 
 
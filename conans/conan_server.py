@@ -7,9 +7,17 @@ def run():
     parser = argparse.ArgumentParser(description='Launch the server')
     parser.add_argument('--migrate', default=False, action='store_true',
                         help='Run the pending migrations')
+    parser.add_argument('--gc', default=False, action='store_true',
+                        help='Remove the revisions not kept by the retention policy of the '
+                             'config (keep_revisions, keep_revisions_days) and exit')
+    parser.add_argument('--dry-run', default=False, action='store_true',
+                        help='With --gc, only report what would be removed')
     args = parser.parse_args()
     launcher = ServerLauncher(force_migration=args.migrate)
-    launcher.launch()
+    if args.gc:
+        launcher.collect_garbage(args.dry_run)
+    else:
+        launcher.launch()
 
 
 if __name__ == '__main__':
@@ -13,6 +13,7 @@ from subprocess import CalledProcessError
 
 from conans.util.env_reader import get_env
 from conans.util.files import decode_text
+from conans.util.profiling import profile_span
 
 
 class CalledProcessErrorWithStderr(CalledProcessError):
@@ -31,7 +32,8 @@ def conanfile_exception_formatter(conanfile_name, func_name):
     :return:
     """
     try:
-        yield
+        with profile_span(func_name, "recipe", conanfile=conanfile_name):
+            yield
     except ConanInvalidConfiguration as exc:
         msg = "{}: Invalid configuration: {}".format(conanfile_name, exc)  # TODO: Move from here?
         raise ConanInvalidConfiguration(msg)
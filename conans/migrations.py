@@ -7,6 +7,20 @@ from conans.util.files import load, save
 CONAN_VERSION = "version.txt"
 
 
+def _load_version(conf_path):
+    try:
+        tmp = load(os.path.join(conf_path, CONAN_VERSION))
+        return Version(tmp)
+    except Exception:
+        return None
+
+
+def migration_needed(conf_path, current_version):
+    """ cheap check, without importing the migrations, of a cache used by other Conan version
+    """
+    return _load_version(conf_path) != current_version
+
+
 class Migrator(object):
 
     def __init__(self, conf_path, store_path, current_version, out):
@@ -37,9 +51,4 @@ class Migrator(object):
             raise ConanException("Can't write version file in %s" % self.file_version_path)
 
     def _load_old_version(self):
-        try:
-            tmp = load(self.file_version_path)
-            old_version = Version(tmp)
-        except Exception:
-            old_version = None
-        return old_version
+        return _load_version(self.conf_path)
@@ -133,33 +133,77 @@ class CppInfo(_CppInfo):
         return self.configs.setdefault(config, _get_cpp_info())
 
 
+def _merge_lists(seqs):
+    """ The same result than merging every list into the result of the previous ones with
+    [s for s in result if s not in seq] + seq, the items are kept in their last appearance, but
+    in linear time
+    """
+    last = {}
+    for index, seq in enumerate(seqs):
+        for item in seq:
+            last[item] = index
+    return [item for index, seq in enumerate(seqs) for item in seq if last[item] == index]
+
+
+def _merge_lists_reversed(seqs):
+    """ The same result than merging every list into the result of the previous ones with
+    [s for s in seq if s not in result] + result, the items are kept in their first appearance
+    and the later lists go first, but in linear time
+    """
+    first = {}
+    for index, seq in enumerate(seqs):
+        for item in seq:
+            first.setdefault(item, index)
+    return [item for index in reversed(range(len(seqs))) for item in seqs[index]
+            if first[item] == index]
+
+
 class _BaseDepsCppInfo(_CppInfo):
     def __init__(self):
         super(_BaseDepsCppInfo, self).__init__()
 
     def update(self, dep_cpp_info):
-
-        def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
-
-        self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
-        self.srcdirs = merge_lists(self.srcdirs, dep_cpp_info.src_paths)
-        self.libdirs = merge_lists(self.libdirs, dep_cpp_info.lib_paths)
-        self.bindirs = merge_lists(self.bindirs, dep_cpp_info.bin_paths)
-        self.resdirs = merge_lists(self.resdirs, dep_cpp_info.res_paths)
-        self.builddirs = merge_lists(self.builddirs, dep_cpp_info.build_paths)
-        self.libs = merge_lists(self.libs, dep_cpp_info.libs)
-        self.rootpaths.append(dep_cpp_info.rootpath)
+        self._update_all([dep_cpp_info])
+
+    def _update_all(self, dep_cpp_infos):
+        """ same as calling update() for each one of the dep_cpp_infos, in order
+        """
+        def merge_lists(seq, dep_seqs):
+            return _merge_lists([seq] + dep_seqs)
+
+        def merge_lists_reversed(seq, dep_seqs):
+            return _merge_lists_reversed([seq] + dep_seqs)
+
+        deps = dep_cpp_infos
+        self.includedirs = merge_lists(self.includedirs, [d.include_paths for d in deps])
+        self.srcdirs = merge_lists(self.srcdirs, [d.src_paths for d in deps])
+        self.libdirs = merge_lists(self.libdirs, [d.lib_paths for d in deps])
+        self.bindirs = merge_lists(self.bindirs, [d.bin_paths for d in deps])
+        self.resdirs = merge_lists(self.resdirs, [d.res_paths for d in deps])
+        self.builddirs = merge_lists(self.builddirs, [d.build_paths for d in deps])
+        self.libs = merge_lists(self.libs, [d.libs for d in deps])
 
         # Note these are in reverse order
-        self.defines = merge_lists(dep_cpp_info.defines, self.defines)
-        self.cxxflags = merge_lists(dep_cpp_info.cxxflags, self.cxxflags)
-        self.cflags = merge_lists(dep_cpp_info.cflags, self.cflags)
-        self.sharedlinkflags = merge_lists(dep_cpp_info.sharedlinkflags, self.sharedlinkflags)
-        self.exelinkflags = merge_lists(dep_cpp_info.exelinkflags, self.exelinkflags)
-
-        if not self.sysroot:
-            self.sysroot = dep_cpp_info.sysroot
+        self.defines = merge_lists_reversed(self.defines, [d.defines for d in deps])
+        self.cxxflags = merge_lists_reversed(self.cxxflags, [d.cxxflags for d in deps])
+        self.cflags = merge_lists_reversed(self.cflags, [d.cflags for d in deps])
+        self.sharedlinkflags = merge_lists_reversed(self.sharedlinkflags,
+                                                    [d.sharedlinkflags for d in deps])
+        self.exelinkflags = merge_lists_reversed(self.exelinkflags,
+                                                 [d.exelinkflags for d in deps])
+
+        for dep_cpp_info in deps:
+            self.rootpaths.append(dep_cpp_info.rootpath)
+            if not self.sysroot:
+                self.sysroot = dep_cpp_info.sysroot
+
+    def copy(self):
+        """ a new object with copies of the lists, so they can be modified independently
+        """
+        result = type(self)()
+        for name, value in vars(self).items():
+            setattr(result, name, list(value) if isinstance(value, list) else value)
+        return result
 
     @property
     def include_paths(self):
@@ -213,13 +257,28 @@ class DepsCppInfo(_BaseDepsCppInfo):
         return self._dependencies[item]
 
     def update(self, dep_cpp_info, pkg_name):
-        assert isinstance(dep_cpp_info, CppInfo)
-        self._dependencies[pkg_name] = dep_cpp_info
-        super(DepsCppInfo, self).update(dep_cpp_info)
-        for config, cpp_info in dep_cpp_info.configs.items():
-            self.configs.setdefault(config, _BaseDepsCppInfo()).update(cpp_info)
+        self.update_all([(pkg_name, dep_cpp_info)])
+
+    def update_all(self, dependencies):
+        """ same as calling update() for each (pkg_name, dep_cpp_info) of the dependencies, in
+        order, but aggregating all of them at once in linear time
+        """
+        configs = OrderedDict()
+        for pkg_name, dep_cpp_info in dependencies:
+            assert isinstance(dep_cpp_info, CppInfo)
+            self._dependencies[pkg_name] = dep_cpp_info
+            for config, cpp_info in dep_cpp_info.configs.items():
+                configs.setdefault(config, []).append(cpp_info)
+        self._update_all([dep_cpp_info for _, dep_cpp_info in dependencies])
+        for config, cpp_infos in configs.items():
+            self.configs.setdefault(config, _BaseDepsCppInfo())._update_all(cpp_infos)
 
     def update_deps_cpp_info(self, dep_cpp_info):
         assert isinstance(dep_cpp_info, DepsCppInfo)
-        for pkg_name, cpp_info in dep_cpp_info.dependencies:
-            self.update(cpp_info, pkg_name)
+        self.update_all(list(dep_cpp_info.dependencies))
+
+    def copy(self):
+        result = super(DepsCppInfo, self).copy()
+        result._dependencies = OrderedDict(self._dependencies)
+        result.configs = {config: cpp_info.copy() for config, cpp_info in self.configs.items()}
+        return result
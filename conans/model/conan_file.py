@@ -3,6 +3,7 @@ from contextlib import contextmanager
 
 from conans.client import tools
 from conans.client.output import Color, ScopedOutput
+from conans.client.run_environment import RunEnvironment
 from conans.client.tools.env import environment_append, no_op, pythonpath
 from conans.client.tools.oss import OSInfo
 from conans.errors import ConanException, ConanInvalidConfiguration
@@ -77,6 +78,98 @@ def get_env_context_manager(conanfile, without_python=False):
     return _env_and_python(conanfile)
 
 
+def _environment_vars(env_vars, environ):
+    """ the environment that tools.environment_append(env_vars) would define over the environ
+    dict, without modifying os.environ
+    """
+    ret = dict(environ)
+    for name, value in env_vars.items():
+        if value is None:
+            ret.pop(name, None)
+            continue
+        if isinstance(value, list):
+            value = os.pathsep.join(value)
+            old = environ.get(name)
+            if old:
+                value += os.pathsep + old
+        ret[name] = value
+    return ret
+
+
+class ExecutionContext(object):
+    """ The working directory and environment variables of a recipe method. self.run() and the
+    build helpers use them explicitly for the commands, instead of the current directory and
+    os.environ of the process, that are shared by all the threads. The default None values
+    are the current ones of the process, for the recipes that rely on the global state
+    """
+
+    def __init__(self, cwd=None, env=None):
+        self.cwd = cwd
+        self.env = env
+
+    @property
+    def environ(self):
+        return os.environ if self.env is None else self.env
+
+    def abspath(self, path):
+        return os.path.abspath(os.path.join(self.cwd, path) if self.cwd else path)
+
+    def append(self, env_vars):
+        """ a new context with the env_vars appended, as tools.environment_append() """
+        return ExecutionContext(self.cwd, _environment_vars(env_vars, self.environ))
+
+
+@contextmanager
+def conanfile_execution(conanfile, cwd, apply_env=True):
+    """ executes a recipe method in the cwd folder, with the environment of the recipe, or the
+    one of the current execution if apply_env=False. As a compatibility layer for the recipes
+    with "global_state = True" (default), they are the current directory and os.environ of the
+    process while the method runs. Otherwise they are only given explicitly in the
+    conanfile.execution_context, so different recipes can run in different threads
+    """
+    if conanfile.global_state:
+        env_manager = get_env_context_manager(conanfile) if apply_env else no_op()
+        with env_manager:
+            with tools.chdir(cwd):
+                yield
+        return
+
+    previous = conanfile.execution_context
+    env = previous.env
+    if apply_env and conanfile.apply_env:
+        env = _environment_vars(conanfile.env, previous.environ)
+    conanfile.execution_context = ExecutionContext(cwd, env)
+    try:
+        yield
+    finally:
+        conanfile.execution_context = previous
+
+
+@contextmanager
+def conanfile_environment_append(conanfile, env_vars):
+    """ tools.environment_append() for the commands of the build helpers, that only modifies
+    the explicit environment of the execution context of the recipe if it has one
+    """
+    context = getattr(conanfile, "execution_context", None)
+    if context is None or context.env is None:
+        with environment_append(env_vars):
+            yield
+        return
+
+    conanfile.execution_context = context.append(env_vars)
+    try:
+        yield
+    finally:
+        conanfile.execution_context = context
+
+
+def conanfile_environ(conanfile):
+    """ the environment variables of the commands of the recipe, os.environ by default
+    """
+    context = getattr(conanfile, "execution_context", None)
+    return os.environ if context is None else context.environ
+
+
 class ConanFile(object):
     """ The base class for all package recipes
     """
@@ -94,6 +187,9 @@ class ConanFile(object):
     build_policy = None
     short_paths = False
     apply_env = True  # Apply environment variables from requires deps_env_info and profiles
+    cache_package_info = True  # package_info() results only depend on the package and its config
+    global_state = True  # Methods run with os.chdir() and os.environ changes, not thread-safe
+    execution_context = ExecutionContext()  # The current method one, if not global_state
     exports = None
     exports_sources = None
     generators = ["txt"]
@@ -252,13 +348,26 @@ class ConanFile(object):
 
     def run(self, command, output=True, cwd=None, win_bash=False, subsystem=None, msys_mingw=True,
             ignore_errors=False, run_environment=False, with_login=True):
+        context = self.execution_context
+        if context.cwd:
+            cwd = os.path.join(context.cwd, cwd) if cwd else context.cwd
+
         def _run():
             if not win_bash:
-                return self._conan_runner(command, output, os.path.abspath(RUN_LOG_NAME), cwd)
+                log_filepath = context.abspath(RUN_LOG_NAME)
+                if context.env is None:
+                    return self._conan_runner(command, output, log_filepath, cwd)
+                return self._conan_runner(command, output, log_filepath, cwd, env=context.env)
             # FIXME: run in windows bash is not using output
             return tools.run_in_windows_bash(self, bashcmd=command, cwd=cwd, subsystem=subsystem,
                                              msys_mingw=msys_mingw, with_login=with_login)
-        if run_environment:
+        if run_environment and context.env is not None:
+            context = context.append(RunEnvironment(self).vars)
+            if OSInfo().is_macos:
+                command = 'DYLD_LIBRARY_PATH="%s" %s' % (context.env.get('DYLD_LIBRARY_PATH', ''),
+                                                         command)
+            retcode = _run()
+        elif run_environment:
             with tools.run_environment(self):
                 if OSInfo().is_macos:
                     command = 'DYLD_LIBRARY_PATH="%s" %s' % (os.environ.get('DYLD_LIBRARY_PATH', ''),
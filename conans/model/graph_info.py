@@ -4,8 +4,7 @@ import os
 from conans.errors import ConanException
 from conans.model.options import OptionsValues
 from conans.model.ref import ConanFileReference
-from conans.tools import save
-from conans.util.files import load
+from conans.util.files import load, save
 from conans.model.graph_lock import GraphLockFile, LOCKFILE
 
 
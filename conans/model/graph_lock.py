@@ -106,6 +106,8 @@ class GraphLock(object):
 
     def __init__(self, graph=None):
         self._nodes = {}  # {numeric id: PREF or None}
+        self._inverse = {}  # {numeric id: set(ids of the nodes requiring it)}
+        self._root_id = None
         if graph:
             for node in graph.nodes:
                 if node.recipe == RECIPE_VIRTUAL:
@@ -127,17 +129,40 @@ class GraphLock(object):
                 graph_node = GraphLockNode(node.pref if node.ref else None, python_reqs,
                                            node.conanfile.options.values, False, requires)
                 self._nodes[node.id] = graph_node
+            self._build_index()
+
+    def _build_index(self):
+        """ the reverse edges of the graph, to find the nodes depending on a given one without
+        visiting all of them. Must be called when the nodes or their requires change
+        """
+        self._inverse = {id_: set() for id_ in self._nodes}
+        for id_, node in self._nodes.items():
+            for require_id in node.requires.values():
+                self._inverse.setdefault(require_id, set()).add(id_)
+        self._root_id = None
+
+    def _set_node(self, node_id, node):
+        old_node = self._nodes.get(node_id)
+        old_requires = set(old_node.requires.values()) if old_node else set()
+        new_requires = set(node.requires.values())
+        self._nodes[node_id] = node
+        self._inverse.setdefault(node_id, set())
+        if old_requires != new_requires:
+            for require_id in old_requires - new_requires:
+                self._inverse[require_id].discard(node_id)
+            for require_id in new_requires - old_requires:
+                self._inverse.setdefault(require_id, set()).add(node_id)
+            self._root_id = None
 
     def root_node(self):
         """ obtain the node in the graph that is not depended by anyone else,
         i.e. the root or downstream consumer
         """
-        total = []
-        for node in self._nodes.values():
-            total.extend(node.requires.values())
-        roots = set(self._nodes).difference(total)
-        assert len(roots) == 1
-        return self._nodes[roots.pop()]
+        if self._root_id is None:
+            roots = [id_ for id_ in self._nodes if not self._inverse.get(id_)]
+            assert len(roots) == 1
+            self._root_id = roots[0]
+        return self._nodes[self._root_id]
 
     @staticmethod
     def from_dict(data):
@@ -146,7 +171,7 @@ class GraphLock(object):
         graph_lock = GraphLock()
         for id_, node in data["nodes"].items():
             graph_lock._nodes[id_] = GraphLockNode.from_dict(node)
-
+        graph_lock._build_index()
         return graph_lock
 
     def as_dict(self):
@@ -173,20 +198,21 @@ class GraphLock(object):
                     if not old_node.pref.is_compatible_with(node.pref):
                         raise ConanException("Lockfile had already modified %s" % str(node.pref))
                 node.modified = True
-                self._nodes[id_] = node
+                self._set_node(id_, node)
 
     def _closure_affected(self):
         """ returns all the IDs of the nodes that depend directly or indirectly of some
         package marked as "modified"
         """
         closure = set()
-        current = [id_ for id_, node in self._nodes.items() if node.modified]
+        current = set(id_ for id_, node in self._nodes.items() if node.modified)
         # closure.update(current)
         while current:
             new_current = set()
             for n in current:
                 new_neighs = self._inverse_neighbors(n)
-                to_add = set(new_neighs).difference(current)
+                # The ones already in the closure have been already visited
+                to_add = new_neighs.difference(current, closure)
                 new_current.update(to_add)
                 closure.update(to_add)
             current = new_current
@@ -197,11 +223,7 @@ class GraphLock(object):
         """ return all the nodes that have an edge to the "node_id". Useful for computing
         the set of nodes affected downstream by a change in one package
         """
-        result = []
-        for id_, node in self._nodes.items():
-            if node_id in node.requires.values():
-                result.append(id_)
-        return result
+        return self._inverse.get(node_id, set())
 
     def update_check_graph(self, deps_graph, output):
         """ update the lockfile, checking for security that only nodes that are being built
@@ -16,6 +16,13 @@ PREV_UNKNOWN = "PREV unknown"
 PACKAGE_ID_UNKNOWN = "Package_ID_unknown"
 
 
+def _pref_sort_key(pref):
+    # Same order as comparing the PackageReference, but way faster to sort many of them
+    ref = pref.ref
+    return (ref.name, ref.version, ref.user or "", ref.channel or "", ref.revision or "",
+            pref.id, pref.revision or "")
+
+
 class RequirementInfo(object):
 
     def __init__(self, pref, default_package_id_mode, indirect=False):
@@ -36,7 +43,7 @@ class RequirementInfo(object):
 
     def copy(self):
         # Useful for build_id()
-        result = RequirementInfo(self.package, "unrelated_mode")
+        result = RequirementInfo(self.package, "unrelated_mode", self._indirect)
         for f in ("name", "version", "user", "channel", "recipe_revision", "package_id",
                   "package_revision"):
 
@@ -211,7 +218,7 @@ class RequirementsInfo(object):
         result = []
         # Remove requirements without a name, i.e. indirect transitive requirements
         data = {k: v for k, v in self._data.items() if v.name}
-        for key in sorted(data):
+        for key in sorted(data, key=_pref_sort_key):
             s = data[key].sha
             if s is None:
                 return None
@@ -220,7 +227,7 @@ class RequirementsInfo(object):
 
     def dumps(self):
         result = []
-        for ref in sorted(self._data):
+        for ref in sorted(self._data, key=_pref_sort_key):
             dumped = self._data[ref].dumps()
             if dumped:
                 result.append(dumped)
@@ -289,13 +296,20 @@ class _PackageReferenceList(list):
 
 class ConanInfo(object):
 
-    def copy(self):
-        """ Useful for build_id implementation
+    def copy(self, full=False):
+        """ Useful for build_id implementation. The full copy also contains the original
+        inputs, to reuse the result of a package_id computation
         """
         result = ConanInfo()
         result.settings = self.settings.copy()
         result.options = self.options.copy()
         result.requires = self.requires.copy()
+        if full:
+            result.full_settings = self.full_settings.copy()
+            result.full_options = self.full_options.copy()
+            result.full_requires = _PackageReferenceList(self.full_requires)
+            result.recipe_hash = self.recipe_hash
+            result.env_values = self.env_values.copy()
         return result
 
     @staticmethod
@@ -2,7 +2,6 @@
 import fnmatch
 
 import six
-import yaml
 
 from conans.errors import ConanException
 from conans.util.sha import sha1
@@ -57,8 +56,10 @@ class PackageOptionValues(object):
     Used for UserOptions, which is a dict{package_name: PackageOptionValues}
     """
     def __init__(self):
-        self._dict = {}  # {option_name: PackageOptionValue}
-        self._modified = {}
+        # Not using __setattr__(), there are millions of these objects in big graphs
+        self.__dict__.update(_dict={},  # {option_name: PackageOptionValue}
+                             _modified={},
+                             _sha=None)  # Cached value of the "sha" property, reset by changes
 
     def __bool__(self):
         return bool(self._dict)
@@ -75,19 +76,22 @@ class PackageOptionValues(object):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._sha = None
 
     def clear(self):
         self._dict.clear()
+        self._sha = None
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(PackageOptionValues, self).__setattr__(attr, value)
         self._dict[attr] = PackageOptionValue(value)
+        self._sha = None
 
     def copy(self):
         result = PackageOptionValues()
-        for k, v in self._dict.items():
-            result._dict[k] = v
+        result._dict.update(self._dict)
+        result.__dict__["_sha"] = self._sha
         return result
 
     @property
@@ -104,16 +108,21 @@ class PackageOptionValues(object):
         assert isinstance(option_text, six.string_types)
         name, value = option_text.split("=")
         self._dict[name.strip()] = PackageOptionValue(value.strip())
+        self._sha = None
 
     def add_option(self, option_name, option_value):
         self._dict[option_name] = PackageOptionValue(option_value)
+        self._sha = None
 
     def update(self, other):
         assert isinstance(other, PackageOptionValues)
-        self._dict.update(other._dict)
+        if other._dict:
+            self._dict.update(other._dict)
+            self._sha = None
 
     def remove(self, option_name):
         del self._dict[option_name]
+        self._sha = None
 
     def freeze(self):
         self._freeze = True
@@ -142,20 +151,23 @@ class PackageOptionValues(object):
             else:
                 self._modified[name] = (value, down_ref)
                 self._dict[name] = value
+                self._sha = None
 
     def serialize(self):
         return self.items()
 
     @property
     def sha(self):
-        result = []
-        for name, value in self.items():
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value:
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for name, value in self.items():
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value:
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
 
 
 class OptionsValues(object):
@@ -250,6 +262,7 @@ class OptionsValues(object):
             v.clear()
 
     def filter_used(self, used_pkg_names):
+        used_pkg_names = set(used_pkg_names)
         self._reqs_options = {k: v for k, v in self._reqs_options.items() if k in used_pkg_names}
 
     def as_list(self):
@@ -377,7 +390,8 @@ class PackageOptions(object):
 
     @staticmethod
     def loads(text):
-        return PackageOptions(yaml.safe_load(text) or {})
+        from conans.util.yaml_loader import safe_load
+        return PackageOptions(safe_load(text) or {})
 
     def get_safe(self, field):
         return self._data.get(field)
@@ -614,6 +628,6 @@ class Options(object):
         """ remove all options not related to the passed references,
         that should be the upstream requirements
         """
-        existing_names = [r.ref.name for r in references]
+        existing_names = set(r.ref.name for r in references)
         self._deps_package_values = {k: v for k, v in self._deps_package_values.items()
                                      if k in existing_names}
@@ -58,6 +58,10 @@ class RestRoutes(object):
     def package_revision_files(self):
         return '%s/files' % self.package_revision
 
+    @property
+    def package_revision_delta(self):
+        return '%s/delta' % self.package_revision
+
     @property
     def package_revision_latest(self):
         return '%s/latest' % self.package_recipe_revision
@@ -1,5 +1,3 @@
-import yaml
-
 from conans.errors import ConanException
 from conans.model.values import Values
 
@@ -233,7 +231,8 @@ class Settings(object):
 
     @staticmethod
     def loads(text):
-        return Settings(yaml.safe_load(text) or {})
+        from conans.util.yaml_loader import safe_load
+        return Settings(safe_load(text) or {})
 
     def validate(self):
         for field in self.fields:
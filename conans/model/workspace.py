@@ -2,13 +2,12 @@ import os
 
 from collections import OrderedDict
 
-import yaml
-
 from conans.client.graph.graph import RECIPE_EDITABLE
 from conans.errors import ConanException
 from conans.model.editable_layout import get_editable_abs_path, EditableLayout
 from conans.model.ref import ConanFileReference
 from conans.util.files import load, save
+from conans.util.yaml_loader import safe_load
 
 
 class LocalPackage(object):
@@ -117,7 +116,7 @@ class Workspace(object):
         return self._root
 
     def _loads(self, text):
-        yml = yaml.safe_load(text)
+        yml = safe_load(text)
         self._ws_generator = yml.pop("workspace_generator", None)
         yml.pop("name", None)
         ws_layout = yml.pop("layout", None)
@@ -14,7 +14,9 @@ from conans.client import tools
 from conans.errors import ConanException
 from conans.paths import conan_expand_user
 from conans.server.conf.default_server_conf import default_server_conf
+from conans.server.metrics import TimedProxy
 from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.s3_adapter import S3Client, S3StorageAdapter
 from conans.server.store.server_store import ServerStore
 from conans.util.env_reader import get_env
 from conans.util.files import mkdir, save
@@ -47,6 +49,12 @@ class ConanServerConfigParser(ConfigParser):
                            "ssl_enabled": get_env("CONAN_SSL_ENABLED", None, environment),
                            "port": get_env("CONAN_SERVER_PORT", None, environment),
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
+                           "workers": get_env("CONAN_SERVER_WORKERS", None, environment),
+                           "threads": get_env("CONAN_SERVER_THREADS", None, environment),
+                           "log_requests": get_env("CONAN_SERVER_LOG_REQUESTS", None, environment),
+                           "keep_revisions": get_env("CONAN_SERVER_KEEP_REVISIONS", None, environment),
+                           "keep_revisions_days": get_env("CONAN_SERVER_KEEP_REVISIONS_DAYS", None, environment),
+                           "gc_interval_hours": get_env("CONAN_SERVER_GC_INTERVAL_HOURS", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
                            # "user:pass,user2:pass2"
@@ -103,6 +111,50 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return self.port
 
+    @property
+    def workers(self):
+        try:
+            return int(self._get_conf_server_string("workers"))
+        except ConanException:
+            return 1
+
+    @property
+    def threads(self):
+        try:
+            return int(self._get_conf_server_string("threads"))
+        except ConanException:
+            return 1
+
+    @property
+    def log_requests(self):
+        try:
+            log_requests = self._get_conf_server_string("log_requests").lower()
+            return log_requests == "true" or log_requests == "1"
+        except ConanException:
+            return False
+
+    def _get_optional_number(self, keyname, number_type=int):
+        try:
+            return number_type(self._get_conf_server_string(keyname))
+        except ConanException:
+            return None
+
+    @property
+    def keep_revisions(self):
+        """Number of latest revisions of every recipe and package to keep, None for all"""
+        return self._get_optional_number("keep_revisions")
+
+    @property
+    def keep_revisions_days(self):
+        """Days the revisions are kept at least, None for forever"""
+        return self._get_optional_number("keep_revisions_days", float)
+
+    @property
+    def gc_interval(self):
+        """Seconds between the removals of the revisions not kept, None to not run them"""
+        hours = self._get_optional_number("gc_interval_hours", float)
+        return hours * 3600 if hours else None
+
     @property
     def host_name(self):
         try:
@@ -143,6 +195,20 @@ class ConanServerConfigParser(ConfigParser):
         mkdir(ret)
         return ret
 
+    @property
+    def s3_storage(self):
+        """The [s3_storage] section as a dict, None if there is no such section"""
+        try:
+            section = dict(self._get_file_conf("s3_storage"))
+        except ConanException:
+            return None
+        ret = {"region": section.get("region") or "us-east-1"}
+        for varname in ("endpoint", "bucket", "access_key", "secret_key"):
+            if not section.get(varname):
+                raise ConanException("Invalid configuration, missing s3_storage: %s" % varname)
+            ret[varname] = section[varname]
+        return ret
+
     @property
     def read_permissions(self):
         if self.env_config["read_permissions"]:
@@ -220,9 +286,18 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_server_store(disk_storage_path, public_url, updown_auth_manager):
+def get_server_store(disk_storage_path, public_url, updown_auth_manager, metrics=None,
+                     s3_storage=None):
+    """s3_storage: dict with the S3Client arguments to also store the archives in a bucket"""
     disk_controller_url = "%s/%s" % (public_url, "files")
     if not updown_auth_manager:
         raise Exception("Updown auth manager needed for disk controller (not s3)")
-    adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
+    if s3_storage:
+        expires = updown_auth_manager.expire_time.total_seconds()
+        adapter = S3StorageAdapter(disk_controller_url, disk_storage_path, updown_auth_manager,
+                                   S3Client(**s3_storage), expires)
+    else:
+        adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
+    if metrics:
+        adapter = TimedProxy(adapter, metrics, "storage")
     return ServerStore(adapter)
@@ -10,6 +10,18 @@ port: 9300
 # Public port where files will be served. If empty will be used "port"
 public_port:
 host_name: localhost
+# Processes (only in systems with fork) and threads per process serving the requests
+workers: 1
+threads: 8
+# Print the time of every request. Metrics are always available in the /metrics endpoint
+log_requests: False
+
+# Revisions of every recipe and package kept: the "keep_revisions" latest ones and also the
+# ones newer than "keep_revisions_days". The rest are removed by "conan_server --gc" and, every
+# "gc_interval_hours", by the server. Empty values keep all the revisions
+keep_revisions:
+keep_revisions_days:
+gc_interval_hours:
 
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
@@ -20,6 +32,15 @@ disk_storage_path: ./data
 disk_authorize_timeout: 1800
 updown_secret: {updown_secret}
 
+# Uncomment to also store the recipe and package archives in a S3 compatible bucket (AWS,
+# MinIO...). Their API v2 downloads are redirected to presigned URLs of the bucket, valid for
+# authorize_timeout seconds. The other files and the metadata are only in disk_storage_path
+# [s3_storage]
+# endpoint: https://s3.us-east-1.amazonaws.com
+# bucket: conan
+# region: us-east-1
+# access_key:
+# secret_key:
 
 # Check docs.conan.io to implement a different authenticator plugin for conan_server
 # if custom_authenticator is not specified, [users] section will be used to authenticate
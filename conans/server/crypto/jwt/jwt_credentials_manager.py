@@ -1,4 +1,11 @@
+import hashlib
+import time
+
 from conans.server.crypto.jwt.jwt_manager import JWTManager
+from conans.util.lru import LRUCache
+
+# Max number of verified tokens remembered, the least recently used ones are verified again
+VERIFIED_TOKENS_CACHE_SIZE = 1000
 
 
 class JWTCredentialsManager(JWTManager):
@@ -6,6 +13,7 @@ class JWTCredentialsManager(JWTManager):
 
     def __init__(self, secret, expire_time):
         super(JWTCredentialsManager, self).__init__(secret, expire_time)
+        self._verified_tokens = LRUCache(VERIFIED_TOKENS_CACHE_SIZE)
 
     def get_token_for(self, brl_user):
         """Generates a token with the brl_user and additional data dict if needed"""
@@ -14,6 +22,21 @@ class JWTCredentialsManager(JWTManager):
     def get_user(self, token):
         """Gets the user from credentials object. None if no credentials.
         Can raise jwt.ExpiredSignature and jwt.DecodeError"""
+        key = _token_digest(token)
+        verified = self._verified_tokens.get(key)
+        if verified is not None:
+            username, expiration = verified
+            if expiration is None or expiration > time.time():
+                return username
+            self._verified_tokens.pop(key)  # Expired, the decode will raise
+
         profile = self.get_profile(token)
         username = profile.get("user", None)
+        self._verified_tokens.put(key, (username, profile.get("exp")))
         return username
+
+
+def _token_digest(token):
+    if not isinstance(token, bytes):
+        token = token.encode("utf-8")
+    return hashlib.sha256(token).hexdigest()
@@ -1,17 +1,23 @@
 #!/usr/bin/python
+import logging
 import os
+import sys
 
 from conans import SERVER_CAPABILITIES, REVISIONS
+from conans.client.tools.files import human_size
 from conans.paths import conan_expand_user
 from conans.server.conf import get_server_store
 
 from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
 from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.metrics import ServerMetrics
 from conans.server.migrate import migrate_and_get_server_config
 from conans.server.plugin_loader import load_authentication_plugin
+from conans.server.rest.bottle_plugins.metrics import requests_logger
 from conans.server.rest.server import ConanServer
 
 from conans.server.service.authorize import BasicAuthorizer, BasicAuthenticator
+from conans.server.store.garbage_collector import RetentionPolicy, RevisionsGarbageCollector
 
 
 class ServerLauncher(object):
@@ -35,24 +41,50 @@ class ServerLauncher(object):
         updown_auth_manager = JWTUpDownAuthManager(server_config.updown_secret,
                                                    server_config.authorize_timeout)
 
+        metrics = ServerMetrics()
         server_store = get_server_store(server_config.disk_storage_path,
                                         server_config.public_url,
-                                        updown_auth_manager=updown_auth_manager)
+                                        updown_auth_manager=updown_auth_manager,
+                                        metrics=metrics,
+                                        s3_storage=server_config.s3_storage)
+        policy = RetentionPolicy(server_config.keep_revisions, server_config.keep_revisions_days)
+        self._garbage_collector = RevisionsGarbageCollector(server_store, policy)
+        self._gc_interval = server_config.gc_interval if policy.enabled else None
+        log_requests = server_config.log_requests
+        if log_requests:
+            requests_logger.setLevel(logging.INFO)
+            requests_logger.propagate = False
+            requests_logger.addHandler(logging.StreamHandler(sys.stdout))
 
+        self._workers = server_config.workers
+        self._threads = server_config.threads
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
 
         self.server = ConanServer(server_config.port, credentials_manager, updown_auth_manager,
                                   authorizer, authenticator, server_store,
-                                  server_capabilities)
+                                  server_capabilities, metrics, log_requests)
         if not self.force_migration:
             print("***********************")
             print("Using config: %s" % server_config.config_filename)
             print("Storage: %s" % server_config.disk_storage_path)
+            if server_config.s3_storage:
+                print("S3 storage: %s/%s" % (server_config.s3_storage["endpoint"],
+                                             server_config.s3_storage["bucket"]))
             print("Public URL: %s" % server_config.public_url)
             print("PORT: %s" % server_config.port)
+            print("Workers: %s, threads: %s" % (self._workers, self._threads))
             print("***********************")
 
     def launch(self):
         if not self.force_migration:
-            self.server.run(host="0.0.0.0")
+            if self._gc_interval:
+                self._garbage_collector.run_periodically(self._gc_interval)
+            self.server.run(host="0.0.0.0", workers=self._workers, threads=self._threads)
+
+    def collect_garbage(self, dry_run=False):
+        """Removes the revisions not kept by the retention policy of the config"""
+        report = self._garbage_collector.run(dry_run)
+        print("%s %d recipe revisions, %d package revisions and %d unused files: %s"
+              % ("Would remove" if dry_run else "Removed", report.recipe_revisions,
+                 report.package_revisions, report.blobs, human_size(report.bytes)))
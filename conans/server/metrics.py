@@ -0,0 +1,122 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds, the same as the default ones of the Prometheus clients
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+METRICS_HELP = {
+    "conan_server_requests_total": ("counter", "Requests by route and response status"),
+    "conan_server_request_duration_seconds": ("histogram", "Time serving the requests"),
+    "conan_server_request_bytes_total": ("counter", "Bytes received in the request bodies"),
+    "conan_server_response_bytes_total": ("counter", "Bytes sent in the response bodies, only "
+                                                     "the responses with a known length"),
+    "conan_server_operation_duration_seconds": ("histogram", "Time of the authentication, "
+                                                             "credentials and storage operations"),
+}
+
+
+class _Histogram(object):
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class ServerMetrics(object):
+    """ Counters and histograms of the server, with labels, reported in the Prometheus text
+    format. They are kept in memory, so every worker process of the server has its own ones
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(DURATION_BUCKETS)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(name, time.time() - start, **labels)
+
+    def dumps(self):
+        """ Prometheus text exposition format """
+        lines = []
+        with self._lock:
+            samples = {}
+            for (name, labels), value in self._counters.items():
+                samples.setdefault(name, []).append((name, labels, value))
+            for (name, labels), histogram in self._histograms.items():
+                series = samples.setdefault(name, [])
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    series.append(("%s_bucket" % name, labels + (("le", repr(float(bound))), ),
+                                   count))
+                series.append(("%s_bucket" % name, labels + (("le", "+Inf"), ), histogram.count))
+                series.append(("%s_sum" % name, labels, histogram.sum))
+                series.append(("%s_count" % name, labels, histogram.count))
+
+        for name in sorted(samples):
+            metric_type, help_text = METRICS_HELP.get(name, ("untyped", name))
+            lines.append("# HELP %s %s" % (name, help_text))
+            lines.append("# TYPE %s %s" % (name, metric_type))
+            for sample_name, labels, value in samples[name]:
+                if labels:
+                    labels = ",".join('%s="%s"' % (k, _escape(v)) for k, v in labels)
+                    lines.append("%s{%s} %s" % (sample_name, labels, value))
+                else:
+                    lines.append("%s %s" % (sample_name, value))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class TimedProxy(object):
+    """ Forwards everything to the wrapped object, measuring the time of the public methods as
+    "conan_server_operation_duration_seconds" with the given component label
+    """
+
+    def __init__(self, wrapped, metrics, component):
+        self._wrapped = wrapped
+        self._metrics = metrics
+        self._component = component
+
+    def __getattr__(self, name):
+        attr = getattr(self._wrapped, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+            with self._metrics.timer("conan_server_operation_duration_seconds",
+                                     component=self._component, operation=name):
+                return attr(*args, **kwargs)
+        return timed
@@ -3,6 +3,7 @@ from bottle import Bottle
 from conans.errors import EXCEPTION_CODE_MAPPING
 from conans.server.rest.bottle_plugins.http_basic_authentication import HttpBasicAuthentication
 from conans.server.rest.bottle_plugins.jwt_authentication import JWTAuthentication
+from conans.server.rest.bottle_plugins.metrics import MetricsPlugin
 from conans.server.rest.bottle_plugins.return_handler import ReturnHandlerPlugin
 from conans.server.rest.controller.common.ping import PingController
 from conans.server.rest.controller.common.users import UsersController
@@ -14,6 +15,9 @@ from conans.server.rest.controller.v1.search import SearchController
 
 
 class ApiV1(Bottle):
+    version = "v1"
+    metrics = None
+    log_requests = False
 
     def __init__(self, credentials_manager, updown_auth_manager,
                  server_capabilities, *argc, **argv):
@@ -42,6 +46,10 @@ class ApiV1(Bottle):
             FileUploadDownloadController().attach_to(self)
 
     def install_plugins(self):
+        # First, the outermost, measure the whole request
+        if self.metrics:
+            self.install(MetricsPlugin(self.metrics, self.version, self.log_requests))
+
         # Second, check Http Basic Auth
         self.install(HttpBasicAuthentication())
 
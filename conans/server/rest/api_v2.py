@@ -10,6 +10,7 @@ from conans.server.rest.controller.v2.search import SearchControllerV2
 
 
 class ApiV2(ApiV1):
+    version = "v2"
 
     def __init__(self, credentials_manager, server_capabilities):
 
@@ -0,0 +1,69 @@
+import logging
+import time
+
+from bottle import HTTPResponse, request, response
+
+requests_logger = logging.getLogger("conans.server.requests")
+
+
+class MetricsPlugin(object):
+    """ The MetricsPlugin counts and times the requests of every route, with the bytes received
+    and sent. Optionally logs the time of each request """
+
+    name = 'MetricsPlugin'
+    api = 2
+
+    def __init__(self, metrics, api_version, log_requests=False):
+        self.metrics = metrics
+        self.api_version = api_version
+        self.log_requests = log_requests
+
+    def setup(self, app):
+        pass
+
+    def apply(self, callback, route):
+        labels = {"api": self.api_version, "method": route.method, "route": route.rule}
+
+        def wrapper(*args, **kwargs):
+            start = time.time()
+            result = None
+            status = 500
+            try:
+                result = callback(*args, **kwargs)
+                status = response.status_code
+                return result
+            except HTTPResponse as resp:  # Also HTTPError
+                result = resp
+                raise
+            finally:
+                if isinstance(result, HTTPResponse):
+                    status = result.status_code
+                self._record(labels, status, result, time.time() - start)
+
+        return wrapper
+
+    def _record(self, labels, status, result, elapsed):
+        metrics = self.metrics
+        metrics.inc("conan_server_requests_total", status=status, **labels)
+        metrics.observe("conan_server_request_duration_seconds", elapsed, **labels)
+        received = request.content_length
+        if received > 0:
+            metrics.inc("conan_server_request_bytes_total", received, **labels)
+        sent = _response_length(result)
+        if sent:
+            metrics.inc("conan_server_response_bytes_total", sent, **labels)
+        if self.log_requests:
+            requests_logger.info("%s %s %s %.1fms in:%d out:%d"
+                                 % (request.method, request.path, status, elapsed * 1000,
+                                    max(received, 0), sent or 0))
+
+
+def _response_length(result):
+    if isinstance(result, HTTPResponse):  # static_file and error responses
+        length = result.headers.get("Content-Length")
+        if length is not None:
+            return int(length)
+        result = result.body
+    if isinstance(result, (bytes, str)):
+        return len(result)
+    return None
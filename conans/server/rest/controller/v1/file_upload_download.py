@@ -37,6 +37,7 @@ class FileUploadDownloadController(object):
             abs_path = os.path.abspath(os.path.join(storage_path, os.path.normpath(the_path)))
             # Body is a stringIO (generator)
             service.put_file(file_saver, abs_path, token, request.content_length)
+            app.server_store.file_saved(abs_path)
 
 
 class ConanFileUpload(FileUpload):
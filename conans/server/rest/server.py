@@ -1,7 +1,9 @@
 import bottle
 
+from conans.server.metrics import TimedProxy
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
+from conans.server.rest.server_adapter import ConanServerAdapter
 
 
 class ConanServer(object):
@@ -15,18 +17,29 @@ class ConanServer(object):
 
     def __init__(self, run_port, credentials_manager,
                  updown_auth_manager, authorizer, authenticator,
-                 server_store, server_capabilities):
+                 server_store, server_capabilities, metrics=None, log_requests=False):
 
         self.run_port = run_port
 
         server_capabilities = server_capabilities or []
         self.root_app = bottle.Bottle()
 
+        if metrics:
+            credentials_manager = TimedProxy(credentials_manager, metrics, "credentials")
+            authenticator = TimedProxy(authenticator, metrics, "authenticator")
+
+            @self.root_app.route("/metrics", method=["GET"])
+            def get_metrics():
+                bottle.response.content_type = "text/plain; version=0.0.4"
+                return metrics.dumps()
+
         self.api_v1 = ApiV1(credentials_manager, updown_auth_manager,
                             server_capabilities)
         self.api_v1.authorizer = authorizer
         self.api_v1.authenticator = authenticator
         self.api_v1.server_store = server_store
+        self.api_v1.metrics = metrics
+        self.api_v1.log_requests = log_requests
         self.api_v1.setup()
 
         self.root_app.mount("/v1/", self.api_v1)
@@ -35,6 +48,8 @@ class ConanServer(object):
         self.api_v2.authorizer = authorizer
         self.api_v2.authenticator = authenticator
         self.api_v2.server_store = server_store
+        self.api_v2.metrics = metrics
+        self.api_v2.log_requests = log_requests
         self.api_v2.setup()
         self.root_app.mount("/v2/", self.api_v2)
 
@@ -42,5 +57,10 @@ class ConanServer(object):
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
-        bottle.Bottle.run(self.root_app, host=host,
+        workers = kwargs.pop("workers", None)
+        threads = kwargs.pop("threads", None)
+        server = "wsgiref"
+        if workers or threads:
+            server = ConanServerAdapter(host=host, port=port, workers=workers, threads=threads)
+        bottle.Bottle.run(self.root_app, host=host, server=server,
                           port=port, debug=debug_set, reloader=False)
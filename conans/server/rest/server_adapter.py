@@ -0,0 +1,227 @@
+import os
+import signal
+import socket
+import threading
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer
+
+import bottle
+from six.moves import queue
+
+KEEP_ALIVE_TIMEOUT = 5  # Seconds an idle persistent connection keeps a thread busy
+_MAX_DRAIN_SIZE = 64 * 1024  # Unread request bodies bigger than this close the connection
+
+
+class _RequestInput(object):
+    """ wsgi.input limited to the request Content-Length, tracking what the application read
+    so the rest of the body can be discarded before reading the next request of the connection
+    """
+    def __init__(self, rfile, length):
+        self._rfile = rfile
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._rfile.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def readline(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._rfile.readline(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def readlines(self, hint=-1):
+        return list(iter(self.readline, b""))
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def drain(self):
+        if self.remaining > _MAX_DRAIN_SIZE:
+            return False
+        while self.remaining:
+            if not self.read(self.remaining):
+                return False
+        return True
+
+
+class _ConanServerHandler(ServerHandler):
+    http_version = "1.1"
+
+    def cleanup_headers(self):
+        ServerHandler.cleanup_headers(self)
+        # Without a known length the end of the response is the end of the connection
+        if "Content-Length" not in self.headers:
+            self.request_handler.close_connection = True
+        # Connections waiting for a thread have priority over keeping this one alive
+        if self.request_handler.server.saturated():
+            self.request_handler.close_connection = True
+        if self.request_handler.close_connection:
+            self.headers["Connection"] = "close"
+
+    def handle_error(self):
+        self.request_handler.close_connection = True
+        ServerHandler.handle_error(self)
+
+    def sendfile(self):
+        """ Files returned by the application (bottle static_file uses wsgi.file_wrapper) are
+        sent by the kernel from the file descriptor to the socket, without copying them in
+        user space. Returns False to fall back to the regular iteration when not possible
+        """
+        connection = self.request_handler.connection
+        if not hasattr(connection, "sendfile"):
+            return False
+        try:
+            filelike = self.result.filelike
+            offset = filelike.tell()
+            length = int(self.headers["Content-Length"])
+        except (AttributeError, EnvironmentError, TypeError, ValueError):
+            return False
+
+        self.send_headers()
+        self._flush()
+        sent = connection.sendfile(filelike, offset, length)
+        self.bytes_sent += sent
+        if sent != length:  # The file was truncated while sending it
+            self.request_handler.close_connection = True
+        return True
+
+
+class _ConanRequestHandler(WSGIRequestHandler):
+    """ Serves HTTP/1.1 persistent connections, several requests per connection """
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    quiet = False
+
+    def setup(self):
+        WSGIRequestHandler.setup(self)
+        # Headers and body are written separately, don't wait for the ACK of the headers
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except socket.timeout:
+            self.close_connection = True
+            return
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+        if len(self.raw_requestline) > 65536:
+            self.close_connection = True
+            self.send_error(414)
+            return
+        if not self.parse_request():
+            return
+
+        environ = self.get_environ()
+        request_input = None
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            self.close_connection = True
+        else:
+            request_input = _RequestInput(self.rfile, int(environ.get("CONTENT_LENGTH") or 0))
+
+        handler = _ConanServerHandler(request_input or self.rfile, self.wfile, self.get_stderr(),
+                                      environ, multithread=True,
+                                      multiprocess=self.server.multiprocess)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+        if request_input is not None and not request_input.drain():
+            self.close_connection = True
+        try:
+            self.wfile.flush()
+        except socket.error:
+            self.close_connection = True
+
+    def get_environ(self):
+        environ = WSGIRequestHandler.get_environ(self)
+        environ["REMOTE_PORT"] = str(self.client_address[1])
+        return environ
+
+    def log_request(self, *args, **kwargs):
+        if not self.quiet:
+            WSGIRequestHandler.log_request(self, *args, **kwargs)
+
+
+class _ConanWSGIServer(WSGIServer):
+    """ WSGI server handling the connections in a fixed pool of threads """
+    request_queue_size = 128
+    multiprocess = False
+
+    def __init__(self, server_address, handler_class, threads):
+        WSGIServer.__init__(self, server_address, handler_class)
+        self._threads = threads
+        self._connections = queue.Queue()
+
+    def serve_forever(self, poll_interval=0.5):
+        # Threads are started here so they are created in each worker process after the fork
+        for _ in range(self._threads):
+            thread = threading.Thread(target=self._process_connections)
+            thread.daemon = True
+            thread.start()
+        WSGIServer.serve_forever(self, poll_interval)
+
+    def saturated(self):
+        return not self._connections.empty()
+
+    def process_request(self, request, client_address):
+        self._connections.put((request, client_address))
+
+    def _process_connections(self):
+        while True:
+            request, client_address = self._connections.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+
+class ConanServerAdapter(bottle.ServerAdapter):
+    """ Bottle server adapter serving the application with a number of worker processes (only
+    in systems with fork) each one with a pool of threads
+    """
+
+    def run(self, handler):
+        workers = int(self.options.get("workers") or 1)
+        threads = int(self.options.get("threads") or 1)
+
+        handler_class = type("RequestHandler", (_ConanRequestHandler, ), {"quiet": self.quiet})
+        server = _ConanWSGIServer((self.host, self.port), handler_class, threads)
+        server.set_app(handler)
+        self.srv = server
+        if workers == 1 or not hasattr(os, "fork"):
+            server.serve_forever()
+            return
+
+        # All the workers accept connections from the same listening socket
+        server.multiprocess = True
+        children = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+        try:
+            for pid in children:
+                os.waitpid(pid, 0)
+        finally:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:  # Already finished
+                    pass
+            server.server_close()
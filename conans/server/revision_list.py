@@ -19,6 +19,14 @@ class RevisionList(object):
                      for e in json.loads(contents)["revisions"]]
         return ret
 
+    @staticmethod
+    def from_entries(entries):
+        """ From (revision, time) tuples, the latest revision the last one """
+        ret = RevisionList()
+        ret._data = [_RevisionEntry(revision, RevisionList._fix_timestamp(the_time))
+                     for revision, the_time in entries]
+        return ret
+
     @staticmethod
     def _fix_timestamp(the_time):
         """The time field has been converted to ISO8601 from timestamp, so we keep compatibility
@@ -9,6 +9,7 @@ Replace this module with other that keeps the interface or super class.
 
 '''
 
+import heapq
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -109,6 +110,8 @@ class BasicAuthorizer(Authorizer):
 
         self.read_permissions = read_permissions
         self.write_permissions = write_permissions
+        self._read_rules = _PermissionRules(read_permissions)
+        self._write_rules = _PermissionRules(write_permissions)
 
     def check_read_conan(self, username, ref):
         """
@@ -118,7 +121,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return
 
-        self._check_any_rule_ok(username, self.read_permissions, ref)
+        self._check_any_rule_ok(username, self._read_rules, ref)
 
     def check_write_conan(self, username, ref):
         """
@@ -128,7 +131,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return True
 
-        self._check_any_rule_ok(username, self.write_permissions, ref)
+        self._check_any_rule_ok(username, self._write_rules, ref)
 
     def check_delete_conan(self, username, ref):
         """
@@ -158,10 +161,10 @@ class BasicAuthorizer(Authorizer):
         """
         self.check_write_package(username, pref)
 
-    def _check_any_rule_ok(self, username, rules, *args, **kwargs):
-        for rule in rules:
+    def _check_any_rule_ok(self, username, rules, ref):
+        for rule in rules.candidates(ref):
             # raises if don't
-            ret = self._check_rule_ok(username, rule, *args, **kwargs)
+            ret = self._check_rule_ok(username, rule, ref)
             if ret:  # A rule is applied ok, if not apply keep looking
                 return True
         if username:
@@ -172,16 +175,11 @@ class BasicAuthorizer(Authorizer):
     def _check_rule_ok(self, username, rule, ref):
         """Checks if a rule specified in config file applies to current conans
         reference and current user"""
-        try:
-            rule_ref = ConanFileReference.loads(rule[0])
-        except Exception:
+        if rule is None:
             # TODO: Log error
             raise InternalErrorException("Invalid server configuration. "
                                          "Contact the administrator.")
-        authorized_users = [_.strip() for _ in rule[1].split(",")]
-        if len(authorized_users) < 1:
-            raise InternalErrorException("Invalid server configuration. "
-                                         "Contact the administrator.")
+        rule_ref, authorized_users = rule
 
         # Check if rule apply ref
         if self._check_ref_apply_for_rule(rule_ref, ref):
@@ -206,3 +204,36 @@ class BasicAuthorizer(Authorizer):
                    (version != "*" and version != ref.version) or
                    (user != "*" and user != ref.user) or
                    (channel != "*" and channel != ref.channel))
+
+
+class _PermissionRules(object):
+    """ The rules of the config file parsed once and indexed by the name and version patterns of
+    their references, so only the ones that can apply to a reference are checked, in the same
+    order they are declared
+    """
+
+    def __init__(self, rules):
+        self._index = {}
+        for position, rule in enumerate(rules):
+            compiled = self._compile(rule)
+            # Invalid rules have to be reached by any reference to report the error
+            key = (compiled[0].name, compiled[0].version) if compiled else ("*", "*")
+            self._index.setdefault(key, []).append((position, compiled))
+
+    @staticmethod
+    def _compile(rule):
+        """ (ConanFileReference, list of users) or None if it is not valid """
+        try:
+            rule_ref = ConanFileReference.loads(rule[0])
+        except Exception:
+            return None
+        authorized_users = [_.strip() for _ in rule[1].split(",")]
+        if len(authorized_users) < 1:
+            return None
+        return rule_ref, authorized_users
+
+    def candidates(self, ref):
+        keys = {(ref.name, ref.version), (ref.name, "*"), ("*", ref.version), ("*", "*")}
+        rules = [self._index[key] for key in keys if key in self._index]
+        for _, rule in heapq.merge(*rules):
+            yield rule
@@ -1,8 +1,11 @@
 import os
+import tarfile
+import tempfile
 
-from bottle import FileUpload, static_file
+from bottle import FileUpload, HTTPResponse, static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException
+from conans.errors import NotFoundException, RecipeNotFoundException, PackageNotFoundException
+from conans.paths import CONAN_MANIFEST, PACKAGE_TGZ_NAME
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
@@ -29,17 +32,19 @@ class ConanServiceV2(CommonService):
     def get_conanfile_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._file_response(path)
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        self._upload_to_path(body, headers, path)
+        deployed = self._upload_to_path(body, headers, path)
 
-        # If the upload was ok, update the pointer to the latest
-        self._server_store.update_last_revision(reference)
+        # The client uploads the manifest the last one, then the revision is complete and
+        # becomes the latest
+        if filename == CONAN_MANIFEST:
+            self._server_store.update_last_revision(reference)
+        return deployed
 
     def get_recipe_revisions(self, ref, auth_user):
         self._authorizer.check_read_conan(auth_user, ref)
@@ -83,8 +88,40 @@ class ConanServiceV2(CommonService):
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._file_response(path)
+
+    def get_package_delta(self, pref, filenames, auth_user):
+        """ Returns a tgz with the given files of the package and all its symlinks, to update
+        an already installed package without downloading the whole conan_package.tgz
+        """
+        self._authorizer.check_read_conan(auth_user, pref.ref)
+        path = self._server_store.get_package_file_path(pref, PACKAGE_TGZ_NAME)
+        if not os.path.exists(path):
+            raise PackageNotFoundException(pref, print_rev=True)
+
+        pending = set(filenames)
+        delta_file = tempfile.TemporaryFile()
+        with tarfile.open(path, "r:gz") as package_tgz:
+            delta_tgz = tarfile.open(fileobj=delta_file, mode="w:gz")
+            for member in package_tgz:
+                if member.issym():
+                    delta_tgz.addfile(member)
+                elif member.name in pending:
+                    if not member.isfile():
+                        break
+                    delta_tgz.addfile(member, package_tgz.extractfile(member))
+                    pending.discard(member.name)
+            delta_tgz.close()
+
+        if pending:
+            delta_file.close()
+            raise NotFoundException("Files not found in package %s: %s"
+                                    % (repr(pref), ", ".join(sorted(pending))))
+        size = delta_file.tell()
+        delta_file.seek(0)
+        return HTTPResponse(body=delta_file, status=200,
+                            headers={"Content-Type": "application/x-gzip",
+                                     "Content-Length": str(size)})
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
@@ -95,14 +132,35 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(recipe_path):
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        self._upload_to_path(body, headers, path)
+        deployed = self._upload_to_path(body, headers, path)
 
-        # If the upload was ok, update the pointer to the latest
-        self._server_store.update_last_package_revision(pref)
+        # The client uploads the manifest the last one, then the revision is complete and
+        # becomes the latest
+        if filename == CONAN_MANIFEST:
+            self._server_store.update_last_package_revision(pref)
+        return deployed
 
     # Misc
-    @staticmethod
-    def _upload_to_path(body, headers, path):
+    def _file_response(self, path):
+        """ Serves the file, or redirects to the storage URL of the file if there is one """
+        redirect = self._server_store.get_download_redirect(path)
+        if redirect:
+            return HTTPResponse(status=302, headers={"Location": redirect})
+        return static_file(os.path.basename(path), root=os.path.dirname(path),
+                           mimetype=get_mime_type(path))
+
+    def _upload_to_path(self, body, headers, path):
+        """ Saves the uploaded file in path. With the "X-Checksum-Deploy" header there is no body,
+        the file is linked from an already stored one with the same sha1, returning a 201 response
+        or raising NotFoundException so the client uploads the contents
+        """
+        if "X-Checksum-Deploy" in headers:
+            sha1 = headers.get("X-Checksum-Sha1")
+            if not self._server_store.deploy_file_from_checksum(sha1, path):
+                raise NotFoundException("Checksum not found: %s" % sha1)
+            self._server_store.file_saved(path)
+            return HTTPResponse(status=201)
+
         file_saver = FileUpload(body, None,
                                 filename=os.path.basename(path),
                                 headers=headers)
@@ -111,3 +169,5 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(os.path.dirname(path)):
             mkdir(os.path.dirname(path))
         file_saver.save(os.path.dirname(path))
+        self._server_store.register_file_checksum(path)
+        self._server_store.file_saved(path)
@@ -5,10 +5,11 @@ import fasteners
 from conans.client.tools.env import no_op
 from conans.errors import NotFoundException
 from conans.server.store.server_store import REVISIONS_FILE
-from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
+from conans.server.store.storage_adapter import ServerStorageAdapter
+from conans.util.files import decode_text, md5sum, mkdir, path_exists, relative_dirs, rmdir
 
 
-class ServerDiskAdapter(object):
+class ServerDiskAdapter(ServerStorageAdapter):
     '''Manage access to disk files with common methods required
     for conan operations'''
     def __init__(self, base_url, base_storage_path, updown_auth_manager):
@@ -90,6 +91,18 @@ class ServerDiskAdapter(object):
     def path_exists(self, path):
         return os.path.exists(path)
 
+    def link_file(self, src, dst):
+        """Hard links the src file to dst, replacing dst if it exists.
+        Returns False if the filesystem doesn't allow it"""
+        if os.path.exists(dst):
+            os.unlink(dst)
+        mkdir(os.path.dirname(dst))
+        try:
+            os.link(src, dst)
+        except (OSError, AttributeError):  # Not supported or concurrently created
+            return False
+        return True
+
     def read_file(self, path, lock_file):
         with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
             with open(path) as f:
@@ -0,0 +1,169 @@
+import calendar
+import os
+import threading
+import time
+from collections import namedtuple
+
+from conans.errors import NotFoundException
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.util.dates import from_iso8601_to_datetime
+from conans.util.files import list_folder_subdirs
+from conans.util.log import logger
+
+# Revisions with files modified in the last seconds are kept, they could be being uploaded
+UPLOAD_GRACE_SECONDS = 600
+
+GCReport = namedtuple("GCReport", "recipe_revisions package_revisions blobs bytes")
+
+
+class RetentionPolicy(object):
+    """ The revisions of every recipe and package to keep: the 'keep_revisions' latest ones and
+    also the ones newer than 'keep_days'. None is no limit, the latest revision is always kept
+    """
+
+    def __init__(self, keep_revisions=None, keep_days=None):
+        self.keep_revisions = keep_revisions
+        self.keep_days = keep_days
+
+    @property
+    def enabled(self):
+        return self.keep_revisions is not None or self.keep_days is not None
+
+    def expired(self, revisions, now):
+        """ revisions: list of revision entries (revision, time) with the latest first
+        returns the ones not to keep """
+        if not self.enabled:
+            return []
+        ret = []
+        for position, entry in enumerate(revisions):
+            if position == 0:
+                continue
+            if self.keep_revisions is not None and position < self.keep_revisions:
+                continue
+            if self.keep_days is not None and now - _timestamp(entry.time) < self.keep_days * 86400:
+                continue
+            ret.append(entry)
+        return ret
+
+
+def _timestamp(iso_time):
+    return calendar.timegm(from_iso8601_to_datetime(iso_time).utctimetuple())
+
+
+def _walk_files(folder):
+    for root, _, files in os.walk(folder):
+        for filename in files:
+            yield os.path.join(root, filename)
+
+
+def _reclaimable_bytes(folder):
+    """ Size of the files of the folder that are not linked from other places """
+    ret = 0
+    for path in _walk_files(folder):
+        stat = os.lstat(path)
+        if stat.st_nlink <= 1:
+            ret += stat.st_size
+    return ret
+
+
+def _modified_since(folder, timestamp):
+    return any(os.lstat(path).st_mtime > timestamp for path in _walk_files(folder))
+
+
+class RevisionsGarbageCollector(object):
+    """ Removes the revisions of the server store not kept by the retention policy and the
+    stored checksums (blobs) no longer used. Uses the same store operations as the remove
+    requests, so it can run while the server is serving
+    """
+
+    def __init__(self, server_store, policy):
+        self._server_store = server_store
+        self._policy = policy
+
+    def _refs(self):
+        for folder in list_folder_subdirs(basedir=self._server_store.store, level=4):
+            if not folder.startswith("."):
+                yield ConanFileReference.load_dir_repr(folder)
+
+    def _removable(self, folder, now):
+        return os.path.exists(folder) and not _modified_since(folder, now - UPLOAD_GRACE_SECONDS)
+
+    def run(self, dry_run=False):
+        """ Returns a GCReport with what has been removed (or would be with dry_run) """
+        store = self._server_store
+        now = time.time()
+        recipe_revisions = package_revisions = reclaimed = 0
+        for ref in self._refs():
+            try:
+                revisions = store.get_recipe_revisions(ref)
+            except NotFoundException:
+                continue
+            expired = self._policy.expired(revisions, now)
+            for entry in expired:
+                rref = ref.copy_with_rev(entry.revision)
+                folder = store.base_folder(rref)
+                if not self._removable(folder, now):
+                    continue
+                reclaimed += _reclaimable_bytes(folder)
+                recipe_revisions += 1
+                if not dry_run:
+                    self._remove(store.remove_conanfile, rref)
+
+            kept = [entry for entry in revisions if entry not in expired]
+            for entry in kept:
+                rref = ref.copy_with_rev(entry.revision)
+                removed, size = self._collect_packages(rref, now, dry_run)
+                package_revisions += removed
+                reclaimed += size
+
+        blobs, size = store.remove_orphan_blobs(dry_run)
+        reclaimed += size
+        if not dry_run:
+            store.compact()
+        return GCReport(recipe_revisions, package_revisions, blobs, reclaimed)
+
+    def _collect_packages(self, rref, now, dry_run):
+        store = self._server_store
+        removed = reclaimed = 0
+        packages_folder = store.packages(rref)
+        if not os.path.isdir(packages_folder):
+            return removed, reclaimed
+        for package_id in os.listdir(packages_folder):
+            pref = PackageReference(rref, package_id)
+            try:
+                revisions = store.get_package_revisions(pref)
+            except NotFoundException:
+                continue
+            for entry in self._policy.expired(revisions, now):
+                prev = pref.copy_with_revs(rref.revision, entry.revision)
+                folder = store.package(prev)
+                if not self._removable(folder, now):
+                    continue
+                reclaimed += _reclaimable_bytes(folder)
+                removed += 1
+                if not dry_run:
+                    self._remove(store.remove_package, prev)
+        return removed, reclaimed
+
+    @staticmethod
+    def _remove(remove_method, ref):
+        try:
+            remove_method(ref)
+        except NotFoundException:  # Concurrently removed
+            logger.debug("GC: %s already removed" % ref.full_str())
+
+    def run_periodically(self, interval):
+        """ Runs the collection every 'interval' seconds in a daemon thread """
+        def collect():
+            while True:
+                time.sleep(interval)
+                try:
+                    report = self.run()
+                    logger.info("GC: %s" % str(report))
+                except Exception as e:
+                    logger.error("GC: %s" % str(e))
+
+        thread = threading.Thread(target=collect, name="RevisionsGC")
+        thread.daemon = True
+        thread.start()
+        return thread
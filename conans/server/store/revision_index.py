@@ -0,0 +1,166 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+import fasteners
+
+from conans.errors import ConanException
+from conans.server.revision_list import RevisionList
+from conans.util.files import mkdir
+
+REVISIONS_FILE = "revisions.txt"
+REVISIONS_DB = ".revisions.db"
+
+
+class FileRevisionIndex(object):
+    """ Stores the revisions of every folder in a 'revisions.txt' file inside that folder.
+    The folders are relative to the storage and always use "/"
+    """
+
+    def __init__(self, storage_adapter):
+        self._storage_adapter = storage_adapter
+        self._store_folder = storage_adapter.base_storage_folder()
+
+    def _revisions_file(self, folder):
+        return os.path.join(self._store_folder, folder, REVISIONS_FILE)
+
+    def get_revision_list(self, folder):
+        rev_file_path = self._revisions_file(folder)
+        if not self._storage_adapter.path_exists(rev_file_path):
+            return RevisionList()
+        rev_file = self._storage_adapter.read_file(rev_file_path,
+                                                   lock_file=rev_file_path + ".lock")
+        return RevisionList.loads(rev_file)
+
+    def add_revision(self, folder, revision):
+        rev_list = self.get_revision_list(folder)
+        rev_list.add_revision(revision)
+        self._save(folder, rev_list)
+
+    def remove_revision(self, folder, revision):
+        rev_file_path = self._revisions_file(folder)
+        rev_file = self._storage_adapter.read_file(rev_file_path,
+                                                   lock_file=rev_file_path + ".lock")
+        rev_list = RevisionList.loads(rev_file)
+        rev_list.remove_revision(revision)
+        self._save(folder, rev_list)
+
+    def remove_folder(self, folder):
+        # The revisions files are removed together with the folders of the storage
+        pass
+
+    def compact(self):
+        pass
+
+    def _save(self, folder, rev_list):
+        rev_file_path = self._revisions_file(folder)
+        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
+                                         lock_file=rev_file_path + ".lock")
+
+
+class SQLiteRevisionIndex(object):
+    """ Stores the revisions of every folder of the storage in a SQLite database, the position
+    keeps the order in which they were added (the latest is the last one). The database is
+    created the first time it is used, importing the existing 'revisions.txt' files
+    """
+
+    def __init__(self, store_folder):
+        self._store_folder = store_folder
+        self._dbfile = os.path.join(store_folder, REVISIONS_DB)
+
+    @contextmanager
+    def _connect(self, write=True):
+        if not os.path.exists(self._dbfile):
+            self._create()
+        connection = sqlite3.connect(self._dbfile, timeout=30, isolation_level=None)
+        connection.text_factory = str
+        try:
+            # Writes lock the database from the beginning of the transaction so the
+            # read-modify-write of a revision list is atomic between threads and processes
+            connection.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield connection
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def _create(self):
+        mkdir(self._store_folder)
+        with fasteners.InterProcessLock(self._dbfile + ".lock"):
+            if os.path.exists(self._dbfile):
+                return
+            tmp_dbfile = self._dbfile + ".tmp"
+            if os.path.exists(tmp_dbfile):  # Interrupted creation
+                os.unlink(tmp_dbfile)
+            connection = sqlite3.connect(tmp_dbfile)
+            try:
+                # Readers don't block the writer nor the other way around
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("CREATE TABLE revisions (position INTEGER PRIMARY KEY "
+                                   "AUTOINCREMENT, folder TEXT NOT NULL, revision TEXT NOT NULL, "
+                                   "time, UNIQUE (folder, revision))")
+                for folder, rev_list in _read_revision_files(self._store_folder):
+                    for entry in reversed(rev_list.as_list()):
+                        connection.execute("INSERT INTO revisions (folder, revision, time) "
+                                           "VALUES (?, ?, ?)", (folder, entry.revision,
+                                                                entry.time))
+                connection.commit()
+            except Exception as e:
+                raise ConanException("Could not initialize the revisions database: %s" % str(e))
+            finally:
+                connection.close()
+            os.rename(tmp_dbfile, self._dbfile)
+
+    @staticmethod
+    def _read(connection, folder):
+        rows = connection.execute("SELECT revision, time FROM revisions WHERE folder=? "
+                                  "ORDER BY position", (folder, ))
+        return RevisionList.from_entries(rows)
+
+    def get_revision_list(self, folder):
+        with self._connect(write=False) as connection:
+            return self._read(connection, folder)
+
+    def add_revision(self, folder, revision):
+        with self._connect() as connection:
+            rev_list = self._read(connection, folder)
+            latest = rev_list.latest_revision()
+            rev_list.add_revision(revision)
+            if rev_list.latest_revision() == latest:
+                return
+            connection.execute("DELETE FROM revisions WHERE folder=? AND revision=?",
+                               (folder, revision))
+            connection.execute("INSERT INTO revisions (folder, revision, time) VALUES (?, ?, ?)",
+                               (folder, revision, rev_list.latest_revision().time))
+
+    def remove_revision(self, folder, revision):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM revisions WHERE folder=? AND revision=?",
+                               (folder, revision))
+
+    def remove_folder(self, folder):
+        """ Removes the revisions of the folder and all its subfolders """
+        with self._connect() as connection:
+            # The subfolders are in the ["folder/", "folder0") range, "0" follows "/" in ASCII
+            connection.execute("DELETE FROM revisions WHERE folder=? OR "
+                               "(folder>=? AND folder<?)", (folder, folder + "/", folder + "0"))
+
+    def compact(self):
+        if not os.path.exists(self._dbfile):
+            return
+        connection = sqlite3.connect(self._dbfile, timeout=30, isolation_level=None)
+        try:
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+
+
+def _read_revision_files(store_folder):
+    for root, _, files in os.walk(store_folder):
+        if REVISIONS_FILE in files:
+            folder = os.path.relpath(root, store_folder).replace("\\", "/")
+            with open(os.path.join(root, REVISIONS_FILE)) as f:
+                yield folder, RevisionList.loads(f.read())
@@ -0,0 +1,149 @@
+import hashlib
+import hmac
+import os
+from datetime import datetime
+
+import requests
+from six.moves.urllib.parse import quote, urlsplit
+
+from conans.errors import InternalErrorException
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.util.log import logger
+
+# The files with the bytes of the recipes and packages, the ones stored in the bucket
+BUCKET_FILES = (EXPORT_TGZ_NAME, EXPORT_SOURCES_TGZ_NAME, PACKAGE_TGZ_NAME)
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+
+
+def _quote(value, safe="-_.~"):
+    return quote(value, safe=safe)
+
+
+def _hmac(key, msg):
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _scope(date_stamp, region):
+    return "%s/%s/s3/aws4_request" % (date_stamp, region)
+
+
+def sign_v4(method, url, query, region, secret_key):
+    """ Signature Version 4 of a presigned request to the url (not encoded), query is the dict of
+    the X-Amz-* parameters but the signature:
+    https://docs.aws.amazon.com/AmazonS3/latest/API/sigv4-query-string-auth.html
+    """
+    tokens = urlsplit(url)
+    canonical_query = "&".join("%s=%s" % (_quote(k), _quote(v)) for k, v in sorted(query.items()))
+    canonical_request = "\n".join([method,
+                                   _quote(tokens.path or "/", safe="/-_.~"),
+                                   canonical_query,
+                                   "host:%s\n" % tokens.netloc,
+                                   "host",
+                                   "UNSIGNED-PAYLOAD"])
+    amz_date = query["X-Amz-Date"]
+    date_stamp = amz_date[:8]
+    string_to_sign = "\n".join([_ALGORITHM, amz_date, _scope(date_stamp, region),
+                                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()])
+    key = _hmac(("AWS4" + secret_key).encode("utf-8"), date_stamp)
+    for value in (region, "s3", "aws4_request"):
+        key = _hmac(key, value)
+    return hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def presign_url(method, url, region, access_key, secret_key, expires, now=None):
+    """ The url, encoded, with the query parameters that authorize the method for "expires"
+    seconds """
+    now = now or datetime.utcnow()
+    query = {"X-Amz-Algorithm": _ALGORITHM,
+             "X-Amz-Credential": "%s/%s" % (access_key, _scope(now.strftime("%Y%m%d"), region)),
+             "X-Amz-Date": now.strftime("%Y%m%dT%H%M%SZ"),
+             "X-Amz-Expires": str(int(expires)),
+             "X-Amz-SignedHeaders": "host"}
+    query["X-Amz-Signature"] = sign_v4(method, url, query, region, secret_key)
+    query_string = "&".join("%s=%s" % (_quote(k), _quote(v)) for k, v in sorted(query.items()))
+    tokens = urlsplit(url)
+    return "%s://%s%s?%s" % (tokens.scheme, tokens.netloc, _quote(tokens.path, safe="/-_.~"),
+                             query_string)
+
+
+class S3Client(object):
+    """ Operations over the objects of a bucket of a S3 compatible service (AWS, MinIO...) with
+    path-style URLs: endpoint/bucket/key
+    """
+
+    def __init__(self, endpoint, bucket, access_key, secret_key, region="us-east-1",
+                 requester=requests, timeout=60):
+        self._bucket_url = "%s/%s" % (endpoint.rstrip("/"), bucket)
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._region = region
+        self._requester = requester
+        self._timeout = timeout
+
+    def presign(self, method, key, expires):
+        url = "%s/%s" % (self._bucket_url, key)
+        return presign_url(method, url, self._region, self._access_key, self._secret_key,
+                           expires)
+
+    def put_object(self, key, path):
+        with open(path, "rb") as f:
+            response = self._requester.put(self.presign("PUT", key, 60), data=f,
+                                           timeout=self._timeout)
+        self._check(response, "PUT", key)
+
+    def delete_object(self, key):
+        response = self._requester.delete(self.presign("DELETE", key, 60), timeout=self._timeout)
+        if response.status_code != 404:
+            self._check(response, "DELETE", key)
+
+    @staticmethod
+    def _check(response, method, key):
+        if not response.ok:
+            logger.error("S3 %s %s: %s %s" % (method, key, response.status_code, response.text))
+            raise InternalErrorException("Error %s '%s' in the object storage: %s"
+                                         % (method, key, response.status_code))
+
+
+class S3StorageAdapter(ServerDiskAdapter):
+    """ Keeps every file in the disk storage, as the ServerDiskAdapter does, and also uploads the
+    recipe and package archives (BUCKET_FILES) to a S3 compatible bucket. The API v2 downloads
+    of those archives are redirected to presigned URLs of the bucket, so their bytes are not
+    served by the server. The API v1 keeps the download URLs of the server: the v1 clients send
+    their credentials to them, and S3 rejects presigned requests with an Authorization header
+    """
+
+    def __init__(self, base_url, base_storage_path, updown_auth_manager, s3_client, expires):
+        """ expires: seconds the presigned download URLs are valid """
+        super(S3StorageAdapter, self).__init__(base_url, base_storage_path, updown_auth_manager)
+        self._s3_client = s3_client
+        self._expires = expires
+
+    def _object_key(self, path):
+        return os.path.relpath(path, self._store_folder).replace("\\", "/")
+
+    @staticmethod
+    def _in_bucket(path):
+        return os.path.basename(path) in BUCKET_FILES
+
+    def file_saved(self, path):
+        if self._in_bucket(path):
+            self._s3_client.put_object(self._object_key(path), path)
+
+    def get_download_redirect(self, path):
+        if self._in_bucket(path) and os.path.exists(path):
+            return self._s3_client.presign("GET", self._object_key(path), self._expires)
+        return None
+
+    def delete_folder(self, path):
+        for root, _, files in os.walk(path):
+            for filename in files:
+                if self._in_bucket(filename):
+                    self._s3_client.delete_object(self._object_key(os.path.join(root, filename)))
+        super(S3StorageAdapter, self).delete_folder(path)
+
+    def delete_file(self, path):
+        if self._in_bucket(path):
+            self._s3_client.delete_object(self._object_key(path))
+        super(S3StorageAdapter, self).delete_file(path)
@@ -1,4 +1,6 @@
+import functools
 import os
+import re
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
@@ -6,15 +8,37 @@ from conans.errors import ConanException, PackageNotFoundException, RecipeNotFou
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
-
-REVISIONS_FILE = "revisions.txt"
+from conans.server.store.revision_index import REVISIONS_FILE, SQLiteRevisionIndex
+from conans.util.files import sha1sum
+from conans.util.lru import LRUCache
+
+BLOBS_FOLDER = ".blobs"
+_SHA1_PATTERN = re.compile("^[0-9a-f]{40}$")
+# Cached file lists and revision lists. Changes made through this store invalidate them, the
+# TTL bounds how outdated they can be when other processes are writing to the same storage
+CACHE_SIZE = 2000
+CACHE_TTL = 10
+
+
+def _clears_cache(method):
+    """Removals are rare, instead of looking for the affected entries the whole cache is
+    cleared after them"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+    return wrapper
 
 
 class ServerStore(object):
 
-    def __init__(self, storage_adapter):
+    def __init__(self, storage_adapter, revision_index=None, cache=None):
         self._storage_adapter = storage_adapter
-        self._store_folder = storage_adapter._store_folder
+        self._store_folder = storage_adapter.base_storage_folder()
+        self._revision_index = revision_index or SQLiteRevisionIndex(self._store_folder)
+        self._cache = cache if cache is not None else LRUCache(CACHE_SIZE, CACHE_TTL)
 
     @property
     def store(self):
@@ -90,9 +114,39 @@ class ServerStore(object):
         return self._get_file_list(self.package(pref))
 
     def _get_file_list(self, relative_path):
-        file_list = self._storage_adapter.get_file_list(relative_path)
-        file_list = [relpath(old_key, relative_path) for old_key in file_list]
-        return file_list
+        key = ("files", relative_path)
+        file_list = self._cache.get(key)
+        if file_list is None:
+            file_list = self._storage_adapter.get_file_list(relative_path)
+            file_list = [relpath(old_key, relative_path) for old_key in file_list]
+            self._cache.put(key, file_list)
+        return list(file_list)
+
+    def file_saved(self, path):
+        """Called once an uploaded file has been saved in path. Invalidates the cached file list
+        of its folder. If the storage adapter fails storing it, the file is removed, so it is
+        neither listed nor deployed from its checksum, and the error raised"""
+        try:
+            self._storage_adapter.file_saved(path)
+        except Exception:
+            self._remove_unsaved_file(path)
+            raise
+        finally:
+            path = os.path.abspath(path)
+            self._cache.pop_if(lambda key: (key[0] == "files" and
+                                            path.startswith(os.path.abspath(key[1]) + os.sep)))
+
+    def _remove_unsaved_file(self, path):
+        if not os.path.exists(path):
+            return
+        blob_path = self._blob_path(sha1sum(path))
+        if os.path.exists(blob_path) and os.path.samefile(blob_path, path):
+            os.remove(blob_path)
+        os.remove(path)
+
+    def get_download_redirect(self, path):
+        """URL to redirect the download of the file to, or None to serve it"""
+        return self._storage_adapter.get_download_redirect(path)
 
     def _delete_empty_dirs(self, ref):
         lock_files = set([REVISIONS_FILE, "%s.lock" % REVISIONS_FILE])
@@ -111,16 +165,64 @@ class ServerStore(object):
                     break  # not empty
             ref_path = os.path.dirname(ref_path)
 
+    # ############ CHECKSUM DEPLOY (APIv2)
+    def _blob_path(self, sha1):
+        """Path of the file with the given contents sha1 in the content addressed storage"""
+        sha1 = (sha1 or "").lower()
+        if not _SHA1_PATTERN.match(sha1):
+            return None
+        return join(self.store, BLOBS_FOLDER, sha1[:2], sha1)
+
+    def deploy_file_from_checksum(self, sha1, path):
+        """Creates the file in path linking an already stored one with the same sha1.
+        Returns False if there is not such file"""
+        blob_path = self._blob_path(sha1)
+        if not blob_path or not self._storage_adapter.path_exists(blob_path):
+            return False
+        return self._storage_adapter.link_file(blob_path, path)
+
+    def register_file_checksum(self, path):
+        """Adds an uploaded file to the content addressed storage, so uploads of files with the
+        same contents can be deployed from it"""
+        blob_path = self._blob_path(sha1sum(path))
+        if not self._storage_adapter.path_exists(blob_path):
+            self._storage_adapter.link_file(path, blob_path)
+
+    def remove_orphan_blobs(self, dry_run=False):
+        """Removes the files of the content addressed storage not linked from any recipe or
+        package anymore. Returns the number of them and their size"""
+        count = size = 0
+        blobs_folder = join(self.store, BLOBS_FOLDER)
+        for root, _, files in os.walk(blobs_folder):
+            for filename in files:
+                path = join(root, filename)
+                stat = os.lstat(path)
+                if stat.st_nlink > 1:
+                    continue
+                count += 1
+                size += stat.st_size
+                if not dry_run:
+                    self._storage_adapter.delete_file(path)
+        return count, size
+
+    def compact(self):
+        """Reclaims the space of the removed entries of the revisions index"""
+        self._revision_index.compact()
+
     # ######### DELETE (APIv1 and APIv2)
+    @_clears_cache
     def remove_conanfile(self, ref):
         assert isinstance(ref, ConanFileReference)
         if not ref.revision:
             self._storage_adapter.delete_folder(self.conan_revisions_root(ref))
+            self._revision_index.remove_folder(self._recipe_index_folder(ref))
         else:
             self._storage_adapter.delete_folder(self.base_folder(ref))
             self._remove_revision_from_index(ref)
+            self._revision_index.remove_folder(self._packages_index_folder(ref))
         self._delete_empty_dirs(ref)
 
+    @_clears_cache
     def remove_packages(self, ref, package_ids_filter):
         assert isinstance(ref, ConanFileReference)
         assert isinstance(package_ids_filter, list)
@@ -128,14 +230,17 @@ class ServerStore(object):
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
             self._storage_adapter.delete_folder(packages_folder)
+            self._revision_index.remove_folder(self._packages_index_folder(ref))
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+                self._revision_index.remove_folder(self._package_index_folder(pref))
         self._delete_empty_dirs(ref)
 
+    @_clears_cache
     def remove_package(self, pref):
         assert isinstance(pref, PackageReference)
         assert pref.revision is not None, "BUG: server store needs PREV remove_package"
@@ -144,18 +249,22 @@ class ServerStore(object):
         self._storage_adapter.delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
 
+    @_clears_cache
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        self._revision_index.remove_folder(self._packages_index_folder(ref))
 
+    @_clears_cache
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
 
+    @_clears_cache
     def remove_package_files(self, pref, files):
         subpath = self.package(pref)
         for filepath in files:
@@ -223,8 +332,7 @@ class ServerStore(object):
     # Methods to manage revisions
     def get_last_revision(self, ref):
         assert(isinstance(ref, ConanFileReference))
-        rev_file_path = self._recipe_revisions_file(ref)
-        return self._get_latest_revision(rev_file_path)
+        return self._get_latest_revision(self._recipe_index_folder(ref))
 
     def get_recipe_revisions(self, ref):
         """Returns a RevisionList"""
@@ -232,39 +340,36 @@ class ServerStore(object):
             tmp = RevisionList()
             tmp.add_revision(ref.revision)
             return tmp.as_list()
-        rev_file_path = self._recipe_revisions_file(ref)
-        revs = self._get_revisions_list(rev_file_path).as_list()
+        revs = self._get_revision_list(self._recipe_index_folder(ref)).as_list()
         if not revs:
             raise RecipeNotFoundException(ref, print_rev=True)
         return revs
 
     def get_last_package_revision(self, pref):
         assert(isinstance(pref, PackageReference))
-        rev_file_path = self._package_revisions_file(pref)
-        return self._get_latest_revision(rev_file_path)
+        return self._get_latest_revision(self._package_index_folder(pref))
 
     def update_last_revision(self, ref):
         assert(isinstance(ref, ConanFileReference))
-        rev_file_path = self._recipe_revisions_file(ref)
-        self._update_last_revision(rev_file_path, ref)
+        self._update_last_revision(self._recipe_index_folder(ref), ref)
 
     def update_last_package_revision(self, pref):
         assert(isinstance(pref, PackageReference))
-        rev_file_path = self._package_revisions_file(pref)
-        self._update_last_revision(rev_file_path, pref)
-
-    def _update_last_revision(self, rev_file_path, ref):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-        else:
-            rev_list = RevisionList()
+        self._update_last_revision(self._package_index_folder(pref), pref)
+
+    def _update_last_revision(self, index_folder, ref):
         if ref.revision is None:
             raise ConanException("Invalid revision for: %s" % ref.full_str())
-        rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        self._revision_index.add_revision(index_folder, ref.revision)
+        self._cache.pop(("revisions", index_folder))
+
+    def _get_revision_list(self, index_folder):
+        key = ("revisions", index_folder)
+        rev_list = self._cache.get(key)
+        if rev_list is None:
+            rev_list = self._revision_index.get_revision_list(index_folder)
+            self._cache.put(key, rev_list)
+        return rev_list
 
     def get_package_revisions(self, pref):
         """Returns a RevisionList"""
@@ -274,85 +379,48 @@ class ServerStore(object):
             tmp.add_revision(pref.revision)
             return tmp.as_list()
 
-        tmp = self._package_revisions_file(pref)
-        ret = self._get_revisions_list(tmp).as_list()
+        index_folder = self._package_index_folder(pref)
+        ret = self._get_revision_list(index_folder).as_list()
         if not ret:
             raise PackageNotFoundException(pref, print_rev=True)
         return ret
 
-    def _get_revisions_list(self, rev_file_path):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-            return rev_list
-        else:
-            return RevisionList()
-
-    def _get_latest_revision(self, rev_file_path):
-        rev_list = self._get_revisions_list(rev_file_path)
+    def _get_latest_revision(self, index_folder):
+        rev_list = self._get_revision_list(index_folder)
         if not rev_list:
             # FIXING BREAK MIGRATION NOT CREATING INDEXES
             # BOTH FOR RREV AND PREV THE FILE SHOULD BE CREATED WITH "0" REVISION
-            if self.path_exists(os.path.join(os.path.dirname(rev_file_path), DEFAULT_REVISION_V1)):
-                rev_list = RevisionList()
-                rev_list.add_revision(DEFAULT_REVISION_V1)
-                self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                                 lock_file=rev_file_path + ".lock")
-                return rev_list.latest_revision()
+            if self.path_exists(join(self._store_folder, index_folder, DEFAULT_REVISION_V1)):
+                self._revision_index.add_revision(index_folder, DEFAULT_REVISION_V1)
+                self._cache.pop(("revisions", index_folder))
+                rev_list = self._get_revision_list(index_folder)
             else:
                 return None
         return rev_list.latest_revision()
 
-    def _recipe_revisions_file(self, ref):
-        recipe_folder = normpath(join(self._store_folder, ref.dir_repr()))
-        return join(recipe_folder, REVISIONS_FILE)
+    @staticmethod
+    def _recipe_index_folder(ref):
+        """Folder of the recipe revisions in the index, relative to the storage"""
+        return ref.dir_repr()
+
+    def _packages_index_folder(self, ref):
+        return "/".join([self._recipe_index_folder(ref), ref.revision, PACKAGES_FOLDER])
 
-    def _package_revisions_file(self, pref):
-        tmp = normpath(join(self._store_folder, pref.ref.dir_repr()))
+    def _package_index_folder(self, pref):
         revision = {None: ""}.get(pref.ref.revision, pref.ref.revision)
-        p_folder = join(tmp, revision, PACKAGES_FOLDER, pref.id)
-        return join(p_folder, REVISIONS_FILE)
+        return "/".join([self._recipe_index_folder(pref.ref), revision, PACKAGES_FOLDER,
+                         pref.id])
 
     def get_revision_time(self, ref):
-        try:
-            rev_list = self._load_revision_list(ref)
-        except IOError:
-            return None
+        rev_list = self._get_revision_list(self._recipe_index_folder(ref))
         return rev_list.get_time(ref.revision)
 
     def get_package_revision_time(self, pref):
-        try:
-            rev_list = self._load_package_revision_list(pref)
-        except (IOError, OSError):
-            return None
-
+        rev_list = self._get_revision_list(self._package_index_folder(pref))
         return rev_list.get_time(pref.revision)
 
     def _remove_revision_from_index(self, ref):
-        rev_list = self._load_revision_list(ref)
-        rev_list.remove_revision(ref.revision)
-        self._save_revision_list(rev_list, ref)
+        self._revision_index.remove_revision(self._recipe_index_folder(ref), ref.revision)
 
     def _remove_package_revision_from_index(self, pref):
-        rev_list = self._load_package_revision_list(pref)
-        rev_list.remove_revision(pref.revision)
-        self._save_package_revision_list(rev_list, pref)
-
-    def _load_revision_list(self, ref):
-        path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
-
-    def _save_revision_list(self, rev_list, ref):
-        path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _save_package_revision_list(self, rev_list, pref):
-        path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _load_package_revision_list(self, pref):
-        path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        self._revision_index.remove_revision(self._package_index_folder(pref), pref.revision)
@@ -0,0 +1,70 @@
+from abc import ABCMeta, abstractmethod
+
+import six
+
+
+@six.add_metaclass(ABCMeta)
+class ServerStorageAdapter(object):
+    """ Access to the files of the server storage. Paths already contain the base folder of the
+    storage (base_storage_folder)
+    """
+
+    @abstractmethod
+    def base_storage_folder(self):
+        raise NotImplementedError()
+
+    # ONLY USED BY APIV1
+    @abstractmethod
+    def get_download_urls(self, paths, user=None):
+        """ {path: url} to download the files """
+        raise NotImplementedError()
+
+    # ONLY USED BY APIV1
+    @abstractmethod
+    def get_upload_urls(self, paths_sizes, user=None):
+        """ {path: url} to upload the files of the {path: size_in_bytes} dict """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_snapshot(self, absolute_path="", files_subset=None):
+        """ {path: md5} of the files in the folder """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_file_list(self, absolute_path="", files_subset=None):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_folder(self, path):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_file(self, path):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def path_exists(self, path):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def link_file(self, src, dst):
+        """ Makes dst have the same contents of src without copying them. Returns False if it is
+        not possible """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def read_file(self, path, lock_file):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def write_file(self, path, contents, lock_file):
+        raise NotImplementedError()
+
+    def file_saved(self, path):
+        """ Called once an uploaded file has been saved in path """
+        pass
+
+    def get_download_redirect(self, path):
+        """ URL where the file can be downloaded from instead of serving it from the server, or
+        None """
+        return None
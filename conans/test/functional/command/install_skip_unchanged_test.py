@@ -0,0 +1,152 @@
+import json
+import os
+import textwrap
+import unittest
+
+from conans.paths import BUILD_INFO_CMAKE
+from conans.test.utils.tools import TestClient, GenConanfile
+from conans.util.files import load
+
+SKIPPED = "Nothing changed since the previous install"
+
+
+class InstallSkipUnchangedTest(unittest.TestCase):
+
+    def setUp(self):
+        client = TestClient()
+        client.run("config set general.skip_unchanged_install=True")
+        client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                   .with_default_option("shared", False)})
+        client.run("create . pkg/1.0@user/testing")
+        consumer = textwrap.dedent("""
+            from conans import ConanFile
+            class Consumer(ConanFile):
+                requires = "pkg/[>=1.0]@user/testing"
+                generators = "cmake"
+                def imports(self):
+                    self.copy("*.h", dst="include")
+            """)
+        client.save({"conanfile.py": consumer}, clean_first=True)
+        client.run("install .")
+        self.assertNotIn(SKIPPED, client.out)
+        self.client = client
+
+    def unchanged_test(self):
+        client = self.client
+        client.run("install .")
+        self.assertIn(SKIPPED, client.out)
+        self.assertNotIn("Generated", client.out)
+
+        # Other generators or arguments need a new install
+        client.run("install . -g json")
+        self.assertNotIn(SKIPPED, client.out)
+        client.run("install . -g json")
+        self.assertIn(SKIPPED, client.out)
+
+    def json_test(self):
+        client = self.client
+        client.run("install . --json=skipped.json")
+        self.assertIn(SKIPPED, client.out)
+        client.run("config set general.skip_unchanged_install=False")
+        client.run("install . --json=installed.json")
+        self.assertNotIn(SKIPPED, client.out)
+
+        def installed(json_file):
+            info = json.loads(load(os.path.join(client.current_folder, json_file)))
+            for item in info["installed"]:
+                for doc in [item["recipe"]] + item["packages"]:
+                    doc.pop("time")
+            return info
+        skipped = installed("skipped.json")
+        self.assertEqual("pkg", skipped["installed"][0]["recipe"]["name"])
+        self.assertEqual(1, len(skipped["installed"][0]["packages"]))
+        self.assertEqual(installed("installed.json"), skipped)
+
+    def disabled_test(self):
+        client = self.client
+        client.run("config set general.skip_unchanged_install=False")
+        client.run("install .")
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertIn("Generated conaninfo.txt", client.out)
+
+    def changed_inputs_test(self):
+        client = self.client
+        client.run("install . -o pkg:shared=True --build=missing")
+        self.assertNotIn(SKIPPED, client.out)
+        client.run("install . -o pkg:shared=True --build=missing")
+        self.assertIn(SKIPPED, client.out)
+        client.run("install . -o pkg:shared=True")
+        self.assertNotIn(SKIPPED, client.out)
+
+        client.run("install . -o pkg:shared=True -s build_type=Debug")
+        self.assertNotIn(SKIPPED, client.out)
+
+        client.save({"conanfile.py": load(os.path.join(client.current_folder, "conanfile.py"))
+                     + "# Changed"})
+        client.run("install . -o pkg:shared=True -s build_type=Debug")
+        self.assertNotIn(SKIPPED, client.out)
+        client.run("install . -o pkg:shared=True -s build_type=Debug")
+        self.assertIn(SKIPPED, client.out)
+
+        client.run("install . -o pkg:shared=True -s build_type=Debug --build")
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertIn("pkg/1.0@user/testing: Forced build from source", client.out)
+
+    def changed_files_test(self):
+        client = self.client
+        os.remove(os.path.join(client.current_folder, BUILD_INFO_CMAKE))
+        client.run("install .")
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertTrue(os.path.exists(os.path.join(client.current_folder, BUILD_INFO_CMAKE)))
+
+    def changed_cache_test(self):
+        client = self.client
+        # A new version that resolves the version range
+        client.save({"conanfile.py": GenConanfile()}, clean_first=True)
+        client.run("create . pkg/1.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkg/[>=1.0]@user/testing")},
+                    clean_first=True)
+        client.run("install .")
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertIn("pkg/1.1@user/testing", client.out)
+        client.run("install .")
+        self.assertIn(SKIPPED, client.out)
+
+        # The binary is removed
+        client.run("remove pkg/1.1@user/testing -p -f")
+        client.run("install .", assert_error=True)
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertIn("Missing prebuilt package", client.out)
+
+    def lockfile_test(self):
+        client = self.client
+        client.run("graph lock .")
+        client.run("install . --lockfile")
+        self.assertNotIn(SKIPPED, client.out)
+        client.run("install . --lockfile")
+        self.assertIn(SKIPPED, client.out)
+
+    def changed_helpers_test(self):
+        client = self.client
+        consumer = textwrap.dedent("""
+            from conans import ConanFile
+            from helpers.options import shared
+            class Consumer(ConanFile):
+                requires = "pkg/[>=1.0]@user/testing"
+                exports = "helpers/*.py"
+                def configure(self):
+                    self.options["pkg"].shared = shared()
+            """)
+        client.save({"conanfile.py": consumer,
+                     "helpers/__init__.py": "",
+                     "helpers/options.py": "def shared():\n    return False\n"})
+        client.run("install .")
+        self.assertNotIn(SKIPPED, client.out)
+        client.run("install .")
+        self.assertIn(SKIPPED, client.out)
+
+        # Editing the imported helper changes the options of the graph
+        client.save({"helpers/options.py": "def shared():\n    return True\n"})
+        client.run("install .", assert_error=True)
+        self.assertNotIn(SKIPPED, client.out)
+        self.assertIn("Missing prebuilt package", client.out)
@@ -0,0 +1,59 @@
+import json
+import os
+import unittest
+
+from conans.test.utils.tools import TestClient, GenConanfile
+from conans.util.files import load
+
+
+class PerfTraceTest(unittest.TestCase):
+
+    def _trace(self, client, path="trace.json"):
+        trace = json.loads(load(os.path.join(client.current_folder, path)))
+        events = trace["traceEvents"]
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertGreaterEqual(event["dur"], 0)
+        return {(event["cat"], event["name"]) for event in events}, events
+
+    def install_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": GenConanfile().with_name("pkg").with_version("0.1")})
+        client.run("create . user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkg/[>0.0]@user/testing")},
+                    clean_first=True)
+        client.run("install . -g cmake --perf-trace=trace.json")
+        spans, events = self._trace(client)
+        for span in [("command", "conan"), ("graph", "load_graph"), ("graph", "expand_graph"),
+                     ("graph", "resolve_range"), ("binaries", "evaluate_graph"),
+                     ("binaries", "compute_package_id"), ("binaries", "evaluate_node"),
+                     ("install", "install"), ("install", "install_node"),
+                     ("recipe", "package_info"), ("generator", "cmake")]:
+            self.assertIn(span, spans)
+        node_spans = [e for e in events if e["name"] == "evaluate_node"]
+        self.assertEqual(1, len(node_spans))
+        self.assertIn("pkg/0.1@user/testing", node_spans[0]["args"]["node"])
+
+        # The command span contains all the others
+        command = [e for e in events if e["name"] == "conan"][0]
+        for event in events:
+            self.assertGreaterEqual(event["ts"], command["ts"])
+            self.assertLessEqual(event["ts"] + event["dur"], command["ts"] + command["dur"])
+
+        # Without the argument nothing is recorded
+        os.remove(os.path.join(client.current_folder, "trace.json"))
+        client.run("install .")
+        self.assertFalse(os.path.exists(os.path.join(client.current_folder, "trace.json")))
+
+    def create_error_test(self):
+        client = TestClient()
+        conanfile = str(GenConanfile().with_name("pkg").with_version("0.1"))
+        conanfile += """
+    def build(self):
+        raise Exception("Build failed")
+"""
+        client.save({"conanfile.py": conanfile})
+        client.run("create . user/testing --perf-trace=traces/trace.json", assert_error=True)
+        self.assertIn("Build failed", client.out)
+        spans, _ = self._trace(client, "traces/trace.json")
+        self.assertIn(("recipe", "build"), spans)
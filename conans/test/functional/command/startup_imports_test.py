@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from conans.test.utils.startup_benchmark import COMMANDS, benchmark_env, run_command
+
+
+class StartupImportsTest(unittest.TestCase):
+
+    def test_commands_without_recipes(self):
+        env = benchmark_env()
+        modules, _ = run_command(["--version"], env)
+        self.assertIn("conans.client.migrations", modules)  # The new cache is initialized
+
+        for command in COMMANDS:
+            modules, _ = run_command(command, env)
+            for module in ("requests", "conans.client.migrations", "conans.client.remote_manager",
+                           "conans.client.graph.graph_manager", "conans.model.conan_file",
+                           "conans.client.build.cmake"):
+                self.assertNotIn(module, modules, "'conan %s' imported %s"
+                                 % (" ".join(command), module))
+
+    def test_lazy_public_api(self):
+        # In a new interpreter, where nothing imported the public names nor the submodules yet
+        script = textwrap.dedent("""
+            from conans import *
+            assert issubclass(ConanFile, object) and callable(load) and tools.cpu_count()
+            assert "importlib" not in globals() and "types" not in globals()
+            import conans
+            assert conans.tools.cpu_count() and not hasattr(conans, "missing")
+            print("OK")
+            """)
+        output = subprocess.check_output([sys.executable, "-W", "ignore", "-c", script],
+                                         env=benchmark_env())
+        self.assertEqual("OK", output.decode().strip())
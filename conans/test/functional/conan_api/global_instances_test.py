@@ -0,0 +1,24 @@
+import unittest
+
+from conans import tools
+from conans.client.conan_api import ConanAPIV1
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+
+
+class GlobalInstancesTest(unittest.TestCase):
+
+    def test_lazy_global_instances(self):
+        # Even with conans.tools imported, the API doesn't initialize the requester
+        conan_api = ConanAPIV1(cache_folder=temp_folder(), output=TestBufferConanOutput())
+        conan_api.remote_list()
+        self.assertNotIn("requester", vars(conan_api.app))
+
+        # Until the tools use it
+        global_output, global_requester = tools.get_global_instances()
+        self.assertIs(conan_api.app.out, global_output)
+        self.assertIs(conan_api.app.requester, global_requester)
+
+        # Every API call defines them
+        conan_api.remote_list()
+        self.assertIs(conan_api.app.requester, tools.get_global_instances()[1])
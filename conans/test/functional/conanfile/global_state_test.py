@@ -0,0 +1,69 @@
+import os
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID
+
+CONANFILE = textwrap.dedent("""
+    import os
+    import sys
+    from conans import ConanFile
+
+    class Pkg(ConanFile):
+        global_state = %s
+
+        def _report(self, method):
+            self.output.info("%%s CWD: %%s" %% (method, os.getcwd()))
+            self.output.info("%%s ENV: %%s" %% (method, os.environ.get("MY_VAR")))
+            script = "import os; print('%%s RUN CWD: ' + os.getcwd()); " \\
+                     "print('%%s RUN ENV: ' + os.environ['MY_VAR'])" %% (method, method)
+            self.run('"%%s" -c "%%s"' %% (sys.executable, script))
+
+        def build(self):
+            self._report("build")
+
+        def package(self):
+            self._report("package")
+            self.run('"%%s" -c "open(\\'package.log\\', \\'w\\')"' %% sys.executable,
+                     cwd=self.package_folder)
+
+        def package_info(self):
+            self.output.info("package_info CWD: %%s" %% os.getcwd())
+            self.output.info("package_info CONTEXT: %%s" %% self.execution_context.cwd)
+    """)
+
+
+class GlobalStateTest(unittest.TestCase):
+
+    def _create(self, global_state):
+        client = TestClient()
+        client.save({"conanfile.py": CONANFILE % global_state})
+        client.run("create . pkg/1.0@user/testing -e MY_VAR=myvalue")
+        ref = ConanFileReference.loads("pkg/1.0@user/testing")
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        layout = client.cache.package_layout(ref)
+        self.build_folder = layout.build(pref)
+        self.package_folder = layout.package(pref)
+        self.assertTrue(os.path.exists(os.path.join(self.package_folder, "package.log")))
+        return client.out
+
+    def global_state_test(self):
+        out = self._create(True)
+        for method in ("build", "package"):
+            self.assertIn("%s CWD: %s" % (method, self.build_folder), out)
+            self.assertIn("%s ENV: myvalue" % method, out)
+            self.assertIn("%s RUN CWD: %s" % (method, self.build_folder), out)
+            self.assertIn("%s RUN ENV: myvalue" % method, out)
+        self.assertIn("package_info CWD: %s" % self.package_folder, out)
+        self.assertIn("package_info CONTEXT: None", out)
+
+    def explicit_state_test(self):
+        out = self._create(False)
+        for method in ("build", "package"):
+            self.assertNotIn("%s CWD: %s" % (method, self.build_folder), out)
+            self.assertIn("%s ENV: None" % method, out)
+            self.assertIn("%s RUN CWD: %s" % (method, self.build_folder), out)
+            self.assertIn("%s RUN ENV: myvalue" % method, out)
+        self.assertNotIn("package_info CWD: %s" % self.package_folder, out)
+        self.assertIn("package_info CONTEXT: %s" % self.package_folder, out)
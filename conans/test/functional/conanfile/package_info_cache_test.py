@@ -0,0 +1,109 @@
+import json
+import os
+import textwrap
+import unittest
+
+from conans.client.package_info_cache import PACKAGE_INFO_CACHE
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load
+
+CONANFILE = textwrap.dedent("""
+    from conans import ConanFile
+    class Pkg(ConanFile):
+        settings = "build_type"
+        def package_info(self):
+            self.output.info("Calling package_info()")
+            self.cpp_info.libs = ["mylib"]
+            self.cpp_info.defines = ["MYDEFINE_%s" % self.settings.build_type]
+            self.cpp_info.debug.libs = ["mylibd"]
+            self.env_info.MYVAR = "myvalue"
+            self.env_info.PATH.append("mypath")
+            self.user_info.myuservar = "myuservalue"
+    """)
+
+CONSUMER = textwrap.dedent("""
+    from conans import ConanFile
+    class Consumer(ConanFile):
+        requires = "pkg/1.0@lasote/testing"
+        def build(self):
+            info = self.deps_cpp_info["pkg"]
+            self.output.info("LIBS: %s %s" % (info.libs, info.debug.libs))
+            self.output.info("DEFINES: %s" % info.defines)
+            self.output.info("ENV: %s %s" % (self.deps_env_info["pkg"].MYVAR,
+                                             self.deps_env_info["pkg"].PATH))
+            self.output.info("USER: %s" % self.deps_user_info["pkg"].myuservar)
+    """)
+
+
+class PackageInfoCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(servers={"default": TestServer()},
+                                 users={"default": [("lasote", "mypass")]})
+        self.client.run("config set general.cache_package_info=True")
+        self.client.save({"conanfile.py": CONANFILE})
+        self.client.run("create . pkg/1.0@lasote/testing")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self.client.out)
+
+    def _consume(self, settings=""):
+        """ returns the output of the install
+        """
+        self.client.save({"conanfile.py": CONSUMER}, clean_first=True)
+        self.client.run("install . %s" % settings)
+        install_output = self.client.out
+        self.client.run("build .")
+        return install_output
+
+    def _assert_info(self, build_type="Release"):
+        out = self.client.out
+        self.assertIn("LIBS: ['mylib'] ['mylibd']", out)
+        self.assertIn("DEFINES: ['MYDEFINE_%s']" % build_type, out)
+        self.assertIn("ENV: myvalue ['mypath']", out)
+        self.assertIn("USER: myuservalue", out)
+
+    def cached_test(self):
+        self.assertNotIn("Calling package_info()", self._consume())
+        self._assert_info()
+
+        # Other settings that package_info() can read
+        self.client.run("install . -s pkg:build_type=Debug --build=missing")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self.client.out)
+        self.assertNotIn("Calling package_info()", self._consume("-s pkg:build_type=Debug"))
+        self._assert_info("Debug")
+
+    def not_uploaded_test(self):
+        ref = ConanFileReference.loads("pkg/1.0@lasote/testing")
+        layout = self.client.cache.package_layout(ref)
+        package_id = os.listdir(layout.packages())[0]
+        package_folder = layout.package(PackageReference(ref, package_id))
+        data = json.loads(load(os.path.join(package_folder, PACKAGE_INFO_CACHE)))
+        self.assertEqual(data["cpp_info"]["libs"], ["mylib"])
+
+        self.client.run("upload pkg/1.0@lasote/testing --all -c")
+        self.assertIn("Uploaded conan recipe", self.client.out)
+        self.client.run("remove * -f")
+        # Otherwise the downloaded package would have the same cached values
+        self.client.run("install pkg/1.0@lasote/testing")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self.client.out)
+
+    def disabled_test(self):
+        self.client.run("config set general.cache_package_info=False")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self._consume())
+        self._assert_info()
+
+    def opt_out_test(self):
+        self.client.save({"conanfile.py": CONANFILE.replace('settings = "build_type"',
+                                                            'settings = "build_type"\n'
+                                                            '    cache_package_info = False')})
+        self.client.run("create . pkg/1.0@lasote/testing")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self._consume())
+        self._assert_info()
+
+    def rebuilt_package_test(self):
+        self.client.save({"conanfile.py": CONSUMER}, clean_first=True)
+        self.client.run("install .")
+        self.assertNotIn("Calling package_info()", self.client.out)
+        # The cached results are removed with the previous binary
+        self.client.run("install . --build=pkg")
+        self.assertIn("pkg/1.0@lasote/testing: Calling package_info()", self.client.out)
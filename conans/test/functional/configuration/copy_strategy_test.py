@@ -0,0 +1,55 @@
+import os
+import stat
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID
+
+
+@unittest.skipUnless(hasattr(os, "link"), "Requires hard links")
+class HardlinkCopyStrategyTest(unittest.TestCase):
+
+    def setUp(self):
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports_sources = "*.h"
+                def package(self):
+                    self.copy("*.h", dst="include")
+            """)
+        self.client = TestClient()
+        self.client.run("config set general.copy_strategy=hardlink")
+        self.client.save({"conanfile.py": conanfile, "header.h": "header"})
+        self.client.run("create . pkg/1.0@user/testing")
+        self.ref = ConanFileReference.loads("pkg/1.0@user/testing")
+        self.pref = PackageReference(self.ref, NO_SETTINGS_PACKAGE_ID)
+
+    def _package_header(self, ref=None):
+        layout = self.client.cache.package_layout(ref or self.ref)
+        pref = PackageReference(ref or self.ref, NO_SETTINGS_PACKAGE_ID)
+        return os.path.join(layout.package(pref), "include", "header.h")
+
+    def create_test(self):
+        layout = self.client.cache.package_layout(self.ref)
+        build_header = os.path.join(layout.build(self.pref), "header.h")
+        # source folder, build folder and package folder
+        self.assertEqual(3, os.stat(build_header).st_nlink)
+        self.assertTrue(os.path.samefile(build_header, self._package_header()))
+
+    def copy_test(self):
+        self.client.run("copy pkg/1.0@user/testing other/channel --all")
+        other_header = self._package_header(ConanFileReference.loads("pkg/1.0@other/channel"))
+        self.assertTrue(os.path.samefile(self._package_header(), other_header))
+
+    def imports_read_only_cache_test(self):
+        self.client.run("config set general.read_only_cache=True")
+        self.client.run("create . pkg/1.0@user/testing")
+        self.client.save({"conanfile.txt": "[requires]\npkg/1.0@user/testing\n"
+                                           "[imports]\ninclude, *.h -> ."}, clean_first=True)
+        self.client.run("install .")
+        imported = os.path.join(self.client.current_folder, "header.h")
+        # The imported files are writable, not the hard links to the files of the cache
+        self.assertEqual(1, os.stat(imported).st_nlink)
+        self.assertTrue(os.stat(imported).st_mode & stat.S_IWRITE)
+        self.assertFalse(os.stat(self._package_header()).st_mode & stat.S_IWRITE)
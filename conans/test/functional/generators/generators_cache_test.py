@@ -0,0 +1,72 @@
+import os
+import textwrap
+import unittest
+
+from mock import patch
+
+from conans.client.generators import GENERATORS_CACHE, CMakeGenerator
+from conans.paths import BUILD_INFO, BUILD_INFO_CMAKE
+from conans.test.utils.tools import TestClient, GenConanfile
+from conans.util.files import load, save
+
+
+def _failing_content(generator):
+    raise Exception("Rendered again")
+
+
+class GeneratorsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        client = TestClient()
+        client.run("config set general.cache_generators=True")
+        client.save({"conanfile.py": GenConanfile().with_setting("build_type")})
+        client.run("create . pkg/1.0@user/testing")
+        consumer = textwrap.dedent("""
+            [requires]
+            pkg/1.0@user/testing
+            [generators]
+            cmake
+            txt
+            virtualrunenv
+            """)
+        client.save({"conanfile.txt": consumer}, clean_first=True)
+        client.run("install .")
+        self.assertIn("Generator cmake created %s" % BUILD_INFO_CMAKE, client.out)
+        self.assertTrue(os.path.exists(os.path.join(client.current_folder, GENERATORS_CACHE)))
+        self.client = client
+
+    def cached_test(self):
+        client = self.client
+        cmake_path = os.path.join(client.current_folder, BUILD_INFO_CMAKE)
+        mtime = os.path.getmtime(cmake_path)
+        with patch.object(CMakeGenerator, "content", property(_failing_content)):
+            client.run("install .")
+        self.assertIn("Generator cmake created %s" % BUILD_INFO_CMAKE, client.out)
+        self.assertIn("Generator txt created %s" % BUILD_INFO, client.out)
+        self.assertIn("Generator virtualrunenv created activate_run.sh", client.out)
+        self.assertEqual(mtime, os.path.getmtime(cmake_path))
+
+    def changed_inputs_test(self):
+        client = self.client
+        with patch.object(CMakeGenerator, "content", property(_failing_content)):
+            client.run("install . -s build_type=Debug --build=missing", assert_error=True)
+        self.assertIn("Rendered again", client.out)
+
+        client.run("install . -s build_type=Debug")
+        self.assertIn('set(CONAN_SETTINGS_BUILD_TYPE "Debug")',
+                      load(os.path.join(client.current_folder, BUILD_INFO_CMAKE)))
+
+    def modified_file_test(self):
+        client = self.client
+        cmake_path = os.path.join(client.current_folder, BUILD_INFO_CMAKE)
+        content = load(cmake_path)
+        save(cmake_path, "modified")
+        client.run("install .")
+        self.assertEqual(content, load(cmake_path))
+
+    def disabled_test(self):
+        client = self.client
+        client.run("config set general.cache_generators=False")
+        with patch.object(CMakeGenerator, "content", property(_failing_content)):
+            client.run("install .", assert_error=True)
+        self.assertIn("Rendered again", client.out)
@@ -1,7 +1,11 @@
 import os
 import platform
+import time
 import unittest
 
+from mock import patch
+
+from conans.client import file_copier
 from conans.client.file_copier import FileCopier
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, save
@@ -171,3 +175,27 @@ class FileCopierTest(unittest.TestCase):
         copier = FileCopier([folder1], folder2)
         copier("*.txt", excludes=("*Test*.txt", "*Impl*"))
         self.assertEqual(['MyLib.txt'], os.listdir(folder2))
+
+    def folder_index_test(self):
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "include/header.h"), "")
+        save(os.path.join(folder1, "lib/mylib.a"), "")
+        # Folders modified long ago, the ones modified recently are always listed again
+        past = time.time() - 100
+        for folder in (folder1, os.path.join(folder1, "include"), os.path.join(folder1, "lib")):
+            os.utime(folder, (past, past))
+
+        folder2 = temp_folder()
+        copier = FileCopier([folder1], folder2)
+        with patch.object(file_copier, "_list_folder", wraps=file_copier._list_folder) as listed:
+            self.assertEqual([os.path.join(folder2, "include", "header.h")], copier("*.h"))
+            self.assertEqual(3, listed.call_count)
+            self.assertEqual([os.path.join(folder2, "lib", "mylib.a")], copier("*.a"))
+            self.assertEqual(3, listed.call_count)
+
+            # The folders with added files are listed again
+            save(os.path.join(folder1, "lib/other.a"), "")
+            self.assertEqual(sorted([os.path.join(folder2, "lib", "mylib.a"),
+                                     os.path.join(folder2, "lib", "other.a")]),
+                             sorted(copier("*.a")))
+            self.assertEqual(4, listed.call_count)
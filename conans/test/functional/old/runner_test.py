@@ -1,10 +1,13 @@
 import os
+import platform
 import unittest
 
 import six
 
 from conans.client.runner import ConanRunner
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, TestBufferConanOutput
+from conans.util.files import load
 
 
 class RunnerTest(unittest.TestCase):
@@ -179,3 +182,17 @@ class ConanFileToolsTest(ConanFile):
         client.run("build .", assert_error=True)
         self.assertIn("Error while executing 'mkdir test_folder'", client.out)
         self.assertFalse(os.path.exists(test_folder))
+
+    def env_cwd_test(self):
+        # Without modifying the current directory and environment of the process
+        folder = temp_folder()
+        env = dict(os.environ, MY_VAR="myvalue")
+        command = "echo %MY_VAR%> out.txt" if platform.system() == "Windows" else \
+            "echo $MY_VAR > out.txt"
+        runner = ConanRunner()
+        for output in (True, six.StringIO()):
+            self.assertEqual(0, runner(command, output=output, cwd=folder, env=env))
+            self.assertEqual("myvalue", load(os.path.join(folder, "out.txt")).strip())
+            os.remove(os.path.join(folder, "out.txt"))
+        self.assertNotIn("MY_VAR", os.environ)
+        self.assertEqual(os.system("exit 3"), runner("exit 3", cwd=folder))
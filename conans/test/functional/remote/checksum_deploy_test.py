@@ -0,0 +1,47 @@
+import os
+import unittest
+
+from conans import REVISIONS
+from conans.model.ref import ConanFileReference
+from conans.paths import CONANFILE
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+
+
+class ServerChecksumDeployTest(unittest.TestCase):
+
+    def _upload_twice(self, server_capabilities=None):
+        self.server = TestServer(write_permissions=[("*/*@*/*", "*")],
+                                 server_capabilities=server_capabilities)
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        client.save({CONANFILE: GenConanfile().with_name("Hello").with_version("0.1")})
+        client.run("export . lasote/stable")
+        client.run("upload Hello/0.1@lasote/stable -c")
+        client.run("export . lasote/testing")
+        client.run("upload Hello/0.1@lasote/testing -c")
+        self.assertIn("Uploaded conan recipe 'Hello/0.1@lasote/testing'", client.out)
+
+        inodes = []
+        for ref in ("Hello/0.1@lasote/stable", "Hello/0.1@lasote/testing"):
+            ref = ConanFileReference.loads(ref)
+            rev = self.server.server_store.get_last_revision(ref).revision
+            export = self.server.server_store.export(ref.copy_with_rev(rev))
+            inodes.append(os.stat(os.path.join(export, CONANFILE)).st_ino)
+        return inodes
+
+    def deduplicated_upload_test(self):
+        stable, testing = self._upload_twice()
+        self.assertEqual(stable, testing)
+
+    def no_capability_test(self):
+        stable, testing = self._upload_twice(server_capabilities=[REVISIONS])
+        self.assertNotEqual(stable, testing)
+
+    def unknown_checksum_test(self):
+        self._upload_twice()
+        ref = ConanFileReference.loads("Hello/0.1@lasote/stable")
+        rev = self.server.server_store.get_last_revision(ref).revision
+        path = os.path.join(self.server.server_store.export(ref.copy_with_rev(rev)), "other.txt")
+        self.assertFalse(self.server.server_store.deploy_file_from_checksum("a" * 40, path))
+        self.assertFalse(self.server.server_store.deploy_file_from_checksum("../../etc", path))
+        self.assertFalse(os.path.exists(path))
@@ -0,0 +1,67 @@
+import os
+import textwrap
+import time
+import unittest
+
+from conans import COMPLEX_SEARCH_CAPABILITY, REVISIONS
+from conans.client.tools import environment_append
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load
+
+
+class PackageDeltaUpdateTest(unittest.TestCase):
+
+    conanfile = textwrap.dedent("""
+        import os
+        from conans import ConanFile, tools
+
+        class Pkg(ConanFile):
+            def package(self):
+                content = os.getenv("LIB_CONTENT")
+                for i in range(6):
+                    tools.save(os.path.join(self.package_folder, "include", "file%s.h" % i),
+                               "header %s" % i)
+                tools.save(os.path.join(self.package_folder, "lib", "mylib.a"), content)
+                if content == "v1":
+                    tools.save(os.path.join(self.package_folder, "old", "removed.h"), "")
+        """)
+
+    def _update(self, server_capabilities=None):
+        server = TestServer(write_permissions=[("*/*@*/*", "*")],
+                            server_capabilities=server_capabilities)
+        servers = {"default": server}
+        users = {"default": [("lasote", "mypass")]}
+        creator = TestClient(servers=servers, users=users, revisions_enabled=True)
+        creator.save({"conanfile.py": self.conanfile})
+        with environment_append({"LIB_CONTENT": "v1"}):
+            creator.run("create . pkg/1.0@user/testing")
+        creator.run("upload * --all --confirm")
+
+        client = TestClient(servers=servers, users=users, revisions_enabled=True)
+        client.run("install pkg/1.0@user/testing")
+
+        time.sleep(1)  # The manifest time has to be newer
+        with environment_append({"LIB_CONTENT": "v2"}):
+            creator.run("create . pkg/1.0@user/testing")
+        creator.run("upload * --all --confirm")
+
+        client.run("install pkg/1.0@user/testing --update")
+        self.assertIn("Current package is older than remote upstream one", client.out)
+
+        ref = ConanFileReference.loads("pkg/1.0@user/testing")
+        package_folder = client.cache.package_layout(ref).packages()
+        package_folder = os.path.join(package_folder, os.listdir(package_folder)[0])
+        self.assertEqual("v2", load(os.path.join(package_folder, "lib", "mylib.a")))
+        self.assertEqual("header 3", load(os.path.join(package_folder, "include", "file3.h")))
+        self.assertFalse(os.path.exists(os.path.join(package_folder, "old")))
+        return client
+
+    def delta_update_test(self):
+        client = self._update()
+        self.assertIn("Package updated with 1 changed files", client.out)
+
+    def no_capability_full_download_test(self):
+        client = self._update(server_capabilities=[COMPLEX_SEARCH_CAPABILITY, REVISIONS])
+        self.assertNotIn("Package updated with", client.out)
+        self.assertIn("Package installed", client.out)
@@ -8,7 +8,8 @@ from nose.plugins.attrib import attr
 from conans import DEFAULT_REVISION_V1
 from conans.client.conf import ConanClientConfigParser
 from conans.client.rest.conan_requester import ConanRequester
-from conans.client.rest.rest_client import RestApiClient
+from conans.client.cache.remote_registry import Remote
+from conans.client.rest.rest_client import RestApiClientFactory
 from conans.client.rest.rest_client_v1 import complete_url
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
@@ -67,13 +68,14 @@ class RestApiTest(unittest.TestCase):
             save(filename, "")
             config = ConanClientConfigParser(filename)
             requester = ConanRequester(config, requests)
-            cls.api = RestApiClient(TestBufferConanOutput(), requester=requester,
-                                    revisions_enabled=False)
-            cls.api.remote_url = "http://127.0.0.1:%s" % str(cls.server.port)
+            factory = RestApiClientFactory(TestBufferConanOutput(), requester=requester,
+                                           revisions_enabled=False)
+            remote = Remote("myremote", "http://127.0.0.1:%s" % str(cls.server.port), True, True)
+            api = factory.new(remote, None, None, {})
 
             # Authenticate user
-            token, _ = cls.api.authenticate("private_user", "private_pass")
-            cls.api.token = token
+            token, _ = api.authenticate("private_user", "private_pass")
+            cls.api = factory.new(remote, token, None, {})
 
     @classmethod
     def tearDownClass(cls):
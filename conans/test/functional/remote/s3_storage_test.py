@@ -0,0 +1,83 @@
+import os
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.s3_server import TestS3Server
+from conans.test.utils.tools import TestClient, TestServer
+
+
+CONANFILE = textwrap.dedent("""
+    from conans import ConanFile
+
+    class HelloConan(ConanFile):
+        exports_sources = "*.h"
+
+        def package(self):
+            self.copy("*.h", dst="include")
+    """)
+
+
+class S3StorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.s3 = TestS3Server()
+        self.server = TestServer(write_permissions=[("*/*@*/*", "*")],
+                                 s3_storage=self.s3.s3_storage)
+
+    def tearDown(self):
+        self.s3.stop()
+
+    def _client(self, revisions_enabled):
+        return TestClient(servers={"default": self.server},
+                          users={"default": [("lasote", "mypass")]},
+                          revisions_enabled=revisions_enabled)
+
+    def _upload_install_remove(self, revisions_enabled):
+        client = self._client(revisions_enabled)
+        client.save({"conanfile.py": CONANFILE, "hello.h": "header"})
+        client.run("create . Hello/0.1@lasote/stable")
+        client.run("upload Hello/0.1@lasote/stable --all")
+        uploaded = sorted(key.split("/")[-1] for key in self.s3.objects)
+        self.assertEqual(["conan_package.tgz", "conan_sources.tgz"], uploaded)
+
+        # The API v2 redirects the downloads of the archives to the bucket, the API v1 serves them
+        client.run("remove * -f")
+        client.run("install Hello/0.1@lasote/stable --build=missing")
+        downloaded = sorted(key.split("/")[-1] for method, key in self.s3.requests
+                            if method == "GET")
+        self.assertEqual(["conan_package.tgz"] if revisions_enabled else [], downloaded)
+        client.run("remove * -f")
+        client.run("install Hello/0.1@lasote/stable --build=Hello")
+        self.assertIn("Hello/0.1@lasote/stable: Created package", client.out)
+        downloaded = [key.split("/")[-1] for method, key in self.s3.requests if method == "GET"]
+        self.assertEqual(revisions_enabled, "conan_sources.tgz" in downloaded)
+
+        client.run("remove Hello/0.1@lasote/stable -r default -f")
+        self.assertEqual({}, self.s3.objects)
+        self.assertFalse(self.server.recipe_exists(ConanFileReference.loads(
+            "Hello/0.1@lasote/stable")))
+
+    def api_v1_test(self):
+        self._upload_install_remove(revisions_enabled=False)
+
+    def api_v2_test(self):
+        self._upload_install_remove(revisions_enabled=True)
+
+    def failed_put_test(self):
+        client = self._client(revisions_enabled=True)
+        client.save({"conanfile.py": CONANFILE, "hello.h": "header"})
+        client.run("create . Hello/0.1@lasote/stable")
+        self.s3.fail_puts = True
+        client.run("upload Hello/0.1@lasote/stable --all --retry=0", assert_error=True)
+        self.assertEqual({}, self.s3.objects)
+        # Neither the archive nor its checksum remain in the server, to be downloaded or deployed
+        for _, _, files in os.walk(self.server.server_store.store):
+            self.assertFalse(set(files).intersection(["conan_sources.tgz", "conan_package.tgz"]))
+        self.assertEqual((0, 0), self.server.server_store.remove_orphan_blobs(dry_run=True))
+
+        self.s3.fail_puts = False
+        client.run("upload Hello/0.1@lasote/stable --all --retry=0")
+        client.run("remove * -f")
+        client.run("install Hello/0.1@lasote/stable --build=Hello")
+        self.assertIn("Hello/0.1@lasote/stable: Created package", client.out)
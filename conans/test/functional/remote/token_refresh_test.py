@@ -1,10 +1,11 @@
+import threading
 import unittest
 
 from mock import Mock
 
 from conans.client.cache.remote_registry import Remote
 from conans.client.rest.auth_manager import ConanApiAuthManager
-from conans.client.rest.rest_client import RestApiClient
+from conans.client.rest.rest_client import RestApiClientFactory
 from conans.model.ref import ConanFileReference
 from conans.test.utils.tools import TestBufferConanOutput
 from conans.client.userio import UserIO
@@ -23,9 +24,9 @@ class LocalDBMock(object):
     def get_username(self, _):
         return self.user
 
-    def store(self, user, access_token, refresh_token, _):
+    def store(self, user, token, refresh_token, remote_url):
         self.user = user
-        self.access_token = access_token
+        self.access_token = token
         self.refresh_token = refresh_token
 
 
@@ -101,17 +102,18 @@ class TestTokenRefresh(unittest.TestCase):
         mocked_user_io.get_username = Mock(return_value="myuser")
         mocked_user_io.get_password = Mock(return_value="mypassword")
 
-        requester = RequesterWithTokenMock()
-        self.rest_client = RestApiClient(mocked_user_io.out,
-                                         requester, revisions_enabled=False, put_headers=None)
+        self.requester = RequesterWithTokenMock()
+        self.rest_client_factory = RestApiClientFactory(mocked_user_io.out, self.requester,
+                                                        revisions_enabled=False, put_headers=None)
         self.localdb = LocalDBMock()
-        self.auth_manager = ConanApiAuthManager(self.rest_client, mocked_user_io, self.localdb)
-        self.auth_manager.remote = Remote("myremote", "myurl", True, True)
-        self.auth_manager.user = None
+        self.auth_manager = ConanApiAuthManager(self.rest_client_factory, mocked_user_io,
+                                                self.localdb)
+        self.remote = Remote("myremote", "myurl", True, True)
+        self.ref = ConanFileReference.loads("lib/1.0@conan/stable")
 
     def test_auth_with_token(self):
         """Test that if the capability is there, then we use the new endpoint"""
-        self.auth_manager.get_recipe(ConanFileReference.loads("lib/1.0@conan/stable"), ".")
+        self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".")
         self.assertEqual(self.localdb.user, "myuser")
         self.assertEqual(self.localdb.access_token, "access_token")
         self.assertEqual(self.localdb.refresh_token, "refresh_token")
@@ -120,12 +122,36 @@ class TestTokenRefresh(unittest.TestCase):
         """The mock will raise 401 for a token value "expired" so it will try to refresh
         and only if the refresh endpoint is called, the value will be "refreshed_access_token"
         """
+        self.localdb.user = "myuser"
         self.localdb.access_token = "expired"
         self.localdb.refresh_token = "refresh_token"
-        self.rest_client.token = self.localdb.access_token
-        self.rest_client.refresh_token = self.localdb.refresh_token
 
-        self.auth_manager.get_recipe(ConanFileReference.loads("lib/1.0@conan/stable"), ".")
+        self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".")
         self.assertEqual(self.localdb.user, "myuser")
         self.assertEqual(self.localdb.access_token, "refreshed_access_token")
         self.assertEqual(self.localdb.refresh_token, "refresh_token")
+
+    def test_concurrent_refresh_with_token(self):
+        """Several threads getting a 401 for the same expired token only refresh it once"""
+        self.localdb.user = "myuser"
+        self.localdb.access_token = "expired"
+        self.localdb.refresh_token = "refresh_token"
+
+        refresh_calls = []
+        original_post = self.requester.post
+
+        def post(url, **kwargs):
+            refresh_calls.append(url)
+            return original_post(url, **kwargs)
+
+        self.requester.post = post
+        threads = [threading.Thread(target=self.auth_manager.call_rest_api_method,
+                                    args=(self.remote, "get_recipe", self.ref, "."))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(refresh_calls))
+        self.assertEqual(self.localdb.access_token, "refreshed_access_token")
@@ -3,9 +3,10 @@
 import os
 import unittest
 
+from mock import patch
 from six import StringIO
 
-from conans.client.cache.cache import ClientCache
+from conans.client.cache.cache import ClientCache, SETTINGS_CACHE, _settings_definitions
 from conans.client.output import ConanOutput
 from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
@@ -68,3 +69,29 @@ class CacheTest(unittest.TestCase):
             metadata.packages[pref2.id].revision = "prevision"
 
         self.assertTrue(layout2.package_exists(pref2))
+
+    def test_settings_cache(self):
+        _settings_definitions.clear()  # Other tests could have parsed the same settings.yml
+        settings = self.cache.settings
+        settings.os = "Windows"
+        settings.compiler.remove("gcc")
+        # The cached definition is not modified
+        self.assertIsNone(self.cache.settings.os.value)
+        self.assertIn("gcc", self.cache.settings.compiler.values_range)
+
+        cache_path = os.path.join(self.cache.cache_folder, SETTINGS_CACHE)
+        self.assertTrue(os.path.exists(cache_path))
+        _settings_definitions.clear()  # As a new process, it uses the file
+        with patch("conans.client.cache.cache.safe_load", side_effect=Exception("Parsed")):
+            self.assertIn("gcc", self.cache.settings.compiler.values_range)
+
+        # A modified settings.yml is parsed again
+        save(self.cache.settings_path, "os: [Windows, Linux]")
+        self.assertEqual(["os"], self.cache.settings.fields)
+        _settings_definitions.clear()
+        self.assertEqual(["os"], self.cache.settings.fields)
+
+        # A corrupted cache file is ignored
+        save(cache_path, "corrupted")
+        _settings_definitions.clear()
+        self.assertEqual(["os"], self.cache.settings.fields)
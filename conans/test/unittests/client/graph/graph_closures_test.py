@@ -0,0 +1,46 @@
+import unittest
+
+from mock import patch
+
+from conans.client.graph.graph import Node
+from conans.test.utils.graph_builder_benchmark import load_synthetic_graph
+
+
+def _connect_closure(node, other_node):
+    # The connection of the closures without the bits of the nodes, one node after the other
+    name = other_node.name
+    node.public_closure[name] = other_node
+    node.public_deps[name] = other_node
+    other_node.inverse_closure.add(node)
+
+
+def _connect_closures(node, closure, _):
+    for _, other_node in sorted(closure.values(), key=lambda item: item[0]):
+        _connect_closure(node, other_node)
+
+
+def _closures(graph):
+    """ {node index: ([closure node indexes in order], {public_deps name: node index})} """
+    return {node.index: ([n.index for n in node.public_closure.values()],
+                         {name: n.index for name, n in node.public_deps.items()})
+            for node in graph.nodes}
+
+
+class GraphClosuresTest(unittest.TestCase):
+
+    def _check_closures(self, **kwargs):
+        graph, _ = load_synthetic_graph(**kwargs)
+        with patch.object(Node, "connect_closure", _connect_closure):
+            with patch.object(Node, "connect_closures", _connect_closures):
+                expected, _ = load_synthetic_graph(**kwargs)
+        self.assertEqual(len(expected.nodes), len(graph.nodes))
+        self.assertEqual(_closures(expected), _closures(graph))
+        for node in graph.nodes:
+            bits = sum(1 << n.index for n in node.public_closure.values())
+            self.assertEqual(bits, node.public_closure_bits)
+
+    def diamonds_test(self):
+        self._check_closures(packages=120, requires=4, layers=8)
+
+    def private_diamonds_test(self):
+        self._check_closures(packages=120, requires=4, layers=8, private=0.1)
@@ -181,3 +181,37 @@ VAR2=23
         deps_cpp_info = DepsCppInfo()
         deps_cpp_info.update(info, "myname")
         self.assertIn("MyName", deps_cpp_info["myname"].name)
+
+    def update_order_test(self):
+        def cpp_info(name, defines, requires_libs=()):
+            info = CppInfo(temp_folder())
+            info.libs = [name] + list(requires_libs)
+            info.defines = defines
+            info.debug.libs = [name + "d"]
+            return info
+
+        zlib = cpp_info("zlib", ["ZLIB", "COMMON"])
+        bzip2 = cpp_info("bzip2", ["BZIP2", "COMMON"])
+        boost = cpp_info("boost", ["BOOST"], requires_libs=["zlib", "bzip2"])
+
+        deps_cpp_info = DepsCppInfo()
+        for name, info in (("boost", boost), ("zlib", zlib), ("bzip2", bzip2)):
+            deps_cpp_info.update(info, name)
+        # The libs keep their last appearance, the defines the first one but in reverse order
+        self.assertEqual(deps_cpp_info.libs, ["boost", "zlib", "bzip2"])
+        self.assertEqual(deps_cpp_info.defines, ["BZIP2", "ZLIB", "COMMON", "BOOST"])
+        self.assertEqual(deps_cpp_info.debug.libs, ["boostd", "zlibd", "bzip2d"])
+        self.assertEqual(list(deps_cpp_info.deps), ["boost", "zlib", "bzip2"])
+
+        all_at_once = DepsCppInfo()
+        all_at_once.update_all([("boost", boost), ("zlib", zlib), ("bzip2", bzip2)])
+        for attr in ("libs", "defines", "include_paths", "lib_paths", "rootpaths"):
+            self.assertEqual(getattr(deps_cpp_info, attr), getattr(all_at_once, attr))
+        self.assertEqual(deps_cpp_info.debug.libs, all_at_once.debug.libs)
+
+        copied = all_at_once.copy()
+        copied.libs.append("other")
+        copied.debug.libs.append("otherd")
+        self.assertEqual(all_at_once.libs, ["boost", "zlib", "bzip2"])
+        self.assertEqual(all_at_once.debug.libs, ["boostd", "zlibd", "bzip2d"])
+        self.assertIs(copied["zlib"], zlib)
@@ -1,8 +1,10 @@
+import os
 import unittest
 
-from conans.model.conan_file import ConanFile
+from conans.model.conan_file import ConanFile, conanfile_environment_append, conanfile_execution
 from conans.model.env_info import EnvValues
 from conans.model.settings import Settings
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestBufferConanOutput, TestClient
 
 
@@ -40,3 +42,32 @@ class Pkg(ConanFile):
         client.save({"conanfile.py": conanfile.replace("pass",
                                                        "requires = 'PkgB/0.1@user/testing'")})
         client.run("create . PkgC/0.1@user/testing")
+
+    def test_execution_context(self):
+        calls = []
+
+        def runner(command, output, log_filepath=None, cwd=None, env=None):
+            calls.append((log_filepath, cwd, env))
+            return 0
+
+        conanfile = ConanFile(TestBufferConanOutput(), runner)
+        conanfile.initialize(Settings(), EnvValues.loads("MY_VAR=myvalue\nMY_PATH=[mypath]"))
+        conanfile.global_state = False
+        folder = temp_folder()
+        with conanfile_execution(conanfile, folder):
+            with conanfile_environment_append(conanfile, {"OTHER": "other", "MY_VAR": None}):
+                conanfile.run("command", cwd="subfolder")
+            conanfile.run("command")
+        self.assertIsNone(conanfile.execution_context.cwd)
+        self.assertNotIn("MY_VAR", os.environ)
+
+        (log_filepath, cwd, env), (_, cwd2, env2) = calls
+        self.assertEqual(os.path.join(folder, "conan_run.log"), log_filepath)
+        self.assertEqual(os.path.join(folder, "subfolder"), cwd)
+        self.assertEqual(folder, cwd2)
+        self.assertEqual("other", env["OTHER"])
+        self.assertNotIn("MY_VAR", env)
+        self.assertNotIn("OTHER", env2)
+        self.assertEqual("myvalue", env2["MY_VAR"])
+        self.assertEqual("mypath", env2["MY_PATH"])
+        self.assertEqual(os.environ["PATH"], env2["PATH"])
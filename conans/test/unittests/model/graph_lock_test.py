@@ -0,0 +1,62 @@
+import unittest
+
+from conans.client.graph.graph import BINARY_BUILD
+from conans.model.graph_lock import GraphLock
+from conans.test.utils.graph_lock_benchmark import graph_lock_dict
+
+
+def _node(name, requires=None, modified=None):
+    ret = {"pref": "%s/1.0@user/channel#rev:id#prev" % name, "options": "",
+           "requires": {"%s/1.0@user/channel#rev" % r: r for r in requires or []}}
+    if modified:
+        ret["modified"] = modified
+    return ret
+
+
+class GraphLockTest(unittest.TestCase):
+
+    def setUp(self):
+        # app -> (libb, libc) -> liba
+        self.data = {"nodes": {"app": _node("app", ["libb", "libc"]),
+                               "libb": _node("libb", ["liba"]),
+                               "libc": _node("libc", ["liba"]),
+                               "liba": _node("liba")}}
+
+    def inverse_neighbors_test(self):
+        graph_lock = GraphLock.from_dict(self.data)
+        self.assertEqual("app/1.0@user/channel#rev", repr(graph_lock.root_node().pref.ref))
+        self.assertEqual({"libb", "libc"}, graph_lock._inverse_neighbors("liba"))
+        self.assertEqual({"app"}, graph_lock._inverse_neighbors("libb"))
+        self.assertEqual(set(), graph_lock._inverse_neighbors("app"))
+
+    def closure_affected_test(self):
+        self.data["nodes"]["liba"]["modified"] = True
+        graph_lock = GraphLock.from_dict(self.data)
+        self.assertEqual({"libb", "libc", "app"}, graph_lock._closure_affected())
+
+    def update_lock_test(self):
+        graph_lock = GraphLock.from_dict(self.data)
+        self.assertEqual(set(), graph_lock._closure_affected())
+
+        # libc has been rebuilt and doesn't require liba anymore
+        self.data["nodes"]["libc"] = _node("libc", modified=BINARY_BUILD)
+        graph_lock.update_lock(GraphLock.from_dict(self.data))
+        self.assertEqual({"libb"}, graph_lock._inverse_neighbors("liba"))
+        self.assertEqual({"app"}, graph_lock._closure_affected())
+        self.assertEqual("app/1.0@user/channel#rev", repr(graph_lock.root_node().pref.ref))
+
+    def big_graph_test(self):
+        data = graph_lock_dict(nodes=500, requires=4)
+        for id_ in ("450", "480"):
+            data["nodes"][id_]["modified"] = True
+        graph_lock = GraphLock.from_dict(data)
+        self.assertEqual("pkg0/1.0@user/channel#rev", repr(graph_lock.root_node().pref.ref))
+
+        # Same result of visiting all the nodes for every one
+        expected = set()
+        current = {"450", "480"}
+        while current:
+            current = set(id_ for id_, node in data["nodes"].items()
+                          if current.intersection(node["requires"].values()))
+            expected.update(current)
+        self.assertEqual(expected, graph_lock._closure_affected())
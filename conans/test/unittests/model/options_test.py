@@ -331,6 +331,25 @@ class OptionsValuesTest(unittest.TestCase):
         self.assertEqual(self.sut.sha,
                          "2442d43f1d558621069a15ff5968535f818939b5")
 
+    def test_sha_changes(self):
+        # The sha of the values is cached, it has to change with the values
+        sha = self.sut.sha
+        copied = self.sut.copy()
+        self.sut["Boost"].static = True
+        self.assertNotEqual(self.sut.sha, sha)
+        self.assertEqual(copied.sha, sha)
+        del self.sut["Boost"].static
+        self.sut["Boost"].add_option("static", False)
+        self.assertEqual(self.sut.sha, sha)
+        copied.update(OptionsValues.loads("Poco:deps_bundled=False"))
+        self.assertNotEqual(copied.sha, sha)
+        copied["Poco"].clear()
+        self.assertEqual(copied.sha, OptionsValues.loads("static=True\noptimized=3\n"
+                                                         "Boost:static=False\n"
+                                                         "Boost:thread=True\n"
+                                                         "Boost:thread.multi=off\n"
+                                                         "Poco:other=0").sha)
+
     def test_loads_exceptions(self):
         emsg = "not enough values to unpack" if six.PY3 and sys.version_info.minor > 4 \
             else "need more than 1 value to unpack"
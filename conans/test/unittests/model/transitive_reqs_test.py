@@ -1,3 +1,4 @@
+import textwrap
 import unittest
 from collections import namedtuple, Counter
 
@@ -1255,6 +1256,53 @@ class ChatConan(ConanFile):
                          "Hello/1.2@user/testing:0b09634eb446bffb8d3042a3f19d813cfc162b9d\n"
                          "Say/0.1@user/testing:%s" % NO_SETTINGS_PACKAGE_ID)
 
+    def test_private_package_id_memoized(self):
+        # Both private "Say" nodes have the same inputs, the package_id is computed once
+        self.retriever.save_recipe(say_ref, say_content)
+        self.retriever.save_recipe(hello_ref, GenConanfile().with_name("Hello").with_version("1.2")
+                                                            .with_require(say_ref, private=True))
+        self.retriever.save_recipe(bye_ref, GenConanfile().with_name("Bye").with_version("0.2")
+                                                          .with_require(say_ref, private=True))
+        deps_graph = self.build_graph(GenConanfile().with_require(hello_ref)
+                                                    .with_require(bye_ref))
+
+        say1, say2 = _get_nodes(deps_graph, "Say")
+        self.assertEqual(1, len([key for key in self.binaries_analyzer._package_infos
+                                 if key[0] == say1.ref]))
+        self.assertEqual(say1.package_id, NO_SETTINGS_PACKAGE_ID)
+        self.assertEqual(say2.package_id, NO_SETTINGS_PACKAGE_ID)
+        # Every conanfile has its own info
+        self.assertIsNot(say1.conanfile.info, say2.conanfile.info)
+        self.assertEqual(say1.conanfile.info.dumps(), say2.conanfile.info.dumps())
+        say2.conanfile.info.settings.os = "Linux"
+        self.assertEqual(say1.conanfile.info.settings.os, None)
+        # The memoized info is not the one of the first conanfile, modified by the installer
+        memoized = [info for key, (_, info) in self.binaries_analyzer._package_infos.items()
+                    if key[0] == say1.ref][0]
+        self.assertIsNot(say1.conanfile.info, memoized)
+        say1.conanfile.info.recipe_hash = "myhash"
+        self.assertIsNone(memoized.recipe_hash)
+
+    def test_private_package_id_method_not_memoized(self):
+        say = textwrap.dedent("""
+            from conans import ConanFile
+            class SayConan(ConanFile):
+                name = "Say"
+                version = "0.1"
+                def package_id(self):
+                    self.output.info("Computing package_id")
+            """)
+        self.retriever.save_recipe(say_ref, say)
+        self.retriever.save_recipe(hello_ref, GenConanfile().with_name("Hello").with_version("1.2")
+                                                            .with_require(say_ref, private=True))
+        self.retriever.save_recipe(bye_ref, GenConanfile().with_name("Bye").with_version("0.2")
+                                                          .with_require(say_ref, private=True))
+        deps_graph = self.build_graph(GenConanfile().with_require(hello_ref)
+                                                    .with_require(bye_ref))
+
+        self.assertEqual(2, len(_get_nodes(deps_graph, "Say")))
+        self.assertEqual(2, str(self.output).count("Computing package_id"))
+
     def test_dep_requires_clear(self):
         hello_content = """
 from conans import ConanFile
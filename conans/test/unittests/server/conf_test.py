@@ -20,6 +20,7 @@ ssl_enabled: true
 port: 9220
 host_name: localhost
 public_port: 12345
+threads: 4
 
 
 [write_permissions]
@@ -87,6 +88,11 @@ text=value
         self.assertEqual(config.host_name, "localhost")
         self.assertEqual(config.public_port, 12345)
         self.assertEqual(config.public_url, "https://localhost:12345/v1")
+        self.assertEqual(config.workers, 1)
+        self.assertEqual(config.threads, 4)
+        self.assertIsNone(config.s3_storage)
+        self.assertIsNone(config.keep_revisions)
+        self.assertIsNone(config.gc_interval)
 
         # Now check with environments
         tmp_storage = temp_folder()
@@ -98,6 +104,10 @@ text=value
         self.environ["CONAN_SERVER_USERS"] = "lasote:lasotepass,pepe2:pepepass2"
         self.environ["CONAN_HOST_NAME"] = "remotehost"
         self.environ["CONAN_SERVER_PUBLIC_PORT"] = "33333"
+        self.environ["CONAN_SERVER_WORKERS"] = "3"
+        self.environ["CONAN_SERVER_KEEP_REVISIONS"] = "5"
+        self.environ["CONAN_SERVER_KEEP_REVISIONS_DAYS"] = "30"
+        self.environ["CONAN_SERVER_GC_INTERVAL_HOURS"] = "0.5"
 
         config = ConanServerConfigParser(self.file_path, environment=self.environ)
         self.assertEqual(config.jwt_secret,  "newkey")
@@ -112,3 +122,30 @@ text=value
         self.assertEqual(config.host_name, "remotehost")
         self.assertEqual(config.public_port, 33333)
         self.assertEqual(config.public_url, "http://remotehost:33333/v1")
+        self.assertEqual(config.workers, 3)
+        self.assertEqual(config.threads, 4)
+        self.assertEqual(config.keep_revisions, 5)
+        self.assertEqual(config.keep_revisions_days, 30)
+        self.assertEqual(config.gc_interval, 1800)
+
+    def test_s3_storage(self):
+        server_conf = os.path.join(self.file_path, '.conan_server/server.conf')
+        save(server_conf, fileconfig % self.storage_path + """
+[s3_storage]
+endpoint: http://localhost:9000
+bucket: conan
+access_key: minio
+secret_key: minio123
+""")
+        config = ConanServerConfigParser(self.file_path, environment=self.environ)
+        self.assertEqual(config.s3_storage, {"endpoint": "http://localhost:9000",
+                                             "bucket": "conan", "region": "us-east-1",
+                                             "access_key": "minio", "secret_key": "minio123"})
+
+        save(server_conf, fileconfig % self.storage_path + """
+[s3_storage]
+endpoint: http://localhost:9000
+""")
+        config = ConanServerConfigParser(self.file_path, environment=self.environ)
+        with six.assertRaisesRegex(self, ConanException, "missing s3_storage: bucket"):
+            config.s3_storage
@@ -4,6 +4,7 @@ from datetime import timedelta
 
 import jwt
 from jwt import DecodeError
+from mock import patch
 
 from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
 from conans.server.crypto.jwt.jwt_manager import JWTManager
@@ -38,3 +39,15 @@ class JwtTest(unittest.TestCase):
         token = manager.get_token_for("lasote")
         self.assertEqual(manager.get_user(token), "lasote")
         self.assertRaises(DecodeError, manager.get_user, "invalid_user")
+
+    def jwt_credentials_manager_verified_tokens_test(self):
+        manager = JWTCredentialsManager(self.secret, self.expire_time)
+        token = manager.get_token_for("lasote")
+        self.assertEqual(manager.get_user(token), "lasote")
+        with patch.object(manager, "get_profile") as get_profile:
+            self.assertEqual(manager.get_user(token), "lasote")
+            self.assertFalse(get_profile.called)
+
+        # The verified tokens also expire
+        time.sleep(2)
+        self.assertRaises(jwt.ExpiredSignature, manager.get_user, token)
@@ -0,0 +1,100 @@
+import os
+import shutil
+import time
+import unittest
+from collections import namedtuple
+
+from mock import patch
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.server.store.garbage_collector import RetentionPolicy, RevisionsGarbageCollector
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+from conans.util.dates import from_timestamp_to_iso8601
+
+_Entry = namedtuple("Entry", "revision time")
+
+
+class RetentionPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = time.time()
+        # Latest first, one per day
+        self.revisions = [_Entry("rev%d" % i, from_timestamp_to_iso8601(self.now - i * 86400))
+                          for i in range(5)]
+
+    def _expired(self, policy):
+        return [e.revision for e in policy.expired(self.revisions, self.now + 60)]
+
+    def policy_test(self):
+        self.assertEqual([], self._expired(RetentionPolicy()))
+        self.assertEqual(["rev2", "rev3", "rev4"], self._expired(RetentionPolicy(2)))
+        self.assertEqual(["rev1", "rev2", "rev3", "rev4"], self._expired(RetentionPolicy(0)))
+        self.assertEqual(["rev3", "rev4"], self._expired(RetentionPolicy(keep_days=2.5)))
+        self.assertEqual(["rev1", "rev2", "rev3", "rev4"],
+                         self._expired(RetentionPolicy(keep_days=0)))
+        # Kept if any of them keeps it
+        self.assertEqual(["rev4"], self._expired(RetentionPolicy(4, keep_days=1.5)))
+        self.assertEqual(["rev3", "rev4"], self._expired(RetentionPolicy(1, keep_days=2.5)))
+
+
+class RevisionsGarbageCollectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer(write_permissions=[("*/*@*/*", "*")])
+        self.client = TestClient(servers={"default": self.server},
+                                 users={"default": [("lasote", "mypass")]},
+                                 revisions_enabled=True)
+        self.ref = ConanFileReference.loads("Hello/0.1@lasote/stable")
+        for i in range(3):
+            conanfile = GenConanfile().with_name("Hello").with_version("0.1")
+            self.client.save({"conanfile.py": str(conanfile) + "# %d" % i})
+            self.client.run("create . lasote/stable")
+            self.client.run("upload Hello/0.1@lasote/stable --all")
+        self.store = self.server.server_store
+        self.latest = self.store.get_last_revision(self.ref).revision
+
+    def _collect(self, policy, dry_run=False):
+        collector = RevisionsGarbageCollector(self.store, policy)
+        with patch("conans.server.store.garbage_collector.UPLOAD_GRACE_SECONDS", 0):
+            return collector.run(dry_run)
+
+    def keep_latest_test(self):
+        report = self._collect(RetentionPolicy(1), dry_run=True)
+        self.assertEqual(2, report.recipe_revisions)
+        self.assertEqual(3, len(self.store.get_recipe_revisions(self.ref)))
+
+        report = self._collect(RetentionPolicy(1))
+        self.assertEqual(2, report.recipe_revisions)
+        self.assertGreater(report.blobs, 0)
+        self.assertGreater(report.bytes, 0)
+        revisions = self.store.get_recipe_revisions(self.ref)
+        self.assertEqual([self.latest], [e.revision for e in revisions])
+
+        self.client.run("remove * -f")
+        self.client.run("install Hello/0.1@lasote/stable")
+        self.assertIn("Hello/0.1@lasote/stable: Package installed", self.client.out)
+
+        report = self._collect(RetentionPolicy(1))
+        self.assertEqual((0, 0, 0, 0), tuple(report))
+
+    def package_revisions_test(self):
+        rref = self.ref.copy_with_rev(self.latest)
+        package_id = os.listdir(self.store.packages(rref))[0]
+        pref = PackageReference(rref, package_id)
+        prev = self.store.get_last_package_revision(pref).revision
+        pref = pref.copy_with_revs(self.latest, prev)
+        new_pref = pref.copy_with_revs(self.latest, "f" * 32)
+        shutil.copytree(self.store.package(pref), self.store.package(new_pref))
+        self.store.update_last_package_revision(new_pref)
+
+        report = self._collect(RetentionPolicy(1))
+        self.assertEqual((2, 1), (report.recipe_revisions, report.package_revisions))
+        self.assertFalse(os.path.exists(self.store.package(pref)))
+        revisions = self.store.get_package_revisions(PackageReference(rref, package_id))
+        self.assertEqual(["f" * 32], [e.revision for e in revisions])
+
+    def upload_grace_test(self):
+        collector = RevisionsGarbageCollector(self.store, RetentionPolicy(1))
+        report = collector.run()
+        self.assertEqual((0, 0), (report.recipe_revisions, report.package_revisions))
+        self.assertEqual(3, len(self.store.get_recipe_revisions(self.ref)))
@@ -0,0 +1,51 @@
+import unittest
+
+from conans.server.metrics import ServerMetrics
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+
+
+class ServerMetricsTest(unittest.TestCase):
+
+    def dumps_test(self):
+        metrics = ServerMetrics()
+        metrics.inc("conan_server_requests_total", route="/ping", status=200)
+        metrics.inc("conan_server_requests_total", route="/ping", status=200)
+        metrics.observe("conan_server_request_duration_seconds", 0.02, route="/ping")
+        metrics.observe("conan_server_request_duration_seconds", 3, route="/ping")
+
+        text = metrics.dumps()
+        self.assertIn("# TYPE conan_server_requests_total counter", text)
+        self.assertIn('conan_server_requests_total{route="/ping",status="200"} 2', text)
+        self.assertIn("# TYPE conan_server_request_duration_seconds histogram", text)
+        self.assertIn('conan_server_request_duration_seconds_bucket{route="/ping",le="0.01"} 0',
+                      text)
+        self.assertIn('conan_server_request_duration_seconds_bucket{route="/ping",le="0.025"} 1',
+                      text)
+        self.assertIn('conan_server_request_duration_seconds_bucket{route="/ping",le="+Inf"} 2',
+                      text)
+        self.assertIn('conan_server_request_duration_seconds_count{route="/ping"} 2', text)
+
+    def server_metrics_test(self):
+        server = TestServer(write_permissions=[("*/*@*/*", "*")])
+        # Checks the routes of the API v1
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=False)
+        client.save({"conanfile.py": GenConanfile().with_name("Hello").with_version("0.1")})
+        client.run("create . lasote/stable")
+        client.run("upload Hello/0.1@lasote/stable --all -c")
+        client.run("remove * -f")
+        client.run("install Hello/0.1@lasote/stable")
+
+        text = server.app.get("/metrics").text
+        self.assertIn('conan_server_requests_total{api="v1",method="GET",route="/ping",'
+                      'status="200"}', text)
+        self.assertIn('conan_server_request_duration_seconds_count{api="v1",method="GET",'
+                      'route="/users/check_credentials"}', text)
+        self.assertIn('conan_server_response_bytes_total{api="v1",method="GET",'
+                      'route="/files/<the_path:path>"}', text)
+        self.assertIn('conan_server_request_bytes_total{api="v1",method="PUT",'
+                      'route="/files/<the_path:path>"}', text)
+        self.assertIn('conan_server_operation_duration_seconds_count{component="storage",'
+                      'operation="get_snapshot"}', text)
+        self.assertIn('conan_server_operation_duration_seconds_count{component="authenticator",'
+                      'operation="valid_user"}', text)
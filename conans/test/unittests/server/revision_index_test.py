@@ -0,0 +1,60 @@
+import os
+import unittest
+
+from conans.server.revision_list import RevisionList
+from conans.server.store.revision_index import REVISIONS_DB, REVISIONS_FILE, \
+    SQLiteRevisionIndex
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class SQLiteRevisionIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = temp_folder()
+        self.index = SQLiteRevisionIndex(self.store)
+
+    def _revisions(self, folder):
+        return [e.revision for e in self.index.get_revision_list(folder).as_list()]
+
+    def test_add_revisions(self):
+        folder = "lib/1.0/user/channel"
+        self.assertIsNone(self.index.get_revision_list(folder).latest_revision())
+        self.index.add_revision(folder, "rev1")
+        self.index.add_revision(folder, "rev2")
+        time2 = self.index.get_revision_list(folder).get_time("rev2")
+        self.index.add_revision(folder, "rev2")  # Each uploaded file used to add it again
+        self.assertEqual(["rev2", "rev1"], self._revisions(folder))
+        self.assertEqual(time2, self.index.get_revision_list(folder).get_time("rev2"))
+
+        self.index.add_revision(folder, "rev1")
+        self.assertEqual(["rev1", "rev2"], self._revisions(folder))
+        self.index.remove_revision(folder, "rev1")
+        self.assertEqual("rev2", self.index.get_revision_list(folder).latest_revision().revision)
+
+    def test_remove_folder(self):
+        self.index.add_revision("lib/1.0/user/channel", "rev1")
+        self.index.add_revision("lib/1.0/user/channel/rev1/package/pid", "prev1")
+        self.index.add_revision("lib/1.0/user/channel2", "rev1")
+        self.index.add_revision("lib/1.0/user/channel2/rev1/package/pid", "prev1")
+
+        self.index.remove_folder("lib/1.0/user/channel")
+        self.assertEqual([], self._revisions("lib/1.0/user/channel"))
+        self.assertEqual([], self._revisions("lib/1.0/user/channel/rev1/package/pid"))
+        self.assertEqual(["rev1"], self._revisions("lib/1.0/user/channel2"))
+        self.assertEqual(["prev1"], self._revisions("lib/1.0/user/channel2/rev1/package/pid"))
+
+    def test_import_revision_files(self):
+        rev_list = RevisionList()
+        rev_list.add_revision("rev1")
+        rev_list.add_revision("rev2")
+        save(os.path.join(self.store, "lib", "1.0", "user", "channel", REVISIONS_FILE),
+             rev_list.dumps())
+        save(os.path.join(self.store, "lib", "1.0", "user", "channel", "rev2", "package", "pid",
+                          REVISIONS_FILE), rev_list.dumps())
+
+        self.assertFalse(os.path.exists(os.path.join(self.store, REVISIONS_DB)))
+        self.assertEqual(rev_list, self.index.get_revision_list("lib/1.0/user/channel"))
+        self.assertEqual(rev_list,
+                         self.index.get_revision_list("lib/1.0/user/channel/rev2/package/pid"))
+        self.assertTrue(os.path.exists(os.path.join(self.store, REVISIONS_DB)))
@@ -0,0 +1,81 @@
+import os
+import socket
+import threading
+import time
+import unittest
+
+import bottle
+import requests
+
+from conans.server.rest.server_adapter import ConanServerAdapter
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class ConanServerAdapterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        save(os.path.join(self.folder, "file.txt"), "contents" * 100000)
+        app = bottle.Bottle()
+
+        @app.route("/files/<the_path>", method=["GET"])
+        def get_file(the_path):
+            return static_file_response(the_path)
+
+        @app.route("/client", method=["GET", "POST"])
+        def client_port():
+            return bottle.request.environ["REMOTE_PORT"]
+
+        def static_file_response(the_path):
+            return bottle.static_file(the_path, root=self.folder)
+
+        sock = socket.socket()
+        sock.bind(("localhost", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        self.url = "http://localhost:%s" % port
+        self.adapter = ConanServerAdapter(host="localhost", port=port, threads=2)
+        self.adapter.quiet = True
+        thread = threading.Thread(target=self.adapter.run, args=(app, ))
+        thread.daemon = True
+        thread.start()
+        for _ in range(50):
+            if hasattr(self.adapter, "srv"):
+                break
+            time.sleep(0.1)
+
+    def tearDown(self):
+        self.adapter.srv.shutdown()
+        self.adapter.srv.server_close()
+
+    def keep_alive_test(self):
+        session = requests.Session()
+        port = session.get("%s/client" % self.url).text
+        # The body that the application doesn't read is discarded
+        self.assertEqual(port, session.post("%s/client" % self.url, data="body" * 100).text)
+        response = session.get("%s/files/file.txt" % self.url)
+        self.assertEqual("contents" * 100000, response.text)
+        self.assertEqual(port, session.get("%s/client" % self.url).text)
+
+    def not_found_test(self):
+        session = requests.Session()
+        port = session.get("%s/client" % self.url).text
+        self.assertEqual(404, session.get("%s/files/missing.txt" % self.url).status_code)
+        self.assertEqual(port, session.get("%s/client" % self.url).text)
+
+    def concurrent_clients_test(self):
+        responses = []
+
+        def download():
+            session = requests.Session()
+            for _ in range(5):
+                responses.append(session.get("%s/files/file.txt" % self.url).text)
+
+        threads = [threading.Thread(target=download) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(20, len(responses))
+        self.assertTrue(all(r == "contents" * 100000 for r in responses))
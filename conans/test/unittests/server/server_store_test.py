@@ -0,0 +1,60 @@
+import os
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.server_store import ServerStore
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class _CountingAdapter(ServerDiskAdapter):
+
+    def __init__(self, *args, **kwargs):
+        super(_CountingAdapter, self).__init__(*args, **kwargs)
+        self.listed = 0
+
+    def get_file_list(self, relative_path):
+        self.listed += 1
+        return super(_CountingAdapter, self).get_file_list(relative_path)
+
+
+class ServerStoreCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = _CountingAdapter("http://localhost", temp_folder(), None)
+        self.store = ServerStore(self.adapter)
+        self.ref = ConanFileReference.loads("lib/1.0@user/channel#rev1")
+        self.pref = PackageReference(self.ref, "pid", "prev1")
+
+    def test_file_list(self):
+        save(os.path.join(self.store.export(self.ref), "conanfile.py"), "")
+        self.assertEqual(["conanfile.py"], self.store.get_recipe_file_list(self.ref))
+        self.assertEqual(["conanfile.py"], self.store.get_recipe_file_list(self.ref))
+        self.assertEqual(1, self.adapter.listed)
+
+        path = os.path.join(self.store.export(self.ref), "conanmanifest.txt")
+        save(path, "")
+        self.store.file_saved(path)
+        self.assertEqual(["conanfile.py", "conanmanifest.txt"],
+                         sorted(self.store.get_recipe_file_list(self.ref)))
+        self.assertEqual(2, self.adapter.listed)
+
+        self.store.remove_conanfile_files(self.ref, ["conanfile.py"])
+        self.assertEqual(["conanmanifest.txt"], self.store.get_recipe_file_list(self.ref))
+
+    def test_latest_revisions(self):
+        save(os.path.join(self.store.export(self.ref.copy_with_rev("rev2")), "conanfile.py"), "")
+        self.store.update_last_revision(self.ref)
+        self.assertEqual("rev1", self.store.get_last_revision(self.ref).revision)
+        self.store.update_last_revision(self.ref.copy_with_rev("rev2"))
+        self.assertEqual("rev2", self.store.get_last_revision(self.ref).revision)
+
+        save(os.path.join(self.store.package(self.pref), "conaninfo.txt"), "")
+        self.store.update_last_package_revision(self.pref)
+        self.assertEqual("prev1", self.store.get_last_package_revision(self.pref).revision)
+        self.store.remove_package(self.pref)
+        self.assertIsNone(self.store.get_last_package_revision(self.pref))
+
+        self.store.remove_conanfile(self.ref.copy_with_rev("rev2"))
+        self.assertEqual("rev1", self.store.get_last_revision(self.ref).revision)
@@ -193,3 +193,27 @@ class AuthorizerTest(unittest.TestCase):
         for u in ['user1','user2','user3']:
             authorizer.check_read_conan(u, self.openssl_ref)
 
+
+    def rules_order_test(self):
+        """The first rule that applies to the reference decides, whatever its patterns"""
+        read_perms = [("*/*@lasote/testing", "pepe"),
+                      ("openssl/*@*/*", "juan"),
+                      ("openssl/2.0.1@*/*", "*"),
+                      ("*/2.0.2@*/*", "*")]
+        authorizer = BasicAuthorizer(read_perms, [])
+        authorizer.check_read_conan("pepe", self.openssl_ref)
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "juan", self.openssl_ref)
+
+        other_ref = ConanFileReference.loads("openssl/2.0.1@other/testing")
+        authorizer.check_read_conan("juan", other_ref)
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "pepe", other_ref)
+
+        zlib_ref = ConanFileReference.loads("zlib/2.0.2@other/testing")
+        authorizer.check_read_conan("pepe", zlib_ref)
+        zlib_ref = ConanFileReference.loads("zlib/1.0@other/testing")
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "pepe", zlib_ref)
+        self.assertRaises(AuthenticationException,
+                          authorizer.check_read_conan, None, zlib_ref)
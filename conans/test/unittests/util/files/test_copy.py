@@ -0,0 +1,69 @@
+# coding=utf-8
+
+import os
+import platform
+import unittest
+
+import six
+
+from conans.client.tools import environment_append
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import copy_file, copytree, load, save, unlink_hardlink
+
+
+class CopyStrategyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.src = os.path.join(temp_folder(), "src")
+        save(os.path.join(self.src, "file.txt"), "content")
+        save(os.path.join(self.src, "sub", "other.txt"), "other")
+        self.dst = os.path.join(temp_folder(), "dst")
+
+    def _copytree(self, strategy):
+        with environment_append({"CONAN_COPY_STRATEGY": strategy}):
+            copytree(self.src, self.dst)
+        self.assertEqual("content", load(os.path.join(self.dst, "file.txt")))
+        self.assertEqual("other", load(os.path.join(self.dst, "sub", "other.txt")))
+        return os.stat(os.path.join(self.dst, "sub", "other.txt")).st_nlink
+
+    def test_copy(self):
+        self.assertEqual(1, self._copytree("copy"))
+
+    def test_reflink(self):
+        # Same contents, with or without support of the filesystem, never linked
+        self.assertEqual(1, self._copytree("reflink"))
+        src_file = os.path.join(self.src, "file.txt")
+        dst_file = os.path.join(self.dst, "file.txt")
+        self.assertEqual(os.path.getmtime(src_file), os.path.getmtime(dst_file))
+        save(dst_file, "modified")
+        self.assertEqual("content", load(src_file))
+
+    @unittest.skipUnless(hasattr(os, "link"), "Requires hard links")
+    def test_hardlink(self):
+        self.assertEqual(2, self._copytree("hardlink"))
+        dst_file = os.path.join(self.dst, "file.txt")
+        unlink_hardlink(dst_file)
+        self.assertEqual(1, os.stat(dst_file).st_nlink)
+        save(dst_file, "modified")
+        self.assertEqual("content", load(os.path.join(self.src, "file.txt")))
+
+    @unittest.skipUnless(hasattr(os, "link"), "Requires hard links")
+    def test_copy_replaces_hardlink(self):
+        self._copytree("hardlink")
+        save(os.path.join(self.src, "new.txt"), "new")
+        with environment_append({"CONAN_COPY_STRATEGY": "copy"}):
+            copy_file(os.path.join(self.src, "new.txt"), os.path.join(self.dst, "file.txt"))
+        self.assertEqual("new", load(os.path.join(self.dst, "file.txt")))
+        self.assertEqual("content", load(os.path.join(self.src, "file.txt")))
+
+    @unittest.skipIf(platform.system() == "Windows", "Requires symlinks")
+    def test_symlinks(self):
+        os.symlink("sub", os.path.join(self.src, "link"))
+        self._copytree("hardlink")
+        self.assertEqual("sub", os.readlink(os.path.join(self.dst, "link")))
+
+    def test_invalid(self):
+        with environment_append({"CONAN_COPY_STRATEGY": "move"}):
+            with six.assertRaisesRegex(self, ConanException, "Invalid copy strategy 'move'"):
+                copytree(self.src, self.dst)
@@ -0,0 +1,41 @@
+import time
+import unittest
+
+from conans.util.lru import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_discards_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))  # "b" is now the least recently used
+        cache.put("c", 3)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual("default", cache.get("b", "default"))
+
+    def test_ttl(self):
+        cache = LRUCache(10, ttl=0.1)
+        cache.put("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        time.sleep(0.2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+    def test_pop(self):
+        cache = LRUCache(10)
+        cache.put(("files", "lib/1.0"), 1)
+        cache.put(("files", "lib/2.0"), 2)
+        cache.put(("revisions", "lib/1.0"), 3)
+        cache.pop(("files", "lib/2.0"))
+        cache.pop("missing")
+        self.assertIsNone(cache.get(("files", "lib/2.0")))
+        cache.pop_if(lambda key: key[0] == "revisions")
+        self.assertIsNone(cache.get(("revisions", "lib/1.0")))
+        self.assertEqual(1, cache.get(("files", "lib/1.0")))
+        cache.clear()
+        self.assertEqual(0, len(cache))
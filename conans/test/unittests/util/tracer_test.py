@@ -0,0 +1,41 @@
+import json
+import os
+import threading
+import unittest
+
+from conans.client.tools.env import environment_append
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load
+from conans.util.tracer import flush_traces, log_command
+
+
+class TracerTest(unittest.TestCase):
+
+    def buffered_test(self):
+        trace_file = os.path.join(temp_folder(), "trace.log")
+        with environment_append({"CONAN_TRACE_FILE": trace_file}):
+            log_command("install", {"path": "."})
+            flush_traces()
+            self.assertEqual(json.loads(load(trace_file))["name"], "install")
+
+    def concurrent_test(self):
+        trace_file = os.path.join(temp_folder(), "trace.log")
+
+        def log_commands(index):
+            for i in range(200):
+                log_command("command%d" % index, {"index": i})
+
+        with environment_append({"CONAN_TRACE_FILE": trace_file}):
+            threads = [threading.Thread(target=log_commands, args=(i, )) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            flush_traces()
+
+        lines = load(trace_file).splitlines()
+        self.assertEqual(len(lines), 800)
+        traces = [json.loads(line) for line in lines]  # All of them are written whole
+        for index in range(4):
+            indexes = [t["parameters"]["index"] for t in traces if t["name"] == "command%d" % index]
+            self.assertEqual(indexes, list(range(200)))
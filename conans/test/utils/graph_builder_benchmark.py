@@ -0,0 +1,87 @@
+#!/usr/bin/python
+""" Benchmark of the expansion of the dependency graph (DepsGraphBuilder) with synthetic graphs
+of layers of packages, every one requiring some packages of the layers below. The recipes are
+loaded from a temporary folder, without a cache or remotes:
+
+    $ python -m conans.test.utils.graph_builder_benchmark --packages 500 1000 2000
+"""
+import argparse
+import random
+import time
+
+from conans.client.cache.cache import ClientCache
+from conans.client.graph.graph_builder import DepsGraphBuilder
+from conans.client.graph.python_requires import ConanPythonRequire
+from conans.client.graph.range_resolver import RangeResolver
+from conans.client.loader import ConanFileLoader
+from conans.model.profile import Profile
+from conans.model.ref import ConanFileReference
+from conans.test.unittests.model.fake_retriever import Retriever
+from conans.test.utils.tools import TestBufferConanOutput, GenConanfile, test_processed_profile
+
+
+def _ref(i):
+    return ConanFileReference.loads("pkg%d/1.0@user/testing" % i)
+
+
+def synthetic_graph(retriever, packages, requires, layers, private=0.0, seed=0):
+    """ Saves the recipes of a graph of "packages" in the retriever and returns the content of
+    the root consumer one. "private" is the ratio of private requires
+    """
+    rand = random.Random(seed)
+    layer_size = max(packages // layers, 1)
+    required = set()
+    for i in range(1, packages):
+        first_below = (i // layer_size + 1) * layer_size
+        candidates = range(first_below, min(first_below + 2 * layer_size, packages))
+        conanfile = GenConanfile().with_name("pkg%d" % i).with_version("1.0")
+        for dep in sorted(rand.sample(candidates, min(requires, len(candidates)))):
+            conanfile.with_require(_ref(dep), private=bool(private) and rand.random() < private)
+            required.add(dep)
+        retriever.save_recipe(_ref(i), conanfile)
+    # The root requires all the packages not required by other ones
+    root = GenConanfile().with_name("pkg0").with_version("1.0")
+    for i in range(1, packages):
+        if i not in required:
+            root.with_require(_ref(i))
+    return str(root)
+
+
+def load_synthetic_graph(packages, requires, layers, private=0.0, seed=0):
+    """ Expands the synthetic graph, returns it and the seconds it took """
+    output = TestBufferConanOutput()
+    loader = ConanFileLoader(None, output, ConanPythonRequire(None, None))
+    retriever = Retriever(loader)
+    root_content = synthetic_graph(retriever, packages, requires, layers, private, seed)
+    resolver = RangeResolver(ClientCache(retriever.folder, output), remote_manager=None)
+    builder = DepsGraphBuilder(retriever, output, loader, resolver, recorder=None)
+    processed_profile = test_processed_profile(profile=Profile())
+
+    root_node = retriever.root(root_content, processed_profile)
+    start = time.time()
+    graph = builder.load_graph(root_node, False, False, None, processed_profile)
+    return graph, time.time() - start
+
+
+def run(packages, requires, layers):
+    graph, elapsed = load_synthetic_graph(packages, requires, layers)
+    closures = sum(len(n.public_closure) for n in graph.nodes)
+    print("%6d packages, %d requires, %3d layers: %8.2f s  (%d nodes, %d closure entries)"
+          % (packages, requires, layers, elapsed, len(graph.nodes), closures))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, nargs="+", default=[500, 1000, 2000],
+                        help="Packages of the graphs")
+    parser.add_argument("--requires", type=int, default=4, help="Requires of every package")
+    parser.add_argument("--layers", type=int, default=20, help="Layers of the graphs")
+    args = parser.parse_args()
+    for packages in args.packages:
+        run(packages, args.requires, args.layers)
+
+
+if __name__ == "__main__":
+    main()
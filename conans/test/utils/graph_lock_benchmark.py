@@ -0,0 +1,73 @@
+#!/usr/bin/python
+""" Benchmark of the GraphLock operations with big lockfiles, of a synthetic graph of layers
+of packages, every one requiring some packages of the layers below:
+
+    $ python -m conans.test.utils.graph_lock_benchmark --nodes 5000
+"""
+import argparse
+import json
+import random
+import time
+
+from conans.model.graph_lock import GraphLock
+
+
+def graph_lock_dict(nodes, requires, seed=0):
+    """ json like dict of a lockfile with a root node "0" """
+    rand = random.Random(seed)
+    layer_size = max(nodes // 50, 1)
+    deps = {0: set(range(1, min(layer_size + 1, nodes)))}
+    for i in range(1, nodes):
+        first_below = (i // layer_size + 1) * layer_size
+        candidates = range(first_below, min(first_below + 4 * layer_size, nodes))
+        deps[i] = set(rand.sample(candidates, min(requires, len(candidates))))
+    # Every package is required by some other one, in the layer above
+    required = set().union(*deps.values())
+    for i in range(1, nodes):
+        if i not in required:
+            deps[max(i - layer_size, 0)].add(i)
+
+    def ref(i):
+        return "pkg%d/1.0@user/channel#rev" % i
+
+    data = {str(i): {"pref": "%s:id#prev" % ref(i), "options": "",
+                     "requires": {ref(d): str(d) for d in deps[i]}}
+            for i in range(nodes)}
+    return {"nodes": data}
+
+
+def _timed(name, func, repeat=1):
+    start = time.time()
+    for _ in range(repeat):
+        result = func()
+    print("%-32s %10.2f ms" % (name, (time.time() - start) * 1000 / repeat))
+    return result
+
+
+def run(nodes, requires, modified):
+    data = json.loads(json.dumps(graph_lock_dict(nodes, requires)))
+    print("Lockfile: %d nodes, %d requires each" % (nodes, requires))
+    graph_lock = _timed("GraphLock.from_dict", lambda: GraphLock.from_dict(data))
+    _timed("GraphLock.root_node", graph_lock.root_node, repeat=10)
+
+    # Some packages of the bottom layers have been rebuilt
+    new_lock = GraphLock.from_dict(data)
+    for id_ in [str(nodes - 1 - i * 7) for i in range(modified)]:
+        new_lock._nodes[id_].modified = "Build"
+    _timed("GraphLock.update_lock", lambda: graph_lock.update_lock(new_lock))
+    affected = _timed("GraphLock._closure_affected", graph_lock._closure_affected)
+    print("Affected by %d modified nodes: %d" % (modified, len(affected)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=5000, help="Nodes of the lockfile")
+    parser.add_argument("--requires", type=int, default=5, help="Requires of every node")
+    parser.add_argument("--modified", type=int, default=10, help="Rebuilt nodes")
+    args = parser.parse_args()
+    run(args.nodes, args.requires, args.modified)
+
+
+if __name__ == "__main__":
+    main()
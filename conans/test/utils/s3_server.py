@@ -0,0 +1,91 @@
+import threading
+import time
+from datetime import datetime
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from bottle import Bottle, HTTPResponse, request
+
+from conans.server.store.s3_adapter import sign_v4
+
+
+class _QuietHandler(WSGIRequestHandler):
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+
+class TestS3Server(object):
+    """ Stand-in of a S3 compatible service (like MinIO), listening in localhost, with a bucket
+    in memory. Only accepts presigned requests (GET, PUT, DELETE) of the objects
+    """
+
+    def __init__(self, bucket="conan", access_key="access", secret_key="secret",
+                 region="us-east-1"):
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.objects = {}
+        self.requests = []  # (method, key)
+        self.fail_puts = False  # Answer the PUT requests with an internal error
+
+        app = Bottle()
+        app.route("/<bucket>/<key:path>", method=["GET", "PUT", "DELETE"], callback=self._object)
+        self._server = make_server("127.0.0.1", 0, app, handler_class=_QuietHandler)
+        self.endpoint = "http://127.0.0.1:%d" % self._server.server_port
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @property
+    def s3_storage(self):
+        """ The [s3_storage] configuration of the server to use this bucket """
+        return {"endpoint": self.endpoint, "bucket": self.bucket, "region": self.region,
+                "access_key": self.access_key, "secret_key": self.secret_key}
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _check_signature(self):
+        if "Authorization" in request.headers:
+            return "Only one auth mechanism allowed"
+        query = {k: v for k, v in request.query.items() if k.startswith("X-Amz-")}
+        signature = query.pop("X-Amz-Signature", None)
+        try:
+            credential = query["X-Amz-Credential"]
+            date = datetime.strptime(query["X-Amz-Date"], "%Y%m%dT%H%M%SZ")
+            expires = int(query["X-Amz-Expires"])
+        except (KeyError, ValueError):
+            return "Missing or invalid presign parameters"
+        if credential.split("/")[0] != self.access_key:
+            return "Unknown access key"
+        if (datetime.utcnow() - date).total_seconds() > expires:
+            return "Request has expired"
+        url = "http://%s%s" % (request.urlparts.netloc, request.path)
+        if sign_v4(request.method, url, query, self.region, self.secret_key) != signature:
+            return "SignatureDoesNotMatch"
+        return None
+
+    def _object(self, bucket, key):
+        error = self._check_signature()
+        if error:
+            return HTTPResponse(error, status=403)
+        if bucket != self.bucket:
+            return HTTPResponse("NoSuchBucket", status=404)
+        self.requests.append((request.method, key))
+        if request.method == "PUT":
+            if self.fail_puts:
+                return HTTPResponse("InternalError", status=500)
+            self.objects[key] = request.body.read()
+            return HTTPResponse(status=200)
+        if key not in self.objects:
+            return HTTPResponse("NoSuchKey", status=404)
+        if request.method == "DELETE":
+            del self.objects[key]
+            return HTTPResponse(status=204)
+        return HTTPResponse(self.objects[key], status=200,
+                            headers={"Content-Type": "application/octet-stream",
+                                     "Content-Length": str(len(self.objects[key])),
+                                     "Last-Modified": time.strftime("%a, %d %b %Y %H:%M:%S GMT",
+                                                                    time.gmtime())})
@@ -7,6 +7,7 @@ from conans import SERVER_CAPABILITIES
 from conans.server.conf import get_server_store
 from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
 from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.metrics import ServerMetrics
 from conans.server.migrate import migrate_and_get_server_config
 from conans.server.rest.server import ConanServer
 from conans.server.service.authorize import BasicAuthenticator, BasicAuthorizer
@@ -21,7 +22,7 @@ class TestServerLauncher(object):
 
     def __init__(self, base_path=None, read_permissions=None,
                  write_permissions=None, users=None, base_url=None, plugins=None,
-                 server_capabilities=None):
+                 server_capabilities=None, s3_storage=None):
 
         plugins = plugins or []
         if not base_path:
@@ -40,8 +41,10 @@ class TestServerLauncher(object):
         updown_auth_manager = JWTUpDownAuthManager(server_config.updown_secret,
                                                    server_config.authorize_timeout)
         base_url = base_url or server_config.public_url
+        metrics = ServerMetrics()
         self.server_store = get_server_store(server_config.disk_storage_path,
-                                             base_url, updown_auth_manager)
+                                             base_url, updown_auth_manager, metrics,
+                                             s3_storage or server_config.s3_storage)
 
         # Prepare some test users
         if not read_permissions:
@@ -65,7 +68,7 @@ class TestServerLauncher(object):
         self.port = server_config.port
         self.ra = ConanServer(self.port, credentials_manager, updown_auth_manager,
                               authorizer, authenticator, self.server_store,
-                              server_capabilities)
+                              server_capabilities, metrics)
         for plugin in plugins:
             self.ra.api_v1.install(plugin)
             self.ra.api_v2.install(plugin)
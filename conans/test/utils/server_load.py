@@ -0,0 +1,62 @@
+#!/usr/bin/python
+""" Load test of a running conan_server, with a number of simulated clients sending requests
+through persistent connections. Compare the throughput of the different "workers" and "threads"
+values of server.conf:
+
+    $ python -m conans.test.utils.server_load http://localhost:9300 --clients 50
+"""
+import argparse
+import threading
+import time
+
+import requests
+
+
+def _client(url, paths, requests_per_client, results):
+    session = requests.Session()
+    for i in range(requests_per_client):
+        start = time.time()
+        try:
+            response = session.get(url + paths[i % len(paths)])
+            ok = response.ok
+        except requests.RequestException:
+            ok = False
+        results.append((ok, time.time() - start))
+
+
+def run_load(url, clients, requests_per_client, paths):
+    results = []
+    threads = [threading.Thread(target=_client, args=(url, paths, requests_per_client, results))
+               for _ in range(clients)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+
+    latencies = sorted(latency for _, latency in results)
+    errors = len([ok for ok, _ in results if not ok])
+    print("Requests: %d, errors: %d, time: %.2fs" % (len(results), errors, elapsed))
+    print("Throughput: %.1f requests/s" % (len(results) / elapsed))
+    print("Latency p50: %.1fms, p95: %.1fms, max: %.1fms"
+          % (latencies[len(latencies) // 2] * 1000,
+             latencies[int(len(latencies) * 0.95)] * 1000,
+             latencies[-1] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url", help="Base URL of the server, e.g. http://localhost:9300")
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests of each client")
+    parser.add_argument("--path", action="append",
+                        help="Paths requested in turns by each client, e.g. /v1/ping or the path "
+                             "of a package file. Can be repeated. Default /v1/ping")
+    args = parser.parse_args()
+    run_load(args.url.rstrip("/"), args.clients, args.requests, args.path or ["/v1/ping"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python
+""" Benchmark of the startup of the conan command line, running the commands that don't need
+recipes or remotes in new processes with an empty cache, and reporting the number of modules
+they import and their import time:
+
+    $ python -m conans.test.utils.startup_benchmark --runs 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from conans.test.utils.test_files import temp_folder
+
+COMMANDS = [["--version"],
+            ["config", "get", "general.default_profile"],
+            ["remote", "list"],
+            ["search"]]
+
+# Runs a command in the same way than the "conan" entry point, printing the imported modules
+_RUNNER = """
+import json, sys, time
+start = time.time()
+from conans.client.command import main
+imported = time.time()
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps({"modules": sorted(sys.modules), "import": imported - start}))
+"""
+
+
+def run_command(args, env):
+    """ runs the command in a new process, returns the modules that it imported and the time
+    to import the command line module
+    """
+    cmd = [sys.executable, "-c", _RUNNER] + args
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    result = json.loads(err.decode().splitlines()[-1])
+    return result["modules"], result["import"]
+
+
+def benchmark_env():
+    env = os.environ.copy()
+    env["CONAN_USER_HOME"] = temp_folder()
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join([root, env.get("PYTHONPATH", "")])
+    return env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs of every command")
+    args = parser.parse_args()
+    env = benchmark_env()
+    run_command(["--version"], env)  # Initializes the cache
+    for command in COMMANDS:
+        times, import_times = [], []
+        for _ in range(args.runs):
+            start = time.time()
+            modules, import_time = run_command(command, env)
+            times.append(time.time() - start)
+            import_times.append(import_time)
+        print("conan %-40s %6.3f s  (import %.3f s, %d modules)"
+              % (" ".join(command), min(times), min(import_times), len(modules)))
+
+
+if __name__ == "__main__":
+    main()
@@ -172,6 +172,9 @@ class TestRequester(object):
         app, url = self._prepare_call(url, kwargs)
         if app:
             response = app.get(url, **kwargs)
+            if response.status_int in (301, 302, 303, 307):
+                # Follow it as requests does, without the credentials of the server
+                return self.get(response.headers["Location"])
             return TestingResponse(response)
         else:
             return requests.get(url, **kwargs)
@@ -378,12 +381,14 @@ class ArtifactoryServer(object):
 class TestServer(object):
     def __init__(self, read_permissions=None,
                  write_permissions=None, users=None, plugins=None, base_path=None,
-                 server_capabilities=None, complete_urls=False):
+                 server_capabilities=None, complete_urls=False, s3_storage=None):
         """
              'read_permissions' and 'write_permissions' is a list of:
                  [("opencv/2.3.4@lasote/testing", "user1, user2")]
 
              'users':  {username: plain-text-passwd}
+
+             's3_storage': {endpoint, bucket, access_key, secret_key, region} of a bucket
         """
         # Unique identifier for this server, will be used by TestRequester
         # to determine where to call. Why? remote_manager just assing an url
@@ -402,7 +407,8 @@ class TestServer(object):
                                               write_permissions, users,
                                               base_url=base_url,
                                               plugins=plugins,
-                                              server_capabilities=server_capabilities)
+                                              server_capabilities=server_capabilities,
+                                              s3_storage=s3_storage)
         self.app = TestApp(self.test_server.ra.root_app)
 
     @property
@@ -834,9 +840,11 @@ servers["r2"] = TestServer()
             sys.path = old_path
             os.chdir(current_dir)
             # Reset sys.modules to its prev state. A .copy() DOES NOT WORK
+            # The Conan modules imported by the command the first time they are used are kept
             added_modules = set(sys.modules).difference(old_modules)
             for added in added_modules:
-                sys.modules.pop(added, None)
+                if not added.startswith("conans."):
+                    sys.modules.pop(added, None)
 
         if (assert_error and not error) or (not assert_error and error):
             if assert_error:
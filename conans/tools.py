@@ -32,6 +32,7 @@ from conans.client.tools.version import Version
 # This global variables are intended to store the configuration of the running Conan application
 _global_output = None
 _global_requester = None
+_global_app = None  # The application of the Conan API call that defined them
 
 
 def set_global_instances(the_output, the_requester):
@@ -47,7 +48,31 @@ def set_global_instances(the_output, the_requester):
     return old_output, old_requester
 
 
+def _update_global_instances():
+    """ defines the output and requester of the application of the last Conan API call, when
+    the tools use them for the first time, so the commands that don't use the tools don't need
+    to initialize the requester
+    """
+    global _global_app
+    from conans.client.conan_api import get_current_app
+    app = get_current_app()
+    if app is not None and app is not _global_app:
+        _global_app = app
+        set_global_instances(app.out, app.requester)
+
+
+def _output():
+    _update_global_instances()
+    return _global_output
+
+
+def _requester():
+    _update_global_instances()
+    return _global_requester
+
+
 def get_global_instances():
+    _update_global_instances()
     return _global_output, _global_requester
 
 
@@ -73,11 +98,11 @@ ftp_download = tools_net.ftp_download
 
 
 def download(*args, **kwargs):
-    return tools_net.download(out=_global_output, requester=_global_requester, *args, **kwargs)
+    return tools_net.download(out=_output(), requester=_requester(), *args, **kwargs)
 
 
 def get(*args, **kwargs):
-    return tools_net.get(output=_global_output, requester=_global_requester, *args, **kwargs)
+    return tools_net.get(output=_output(), requester=_requester(), *args, **kwargs)
 
 
 # from conans.client.tools.files
@@ -97,15 +122,15 @@ dos2unix = tools_files.dos2unix
 
 
 def unzip(*args, **kwargs):
-    return tools_files.unzip(output=_global_output, *args, **kwargs)
+    return tools_files.unzip(output=_output(), *args, **kwargs)
 
 
 def replace_in_file(*args, **kwargs):
-    return tools_files.replace_in_file(output=_global_output, *args, **kwargs)
+    return tools_files.replace_in_file(output=_output(), *args, **kwargs)
 
 
 def replace_path_in_file(*args, **kwargs):
-    return tools_files.replace_path_in_file(output=_global_output, *args, **kwargs)
+    return tools_files.replace_path_in_file(output=_output(), *args, **kwargs)
 
 
 # from conans.client.tools.oss
@@ -119,58 +144,58 @@ get_gnu_triplet = tools_oss.get_gnu_triplet
 
 
 def cpu_count(*args, **kwargs):
-    return tools_oss.cpu_count(output=_global_output, *args, **kwargs)
+    return tools_oss.cpu_count(output=_output(), *args, **kwargs)
 
 
 # from conans.client.tools.system_pm
 class SystemPackageTool(tools_system_pm.SystemPackageTool):
     def __init__(self, *args, **kwargs):
-        super(SystemPackageTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(SystemPackageTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class NullTool(tools_system_pm.NullTool):
     def __init__(self, *args, **kwargs):
-        super(NullTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(NullTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class AptTool(tools_system_pm.AptTool):
     def __init__(self, *args, **kwargs):
-        super(AptTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(AptTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class YumTool(tools_system_pm.YumTool):
     def __init__(self, *args, **kwargs):
-        super(YumTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(YumTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class BrewTool(tools_system_pm.BrewTool):
     def __init__(self, *args, **kwargs):
-        super(BrewTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(BrewTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class PkgTool(tools_system_pm.PkgTool):
     def __init__(self, *args, **kwargs):
-        super(PkgTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(PkgTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class ChocolateyTool(tools_system_pm.ChocolateyTool):
     def __init__(self, *args, **kwargs):
-        super(ChocolateyTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(ChocolateyTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class PkgUtilTool(tools_system_pm.PkgUtilTool):
     def __init__(self, *args, **kwargs):
-        super(PkgUtilTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(PkgUtilTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class PacManTool(tools_system_pm.PacManTool):
     def __init__(self, *args, **kwargs):
-        super(PacManTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(PacManTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 class ZypperTool(tools_system_pm.ZypperTool):
     def __init__(self, *args, **kwargs):
-        super(ZypperTool, self).__init__(output=_global_output, *args, **kwargs)
+        super(ZypperTool, self).__init__(output=_output(), *args, **kwargs)
 
 
 # from conans.client.tools.win
@@ -191,28 +216,28 @@ run_in_windows_bash = tools_win.run_in_windows_bash
 
 @contextmanager
 def vcvars(*args, **kwargs):
-    with tools_win.vcvars(output=_global_output, *args, **kwargs):
+    with tools_win.vcvars(output=_output(), *args, **kwargs):
         yield
 
 
 def msvc_build_command(*args, **kwargs):
-    return tools_win.msvc_build_command(output=_global_output, *args, **kwargs)
+    return tools_win.msvc_build_command(output=_output(), *args, **kwargs)
 
 
 def build_sln_command(*args, **kwargs):
-    return tools_win.build_sln_command(output=_global_output, *args, **kwargs)
+    return tools_win.build_sln_command(output=_output(), *args, **kwargs)
 
 
 def vcvars_command(*args, **kwargs):
-    return tools_win.vcvars_command(output=_global_output, *args, **kwargs)
+    return tools_win.vcvars_command(output=_output(), *args, **kwargs)
 
 
 def vcvars_dict(*args, **kwargs):
-    return tools_win.vcvars_dict(output=_global_output, *args, **kwargs)
+    return tools_win.vcvars_dict(output=_output(), *args, **kwargs)
 
 
 def latest_vs_version_installed(*args, **kwargs):
-    return tools_win.latest_vs_version_installed(output=_global_output, *args, **kwargs)
+    return tools_win.latest_vs_version_installed(output=_output(), *args, **kwargs)
 
 
 # Ready to use objects.
@@ -220,4 +245,4 @@ try:
     os_info = OSInfo()
 except Exception as exc:
     logger.error(exc)
-    _global_output.error("Error detecting os_info")
+    _output().error("Error detecting os_info")
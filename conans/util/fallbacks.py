@@ -8,8 +8,8 @@ def default_output(output, fn_name=None):
         fn_str = " to function '{}'".format(fn_name) if fn_name else ''
         warnings.warn("Provide the output argument explicitly{}".format(fn_str))
 
-        from conans.tools import _global_output
-        return _global_output
+        from conans.tools import get_global_instances
+        return get_global_instances()[0]
 
     return output
 
@@ -19,7 +19,7 @@ def default_requester(requester, fn_name=None):
         fn_str = " to function '{}'".format(fn_name) if fn_name else ''
         warnings.warn("Provide the requester argument explicitly{}".format(fn_str))
 
-        from conans.tools import _global_requester
-        return _global_requester
+        from conans.tools import get_global_instances
+        return get_global_instances()[1]
 
     return requester
@@ -15,6 +15,7 @@ from contextlib import contextmanager
 
 import six
 
+from conans.util.env_reader import get_env
 from conans.util.log import logger
 
 
@@ -260,6 +261,112 @@ def mkdir(path):
     os.makedirs(path)
 
 
+COPY_STRATEGIES = ("copy", "reflink", "hardlink")
+_FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+
+
+def _copy_strategy():
+    strategy = get_env("CONAN_COPY_STRATEGY", "copy")
+    if strategy not in COPY_STRATEGIES:
+        from conans.errors import ConanException
+        raise ConanException("Invalid copy strategy '%s', use one of: %s"
+                             % (strategy, ", ".join(COPY_STRATEGIES)))
+    return strategy
+
+
+def _reflink(src, dst):
+    """ clones the data of the file without copying it, sharing the blocks until one of them
+    is modified (copy-on-write). Returns False if the platform or the filesystem (btrfs, xfs,
+    apfs...) do not support it
+    """
+    system = platform.system()
+    if system == "Linux":
+        import fcntl
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            try:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            except (IOError, OSError):
+                return False
+        shutil.copystat(src, dst)
+        return True
+    if system == "Darwin":
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        encoding = sys.getfilesystemencoding()
+        src = src.encode(encoding) if isinstance(src, six.text_type) else src
+        dst = dst.encode(encoding) if isinstance(dst, six.text_type) else dst
+        return libc.clonefile(src, dst, 0) == 0  # clonefile() also keeps the metadata
+    return False
+
+
+def copy_file(src, dst):
+    """ shutil.copy2() with the copy strategy of the CONAN_COPY_STRATEGY variable:
+      - copy: a regular copy of the file
+      - reflink: a copy-on-write clone of the file, or a regular copy if not supported
+      - hardlink: a hard link to the same file, or a regular copy if not possible. Only for
+        the files that are never modified in place, as the changes would modify both
+    An existing hard link in the destination is replaced, never written through
+    """
+    strategy = _copy_strategy()
+    try:
+        if strategy != "copy" or os.stat(dst).st_nlink > 1:
+            os.remove(dst)
+    except OSError:
+        pass
+    if strategy == "reflink":
+        if _reflink(src, dst):
+            return
+    elif strategy == "hardlink":
+        try:
+            os.link(src, dst)
+            return
+        except (AttributeError, OSError):  # Not in py2 Windows, different devices...
+            pass
+    shutil.copy2(src, dst)
+
+
+def unlink_hardlink(path):
+    """ replaces a hard link with a regular copy of the file, that can be modified without
+    modifying the other links
+    """
+    tmp_path = path + ".conan_tmp"
+    shutil.copy2(path, tmp_path)
+    os.remove(path)
+    os.rename(tmp_path, path)
+
+
+def copytree(src, dst):
+    """ shutil.copytree(src, dst, symlinks=True) copying the files with copy_file()
+    """
+    if _copy_strategy() == "copy":
+        shutil.copytree(src, dst, symlinks=True)
+        return
+
+    os.makedirs(dst)
+    errors = []
+    for name in os.listdir(src):
+        src_name = os.path.join(src, name)
+        dst_name = os.path.join(dst, name)
+        try:
+            if os.path.islink(src_name):
+                os.symlink(os.readlink(src_name), dst_name)
+            elif os.path.isdir(src_name):
+                copytree(src_name, dst_name)
+            else:
+                copy_file(src_name, dst_name)
+        except shutil.Error as err:
+            errors.extend(err.args[0])
+        except EnvironmentError as why:
+            errors.append((src_name, dst_name, str(why)))
+    try:
+        shutil.copystat(src, dst)
+    except OSError as why:
+        errors.append((src, dst, str(why)))
+    if errors:
+        raise shutil.Error(errors)
+
+
 def path_exists(path, basedir):
     """Case sensitive, for windows, optional
     basedir for skip caps check for tmp folders in testing for example (returned always
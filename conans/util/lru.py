@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """ Thread safe dict with a maximum number of entries, discarding the least recently used
+    ones. Entries also expire after ttl seconds (never if None)
+    """
+
+    def __init__(self, max_size, ttl=None):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()  # key: (expiration_time, value)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            expiration, value = entry
+            if expiration is not None and expiration < time.time():
+                return default
+            self._data[key] = entry  # Now it is the most recently used
+            return value
+
+    def put(self, key, value):
+        expiration = time.time() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expiration, value)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_if(self, predicate):
+        """ Removes the entries whose key matches the predicate """
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
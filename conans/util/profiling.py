@@ -0,0 +1,91 @@
+""" Instrumentation of the phases of the commands, to know where they spend their time. The spans
+are recorded only while a profile_trace() is active, and written in the Chrome trace-event format
+that can be opened with chrome://tracing or https://ui.perfetto.dev
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from conans.util.files import save
+
+_events = None  # [trace event dict] while recording, None when disabled
+
+
+@contextmanager
+def profile_trace(path):
+    """ records the spans of the enclosed code and writes them to the "path" json file.
+    Does nothing without a path
+    """
+    global _events
+    if not path or _events is not None:  # Nested traces are part of the outer one
+        yield
+        return
+    _events = []
+    try:
+        with profile_span("conan", "command"):
+            yield
+    finally:
+        events, _events = _events, None
+        save(os.path.abspath(path), json.dumps({"traceEvents": events,
+                                                "displayTimeUnit": "ms"}))
+
+
+class _Span(object):
+    def __init__(self, name, category, args):
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        start, end = int(self._start * 1e6), int(time.time() * 1e6)  # microseconds
+        event = {"name": self._name, "cat": self._category, "ph": "X",
+                 "ts": start, "dur": end - start,
+                 "pid": os.getpid(), "tid": threading.current_thread().ident}
+        if self._args:
+            event["args"] = {k: str(v) for k, v in self._args.items()}
+        events = _events
+        if events is not None:  # The trace could have finished in other thread
+            events.append(event)
+
+
+class _NoSpan(object):
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def profile_span(name, category, **args):
+    """ a "complete" event of the trace, to be used as a context manager. They are nested by
+    the viewers with their times. The args are shown in the viewers, converted to strings
+    """
+    if _events is None:
+        return _NO_SPAN
+    return _Span(name, category, args)
+
+
+def profiled(category, name=None):
+    """ decorator to record every call of the function as a span, named as the function
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _events is None:
+                return func(*args, **kwargs)
+            with profile_span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,8 +1,7 @@
 # coding=utf-8
 
-from jinja2 import Template
-
 
 def render_layout_file(content, ref=None, settings=None, options=None):
+    from jinja2 import Template
     t = Template(content)
     return t.render(reference=ref, settings=settings, options=options)
@@ -1,7 +1,10 @@
+import atexit
 import copy
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from os.path import isdir
 
 import fasteners
@@ -25,19 +28,25 @@ TRACER_ACTIONS = ["UPLOADED_RECIPE", "UPLOADED_PACKAGE",
 
 MASKED_FIELD = "**********"
 
+_FLUSH_INTERVAL = 1  # seconds between the writes of the pending traces
+_FLUSH_SIZE = 500  # number of pending traces that are written without waiting the interval
+
 
 def _validate_action(action_name):
     if action_name not in TRACER_ACTIONS:
         raise ConanException("Unknown action %s" % action_name)
 
 
+_valid_tracer_files = set()
+
+
 def _get_tracer_file():
     """
     If CONAN_TRACE_FILE is a file in an existing dir will log to it creating the file if needed
     Otherwise won't log anything
     """
     trace_path = os.environ.get("CONAN_TRACE_FILE", None)
-    if trace_path is not None:
+    if trace_path is not None and trace_path not in _valid_tracer_files:
         if not os.path.isabs(trace_path):
             raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
                                  "path has to be an absolute path to a file.")
@@ -46,16 +55,70 @@ def _get_tracer_file():
                                  "path doesn't exist: '%s'" % os.path.dirname(trace_path))
         if isdir(trace_path):
             raise ConanException("CONAN_TRACE_FILE is a directory. Please, specify a file path")
+        _valid_tracer_files.add(trace_path)
     return trace_path
 
 
+class _TraceWriter(object):
+    """ Keeps the traces in memory and appends them to their files in batches, from a background
+    thread and when flushed. Every batch is written while holding the inter-process lock of the
+    file, so the traces of concurrent processes are never mixed
+    """
+
+    def __init__(self):
+        self._pending = []  # [(trace file path, json line)]
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # The batches are written in order
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def append(self, filepath, line):
+        with self._pending_lock:
+            self._pending.append((filepath, line))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ConanTraceWriter")
+                self._thread.daemon = True
+                self._thread.start()
+                atexit.register(self.flush)
+            wakeup = len(self._pending) >= _FLUSH_SIZE
+        if wakeup:
+            self._wakeup.set()
+
+    def flush(self):
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            batches = OrderedDict()
+            for filepath, line in pending:
+                batches.setdefault(filepath, []).append(line)
+            for filepath, lines in batches.items():
+                with fasteners.InterProcessLock(filepath + ".lock", logger=logger):
+                    with open(filepath, "a") as logfile:
+                        logfile.write("".join(lines))
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error("Error writing CONAN_TRACE_FILE: %s" % str(exc))
+
+
+_trace_writer = _TraceWriter()
+
+
 def _append_to_log(obj):
-    """Add a new line to the log file locking the file to protect concurrent access"""
-    if _get_tracer_file():
-        filepath = _get_tracer_file()
-        with fasteners.InterProcessLock(filepath + ".lock", logger=logger):
-            with open(filepath, "a") as logfile:
-                logfile.write(json.dumps(obj, sort_keys=True) + "\n")
+    """Add a new line to the log file, written later together with other ones"""
+    filepath = _get_tracer_file()
+    if filepath:
+        _trace_writer.append(filepath, json.dumps(obj, sort_keys=True) + "\n")
+
+
+def flush_traces():
+    """Write all the pending traces to their files, the commands call it when they finish"""
+    _trace_writer.flush()
 
 
 def _append_action(action_name, props):
@@ -0,0 +1,10 @@
+import yaml
+
+# The loader of libyaml, when PyYAML was built with it, is several times faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(text):
+    """ same result than yaml.safe_load()
+    """
+    return yaml.load(text, Loader=_SafeLoader)